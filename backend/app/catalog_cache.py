@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from threading import Lock
+
+DEFAULT_CATALOG_CACHE_SIZE = 256
+DEFAULT_CATALOG_CACHE_TTL_SECONDS = 5.0
+
+
+def get_catalog_cache_size() -> int:
+    raw_size = os.getenv("APP_CATALOG_CACHE_SIZE", "").strip()
+    try:
+        return max(0, int(raw_size)) if raw_size else DEFAULT_CATALOG_CACHE_SIZE
+    except ValueError:
+        return DEFAULT_CATALOG_CACHE_SIZE
+
+
+def get_catalog_cache_ttl_seconds() -> float:
+    raw_ttl = os.getenv("APP_CATALOG_CACHE_TTL_SECONDS", "").strip()
+    try:
+        return max(0.0, float(raw_ttl)) if raw_ttl else DEFAULT_CATALOG_CACHE_TTL_SECONDS
+    except ValueError:
+        return DEFAULT_CATALOG_CACHE_TTL_SECONDS
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    body: bytes
+    etag: str
+    # Listings embed each event's lifecycle, so they go stale once the next event ends.
+    expires_at: datetime | None = None
+
+    @classmethod
+    def build(cls, body: bytes, expires_at: datetime | None = None) -> CatalogEntry:
+        # Strong validator: identical bytes, identical tag.
+        return cls(body=body, etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"', expires_at=expires_at)
+
+
+class CatalogCache:
+    """Bounded LRU of rendered event listings, dropped wholesale on every catalog write.
+
+    Readers note the generation before querying the store and hand it back to put(); a write that
+    lands in between bumps the generation, so the stale listing is served once but never cached.
+    Only writes in this process invalidate; the TTL bounds how long a write made by another worker
+    (or another process sharing the SQLite file) can go unnoticed.
+    """
+
+    def __init__(self, max_entries: int | None = None, ttl_seconds: float | None = None) -> None:
+        self.max_entries = get_catalog_cache_size() if max_entries is None else max_entries
+        self.ttl_seconds = get_catalog_cache_ttl_seconds() if ttl_seconds is None else ttl_seconds
+        self._lock = Lock()
+        self._entries: OrderedDict[Hashable, CatalogEntry] = OrderedDict()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._expirations = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: Hashable, now: datetime) -> CatalogEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at is not None and now > entry.expires_at:
+                del self._entries[key]
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def put(
+        self,
+        key: Hashable,
+        body: bytes,
+        expires_at: datetime | None,
+        generation: int,
+        now: datetime,
+    ) -> CatalogEntry:
+        ttl_expiry = now + timedelta(seconds=self.ttl_seconds)
+        entry = CatalogEntry.build(body, ttl_expiry if expires_at is None else min(expires_at, ttl_expiry))
+        with self._lock:
+            if generation != self._generation or self.max_entries <= 0 or self.ttl_seconds <= 0:
+                return entry
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return entry
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._invalidations += 1
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                "expirations": self._expirations,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
@@ -1,13 +1,64 @@
 from __future__ import annotations
 
+import logging
 import os
 import sqlite3
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from contextlib import closing, contextmanager
+from datetime import date
 from pathlib import Path
+from queue import Empty, LifoQueue, Queue
+from threading import Lock, Thread
+from typing import TypeVar
+
+from .event_time import event_bounds
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
 
 
 BACKEND_DIR = Path(__file__).resolve().parents[1]
 SCHEMA_PATH = BACKEND_DIR / "schema.sql"
 DEFAULT_DB_PATH = BACKEND_DIR / "unimex.db"
+DEFAULT_POOL_SIZE = 8
+DEFAULT_POOL_TIMEOUT_SECONDS = 10.0
+# Idle connections older than this are pinged before being handed out again.
+POOL_HEALTH_CHECK_INTERVAL_SECONDS = 30.0
+DEFAULT_WRITE_BATCH_SIZE = 32
+DEFAULT_WRITE_BATCH_DELAY_MS = 2.0
+
+
+DEFAULT_SQLITE_PROFILE = "throughput"
+# Named PRAGMA sets; journal_mode is persisted in the file, the rest apply per connection.
+SQLITE_PROFILES: dict[str, dict[str, str | int]] = {
+    "throughput": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "cache_size": -16000,
+        "mmap_size": 128 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+    "durable": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "busy_timeout": 5000,
+        "cache_size": -2000,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+    },
+}
+
+
+class PoolTimeoutError(RuntimeError):
+    pass
+
+
+class WriteBatcherClosedError(RuntimeError):
+    pass
 
 
 def _looks_like_posix_absolute(path_str: str) -> bool:
@@ -347,7 +398,10 @@ def _migrate_event_reviews_name_columns(connection: sqlite3.Connection) -> None:
 def _drop_all_tables(connection: sqlite3.Connection) -> None:
     connection.executescript(
         """
+        DROP TABLE IF EXISTS event_registration_stats;
+        DROP TABLE IF EXISTS event_review_stats;
         DROP TABLE IF EXISTS event_reviews;
+        DROP TABLE IF EXISTS event_waitlist;
         DROP TABLE IF EXISTS event_registrations;
         DROP TABLE IF EXISTS event_requirements;
         DROP TABLE IF EXISTS event_agenda_items;
@@ -380,18 +434,559 @@ def _ensure_event_reviews_table(connection: sqlite3.Connection) -> None:
     )
 
 
-def get_connection(db_path: Path | None = None) -> sqlite3.Connection:
-    target_path = db_path or get_db_path()
+def _ensure_event_waitlist_table(connection: sqlite3.Connection) -> None:
+    connection.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS event_waitlist (
+            id TEXT PRIMARY KEY,
+            event_id TEXT NOT NULL REFERENCES events(id) ON DELETE CASCADE,
+            first_name TEXT NOT NULL,
+            last_name TEXT NOT NULL,
+            student_id TEXT NOT NULL,
+            career TEXT NOT NULL,
+            semester INTEGER NOT NULL CHECK (semester BETWEEN 1 AND 12),
+            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE (event_id, student_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_event_waitlist_event_created ON event_waitlist(event_id, created_at, id);
+        CREATE INDEX IF NOT EXISTS idx_event_waitlist_student_id ON event_waitlist(student_id);
+        """
+    )
+
+
+def get_sqlite_profile_name() -> str:
+    configured = os.getenv("APP_SQLITE_PROFILE", DEFAULT_SQLITE_PROFILE).strip().casefold()
+    return configured if configured in SQLITE_PROFILES else DEFAULT_SQLITE_PROFILE
+
+
+def get_sqlite_profile(profile_name: str | None = None) -> dict[str, str | int]:
+    return SQLITE_PROFILES[profile_name or get_sqlite_profile_name()]
+
+
+def _apply_connection_pragmas(connection: sqlite3.Connection, profile: dict[str, str | int]) -> None:
+    for pragma in ("busy_timeout", "synchronous", "cache_size", "mmap_size", "temp_store"):
+        connection.execute(f"PRAGMA {pragma} = {profile[pragma]};")
+
+
+# Which row survives when legacy ids differ only in case within one (event_id, student_id) pair.
+_STUDENT_ID_MERGE_ORDER = {
+    "event_registrations": "status = 'registered' DESC, created_at DESC, id DESC",
+    "event_reviews": "updated_at DESC, created_at DESC, id DESC",
+}
+
+
+def _merge_case_duplicates(connection: sqlite3.Connection, table_name: str, order_by: str) -> None:
+    # Legacy rows whose ids differ only in case would collide on UNIQUE (event_id, student_id) once
+    # upper-cased: keep one per pair (the active/newest) and delete the rest. The stats triggers follow
+    # the deletes; a dropped registration that still held a seat gives it back to the event.
+    duplicates = connection.execute(
+        f"""
+        SELECT id, event_id, student_id{", status" if table_name == "event_registrations" else ""}
+        FROM (
+            SELECT *, ROW_NUMBER() OVER (
+                PARTITION BY event_id, UPPER(TRIM(student_id)) ORDER BY {order_by}
+            ) AS pair_rank
+            FROM {table_name}
+        )
+        WHERE pair_rank > 1
+        """
+    ).fetchall()
+    for row in duplicates:
+        connection.execute(f"DELETE FROM {table_name} WHERE id = ?", (row[0],))
+        if table_name == "event_registrations" and row[3] == "registered":
+            connection.execute("UPDATE events SET spots = spots + 1 WHERE id = ?", (row[1],))
+    if duplicates:
+        logger.warning(
+            "Merged %d %s rows whose student_id only differed in case: %s",
+            len(duplicates),
+            table_name,
+            ", ".join(f"{row[0]} ({row[1]}, {row[2]!r})" for row in duplicates),
+        )
+
+
+def _normalize_student_ids(connection: sqlite3.Connection) -> None:
+    # Lookups compare against upper-cased ids so they can use BINARY indexes instead of LOWER() scans.
+    for table_name, order_by in _STUDENT_ID_MERGE_ORDER.items():
+        _merge_case_duplicates(connection, table_name, order_by)
+    for table_name in ("users", "event_registrations", "event_reviews"):
+        connection.execute(
+            f"""
+            UPDATE OR IGNORE {table_name}
+            SET student_id = UPPER(TRIM(student_id))
+            WHERE student_id <> UPPER(TRIM(student_id))
+            """
+        )
+    # Two accounts sharing a student id up to case cannot be merged automatically (separate logins),
+    # so OR IGNORE leaves them as they are and they are reported for manual review.
+    skipped_users = connection.execute(
+        "SELECT id, student_id FROM users WHERE student_id <> UPPER(TRIM(student_id))"
+    ).fetchall()
+    if skipped_users:
+        logger.warning(
+            "Left %d users with a student_id that collides with another account up to case: %s",
+            len(skipped_users),
+            ", ".join(f"{row[0]} ({row[1]!r})" for row in skipped_users),
+        )
+    connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_registrations_student_status ON event_registrations(student_id, status)"
+    )
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_event_reviews_student_id ON event_reviews(student_id)")
+
+
+def _ensure_pagination_indexes(connection: sqlite3.Connection) -> None:
+    # Keyset pagination walks these (filter, sort key..., id) indexes instead of sorting full tables.
+    connection.executescript(
+        """
+        CREATE INDEX IF NOT EXISTS idx_events_date_time_id ON events(event_date, event_time, id);
+        CREATE INDEX IF NOT EXISTS idx_registrations_event_created
+            ON event_registrations(event_id, created_at, id);
+        CREATE INDEX IF NOT EXISTS idx_event_reviews_event_updated
+            ON event_reviews(event_id, updated_at, created_at, id);
+        """
+    )
+
+
+def _ensure_event_schedule_indexes(connection: sqlite3.Connection) -> None:
+    # The month filter matches any year, so it needs an expression index rather than a date range.
+    # Kept out of schema.sql because the expression is SQLite-specific.
+    connection.executescript(
+        """
+        CREATE INDEX IF NOT EXISTS idx_events_ends_at ON events(ends_at);
+        CREATE INDEX IF NOT EXISTS idx_events_month
+            ON events(CAST(strftime('%m', event_date) AS INTEGER), event_date, event_time, id);
+        """
+    )
+
+
+def _add_event_schedule_columns(connection: sqlite3.Connection) -> None:
+    # Lifecycle filters compare against starts_at/ends_at instead of re-parsing event_time per request.
+    for column_name in ("starts_at", "ends_at"):
+        if not _table_has_column(connection, "events", column_name):
+            connection.execute(f"ALTER TABLE events ADD COLUMN {column_name} TIMESTAMP")
+
+    rows = connection.execute(
+        "SELECT id, event_date, event_time FROM events WHERE starts_at IS NULL OR ends_at IS NULL"
+    ).fetchall()
+    for row in rows:
+        starts_at, ends_at = event_bounds(date.fromisoformat(str(row["event_date"])), row["event_time"])
+        connection.execute(
+            "UPDATE events SET starts_at = ?, ends_at = ? WHERE id = ?",
+            (
+                starts_at.isoformat(sep=" ", timespec="seconds"),
+                ends_at.isoformat(sep=" ", timespec="seconds"),
+                row["id"],
+            ),
+        )
+    _ensure_event_schedule_indexes(connection)
+
+
+def _has_triggers(connection: sqlite3.Connection, trigger_names: tuple[str, ...]) -> bool:
+    existing_triggers = {
+        row["name"]
+        for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'").fetchall()
+    }
+    return set(trigger_names) <= existing_triggers
+
+
+REGISTRATION_STATS_TRIGGERS = (
+    "trg_registration_stats_insert",
+    "trg_registration_stats_update",
+    "trg_registration_stats_delete",
+)
+
+
+def _ensure_registration_stats(connection: sqlite3.Connection) -> None:
+    # Admin dashboards read per-event counters from event_registration_stats instead of
+    # aggregating event_registrations; these triggers keep the counters in the same transaction.
+    # They are SQLite-specific, so they live here rather than in schema.sql.
+    needs_rebuild = not _has_triggers(connection, REGISTRATION_STATS_TRIGGERS)
+    connection.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS event_registration_stats (
+            event_id VARCHAR(32) PRIMARY KEY REFERENCES events(id) ON DELETE CASCADE,
+            registered_count INTEGER NOT NULL DEFAULT 0,
+            cancelled_count INTEGER NOT NULL DEFAULT 0,
+            last_registration_at TIMESTAMP
+        );
+
+        CREATE TRIGGER IF NOT EXISTS trg_registration_stats_insert
+        AFTER INSERT ON event_registrations
+        BEGIN
+            INSERT INTO event_registration_stats (
+                event_id, registered_count, cancelled_count, last_registration_at
+            )
+            VALUES (NEW.event_id, NEW.status = 'registered', NEW.status = 'cancelled', NEW.created_at)
+            ON CONFLICT(event_id) DO UPDATE SET
+                registered_count = registered_count + excluded.registered_count,
+                cancelled_count = cancelled_count + excluded.cancelled_count,
+                last_registration_at = CASE
+                    WHEN last_registration_at IS NULL OR excluded.last_registration_at > last_registration_at
+                    THEN excluded.last_registration_at
+                    ELSE last_registration_at
+                END;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_registration_stats_update
+        AFTER UPDATE OF event_id, status, created_at ON event_registrations
+        WHEN OLD.event_id IS NOT NEW.event_id
+            OR OLD.status IS NOT NEW.status
+            OR OLD.created_at IS NOT NEW.created_at
+        BEGIN
+            UPDATE event_registration_stats
+            SET registered_count = registered_count - (OLD.status = 'registered'),
+                cancelled_count = cancelled_count - (OLD.status = 'cancelled')
+            WHERE event_id = OLD.event_id;
+            INSERT INTO event_registration_stats (event_id, registered_count, cancelled_count)
+            VALUES (NEW.event_id, NEW.status = 'registered', NEW.status = 'cancelled')
+            ON CONFLICT(event_id) DO UPDATE SET
+                registered_count = registered_count + excluded.registered_count,
+                cancelled_count = cancelled_count + excluded.cancelled_count;
+            -- idx_registrations_event_created turns these MAX() lookups into single index probes.
+            UPDATE event_registration_stats
+            SET last_registration_at = (
+                SELECT MAX(created_at) FROM event_registrations WHERE event_id = event_registration_stats.event_id
+            )
+            WHERE event_id IN (OLD.event_id, NEW.event_id);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_registration_stats_delete
+        AFTER DELETE ON event_registrations
+        BEGIN
+            UPDATE event_registration_stats
+            SET registered_count = registered_count - (OLD.status = 'registered'),
+                cancelled_count = cancelled_count - (OLD.status = 'cancelled'),
+                last_registration_at = (
+                    SELECT MAX(created_at) FROM event_registrations WHERE event_id = OLD.event_id
+                )
+            WHERE event_id = OLD.event_id;
+        END;
+        """
+    )
+    if needs_rebuild:
+        # Counters may be missing or stale if registrations were written without the triggers.
+        connection.execute("DELETE FROM event_registration_stats")
+        connection.execute(
+            """
+            INSERT INTO event_registration_stats (
+                event_id, registered_count, cancelled_count, last_registration_at
+            )
+            SELECT
+                event_id,
+                SUM(status = 'registered'),
+                SUM(status = 'cancelled'),
+                MAX(created_at)
+            FROM event_registrations
+            GROUP BY event_id
+            """
+        )
+
+
+REVIEW_STATS_TRIGGERS = (
+    "trg_review_stats_insert",
+    "trg_review_stats_update",
+    "trg_review_stats_delete",
+)
+
+
+def _review_stats_delta_sql(row: str, sign: str) -> str:
+    # Column assignments that add (sign="+") or remove (sign="-") one review row from the aggregates.
+    assignments = [f"review_count = review_count {sign} 1", f"rating_sum = rating_sum {sign} {row}.rating"]
+    assignments += [f"rating_{rating} = rating_{rating} {sign} ({row}.rating = {rating})" for rating in range(1, 6)]
+    return ",\n                ".join(assignments)
+
+
+def _ensure_review_stats(connection: sqlite3.Connection) -> None:
+    # Per-event rating count, sum and 1-5 histogram, so catalog cards and the review summary
+    # endpoint never aggregate event_reviews at request time.
+    needs_rebuild = not _has_triggers(connection, REVIEW_STATS_TRIGGERS)
+    insert_new = f"""
+            INSERT INTO event_review_stats (event_id)
+            VALUES (NEW.event_id)
+            ON CONFLICT(event_id) DO NOTHING;
+            UPDATE event_review_stats
+            SET {_review_stats_delta_sql("NEW", "+")}
+            WHERE event_id = NEW.event_id;
+    """
+    remove_old = f"""
+            UPDATE event_review_stats
+            SET {_review_stats_delta_sql("OLD", "-")}
+            WHERE event_id = OLD.event_id;
+    """
+    connection.executescript(
+        f"""
+        CREATE TABLE IF NOT EXISTS event_review_stats (
+            event_id VARCHAR(32) PRIMARY KEY REFERENCES events(id) ON DELETE CASCADE,
+            review_count INTEGER NOT NULL DEFAULT 0,
+            rating_sum INTEGER NOT NULL DEFAULT 0,
+            rating_1 INTEGER NOT NULL DEFAULT 0,
+            rating_2 INTEGER NOT NULL DEFAULT 0,
+            rating_3 INTEGER NOT NULL DEFAULT 0,
+            rating_4 INTEGER NOT NULL DEFAULT 0,
+            rating_5 INTEGER NOT NULL DEFAULT 0
+        );
+
+        CREATE TRIGGER IF NOT EXISTS trg_review_stats_insert
+        AFTER INSERT ON event_reviews
+        BEGIN
+            {insert_new}
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_review_stats_update
+        AFTER UPDATE OF event_id, rating ON event_reviews
+        WHEN OLD.event_id IS NOT NEW.event_id OR OLD.rating IS NOT NEW.rating
+        BEGIN
+            {remove_old}
+            {insert_new}
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_review_stats_delete
+        AFTER DELETE ON event_reviews
+        BEGIN
+            {remove_old}
+        END;
+        """
+    )
+    if needs_rebuild:
+        connection.execute("DELETE FROM event_review_stats")
+        connection.execute(
+            """
+            INSERT INTO event_review_stats (
+                event_id, review_count, rating_sum, rating_1, rating_2, rating_3, rating_4, rating_5
+            )
+            SELECT
+                event_id,
+                COUNT(*),
+                SUM(rating),
+                SUM(rating = 1),
+                SUM(rating = 2),
+                SUM(rating = 3),
+                SUM(rating = 4),
+                SUM(rating = 5)
+            FROM event_reviews
+            GROUP BY event_id
+            """
+        )
+
+
+def _open_connection(
+    target_path: Path,
+    check_same_thread: bool = True,
+    profile_name: str | None = None,
+) -> sqlite3.Connection:
     target_path.parent.mkdir(parents=True, exist_ok=True)
-    connection = sqlite3.connect(target_path)
+    connection = sqlite3.connect(target_path, check_same_thread=check_same_thread)
     connection.row_factory = sqlite3.Row
     connection.execute("PRAGMA foreign_keys = ON;")
+    _apply_connection_pragmas(connection, get_sqlite_profile(profile_name))
     return connection
 
 
-def initialize_database(db_path: Path | None = None) -> Path:
+def get_connection(db_path: Path | None = None, profile_name: str | None = None) -> sqlite3.Connection:
+    return _open_connection(db_path or get_db_path(), profile_name=profile_name)
+
+
+def describe_connection_profile(connection: sqlite3.Connection) -> dict[str, str | int]:
+    # Read the effective values back so health checks show what SQLite actually applied.
+    return {
+        pragma: connection.execute(f"PRAGMA {pragma};").fetchone()[0]
+        for pragma in ("journal_mode", "synchronous", "busy_timeout", "cache_size", "mmap_size", "temp_store")
+    }
+
+
+def get_pool_size() -> int:
+    raw_size = os.getenv("APP_DB_POOL_SIZE", "").strip()
+    try:
+        return max(1, int(raw_size)) if raw_size else DEFAULT_POOL_SIZE
+    except ValueError:
+        return DEFAULT_POOL_SIZE
+
+
+def get_pool_timeout() -> float:
+    raw_timeout = os.getenv("APP_DB_POOL_TIMEOUT_SECONDS", "").strip()
+    try:
+        return max(0.0, float(raw_timeout)) if raw_timeout else DEFAULT_POOL_TIMEOUT_SECONDS
+    except ValueError:
+        return DEFAULT_POOL_TIMEOUT_SECONDS
+
+
+def write_batching_enabled() -> bool:
+    return os.getenv("APP_SQLITE_WRITE_BATCHING", "").strip().casefold() in {"1", "true", "yes", "on"}
+
+
+def get_write_batch_size() -> int:
+    raw_size = os.getenv("APP_SQLITE_WRITE_BATCH_SIZE", "").strip()
+    try:
+        return max(1, int(raw_size)) if raw_size else DEFAULT_WRITE_BATCH_SIZE
+    except ValueError:
+        return DEFAULT_WRITE_BATCH_SIZE
+
+
+def get_write_batch_delay_ms() -> float:
+    raw_delay = os.getenv("APP_SQLITE_WRITE_BATCH_DELAY_MS", "").strip()
+    try:
+        return max(0.0, float(raw_delay)) if raw_delay else DEFAULT_WRITE_BATCH_DELAY_MS
+    except ValueError:
+        return DEFAULT_WRITE_BATCH_DELAY_MS
+
+
+class ConnectionPool:
+    """Bounded pool of long-lived SQLite connections shared across worker threads."""
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        max_size: int | None = None,
+        timeout: float | None = None,
+        profile_name: str | None = None,
+    ) -> None:
+        self.db_path = db_path or get_db_path()
+        self.profile_name = profile_name or get_sqlite_profile_name()
+        self.max_size = max_size or get_pool_size()
+        self.timeout = get_pool_timeout() if timeout is None else timeout
+        # LIFO keeps the hottest connections (and their page cache) in use.
+        self._idle: LifoQueue[tuple[sqlite3.Connection, float]] = LifoQueue()
+        self._lock = Lock()
+        self._closed = False
+        self._opened = 0
+        self._in_use = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._discarded = 0
+
+    def _open(self) -> sqlite3.Connection:
+        return _open_connection(self.db_path, check_same_thread=False, profile_name=self.profile_name)
+
+    @staticmethod
+    def _is_healthy(connection: sqlite3.Connection) -> bool:
+        try:
+            connection.execute("SELECT 1").fetchone()
+        except sqlite3.Error:
+            return False
+        return True
+
+    def _discard(self, connection: sqlite3.Connection) -> None:
+        try:
+            connection.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._opened -= 1
+            self._discarded += 1
+
+    def _wait_for_idle(self) -> tuple[sqlite3.Connection, float]:
+        started = time.perf_counter()
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except Empty as exc:
+            raise PoolTimeoutError(
+                f"Timed out after {self.timeout:.1f}s waiting for a database connection"
+            ) from exc
+        finally:
+            with self._lock:
+                self._waits += 1
+                self._wait_seconds += time.perf_counter() - started
+
+    def _checkout_idle(self) -> sqlite3.Connection:
+        try:
+            connection, idle_since = self._idle.get_nowait()
+        except Empty:
+            connection, idle_since = self._wait_for_idle()
+
+        if time.monotonic() - idle_since > POOL_HEALTH_CHECK_INTERVAL_SECONDS and not self._is_healthy(connection):
+            self._discard(connection)
+            with self._lock:
+                self._opened += 1
+            return self._open_reserved()
+        return connection
+
+    def _open_reserved(self) -> sqlite3.Connection:
+        # The caller already counted this connection in self._opened.
+        try:
+            return self._open()
+        except BaseException:
+            with self._lock:
+                self._opened -= 1
+            raise
+
+    def _acquire(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._closed:
+                raise PoolTimeoutError("Connection pool is closed")
+            self._checkouts += 1
+            can_open = self._idle.empty() and self._opened < self.max_size
+            if can_open:
+                self._opened += 1
+
+        connection = self._open_reserved() if can_open else self._checkout_idle()
+        with self._lock:
+            self._in_use += 1
+        return connection
+
+    def _release(self, connection: sqlite3.Connection) -> None:
+        with self._lock:
+            self._in_use -= 1
+            closed = self._closed
+
+        if closed:
+            self._discard(connection)
+            return
+
+        if connection.in_transaction:
+            # Never hand out a connection with a half-finished transaction.
+            try:
+                connection.rollback()
+            except sqlite3.Error:
+                self._discard(connection)
+                with self._lock:
+                    self._opened += 1
+                connection = self._open_reserved()
+        self._idle.put((connection, time.monotonic()))
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        connection = self._acquire()
+        try:
+            with connection:
+                yield connection
+        finally:
+            self._release(connection)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                connection, _ = self._idle.get_nowait()
+            except Empty:
+                break
+            self._discard(connection)
+
+    def stats(self) -> dict[str, int | float | bool]:
+        with self._lock:
+            return {
+                "max_size": self.max_size,
+                "open": self._opened,
+                "in_use": self._in_use,
+                "idle": self._idle.qsize(),
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "wait_seconds": round(self._wait_seconds, 6),
+                "discarded": self._discarded,
+                "closed": self._closed,
+            }
+
+
+def initialize_database(db_path: Path | None = None, profile_name: str | None = None) -> Path:
     target_path = db_path or get_db_path()
-    with get_connection(target_path) as connection:
+    with closing(get_connection(target_path, profile_name=profile_name)) as connection:
+        journal_mode = get_sqlite_profile(profile_name)["journal_mode"]
+        try:
+            connection.execute(f"PRAGMA journal_mode = {journal_mode};")
+        except sqlite3.OperationalError:
+            # Leaving WAL needs exclusive access; keep the current mode while other processes hold the file.
+            pass
+
         users_table_exists = connection.execute(
             "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users' LIMIT 1"
         ).fetchone()
@@ -422,14 +1017,179 @@ def initialize_database(db_path: Path | None = None) -> Path:
             raw_schema = SCHEMA_PATH.read_text(encoding="utf-8")
             sqlite_schema = _schema_for_sqlite(raw_schema)
             connection.executescript(sqlite_schema)
+            _ensure_event_schedule_indexes(connection)
+            _ensure_registration_stats(connection)
+            _ensure_review_stats(connection)
             connection.commit()
         else:
             # Backward-compatible migrations:
             # - legacy full_name -> first_name/last_name split
-            # - databases created before event reviews existed
+            # - databases created before event reviews or the waitlist existed
+            # - case-insensitive student ids stored in mixed case
+            # - events stored before starts_at/ends_at were precomputed
+            # - registration and review aggregates introduced after those rows already existed
             _migrate_users_name_columns(connection)
             _migrate_event_registrations_name_columns(connection)
             _migrate_event_reviews_name_columns(connection)
             _ensure_event_reviews_table(connection)
+            _ensure_event_waitlist_table(connection)
+            _normalize_student_ids(connection)
+            _ensure_pagination_indexes(connection)
+            _add_event_schedule_columns(connection)
+            _ensure_registration_stats(connection)
+            _ensure_review_stats(connection)
             connection.commit()
     return target_path
+
+
+class WriteBatcher:
+    """Single writer thread that group-commits queued write jobs.
+
+    Each job runs inside its own SAVEPOINT, so a constraint error only rolls back (and is raised to)
+    the caller that caused it while the rest of the batch shares one COMMIT/fsync.
+    """
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        max_batch_size: int | None = None,
+        max_delay_ms: float | None = None,
+        profile_name: str | None = None,
+    ) -> None:
+        self.db_path = db_path or get_db_path()
+        self.max_batch_size = max_batch_size or get_write_batch_size()
+        self.max_delay_seconds = (get_write_batch_delay_ms() if max_delay_ms is None else max_delay_ms) / 1000
+        self._connection = _open_connection(self.db_path, check_same_thread=False, profile_name=profile_name)
+        self._queue: Queue[tuple[Callable[[sqlite3.Connection], object], Future, float] | None] = Queue()
+        self._stats_lock = Lock()
+        self._closed = False
+        self._batches = 0
+        self._jobs = 0
+        self._failed_jobs = 0
+        self._largest_batch = 0
+        self._queue_wait_seconds = 0.0
+        self._commit_seconds = 0.0
+        self._thread = Thread(target=self._run, name="sqlite-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, job: Callable[[sqlite3.Connection], T]) -> T:
+        future: Future = Future()
+        with self._stats_lock:
+            if self._closed:
+                raise WriteBatcherClosedError("Write batcher is closed")
+            self._queue.put((job, future, time.perf_counter()))
+        return future.result()
+
+    def _collect(self, first) -> tuple[list, bool]:
+        batch = [first]
+        deadline = time.perf_counter() + self.max_delay_seconds
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        stopping = False
+        try:
+            while not stopping:
+                item = self._queue.get()
+                if item is None:
+                    break
+                batch, stopping = self._collect(item)
+                self._execute(batch)
+        except BaseException as exc:
+            self._abandon(exc)
+            raise
+        finally:
+            self._connection.close()
+
+    def _abandon(self, exc: BaseException) -> None:
+        # The writer thread is going away: refuse new jobs and fail the ones still queued.
+        with self._stats_lock:
+            self._closed = True
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except Empty:
+                return
+            if item is not None:
+                item[1].set_exception(exc)
+
+    def _execute(self, batch: list) -> None:
+        connection = self._connection
+        started = time.perf_counter()
+        outcomes: list[tuple[Future, object, BaseException | None]] = []
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            for job, future, _ in batch:
+                connection.execute("SAVEPOINT batch_job")
+                try:
+                    result = job(connection)
+                except Exception as exc:  # noqa: BLE001 - handed to the caller through its future
+                    connection.execute("ROLLBACK TO batch_job")
+                    connection.execute("RELEASE batch_job")
+                    outcomes.append((future, None, exc))
+                else:
+                    connection.execute("RELEASE batch_job")
+                    outcomes.append((future, result, None))
+            commit_started = time.perf_counter()
+            connection.commit()
+            commit_seconds = time.perf_counter() - commit_started
+        except BaseException as exc:
+            # BEGIN or COMMIT failed, or a job raised a non-Exception: nothing in this batch was persisted.
+            if connection.in_transaction:
+                connection.rollback()
+            for _, future, _ in batch:
+                future.set_exception(exc)
+            with self._stats_lock:
+                self._batches += 1
+                self._jobs += len(batch)
+                self._failed_jobs += len(batch)
+            if not isinstance(exc, Exception):
+                raise
+            return
+
+        with self._stats_lock:
+            self._batches += 1
+            self._jobs += len(batch)
+            self._failed_jobs += sum(1 for _, _, error in outcomes if error is not None)
+            self._largest_batch = max(self._largest_batch, len(batch))
+            self._queue_wait_seconds += sum(started - enqueued for _, _, enqueued in batch)
+            self._commit_seconds += commit_seconds
+
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def close(self) -> None:
+        with self._stats_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+
+    def stats(self) -> dict[str, int | float | bool]:
+        with self._stats_lock:
+            batches = self._batches
+            return {
+                "max_batch_size": self.max_batch_size,
+                "max_delay_ms": self.max_delay_seconds * 1000,
+                "batches": batches,
+                "jobs": self._jobs,
+                "failed_jobs": self._failed_jobs,
+                "largest_batch": self._largest_batch,
+                "avg_batch_size": round(self._jobs / batches, 3) if batches else 0.0,
+                "avg_queue_wait_ms": round(self._queue_wait_seconds * 1000 / self._jobs, 3) if self._jobs else 0.0,
+                "avg_commit_ms": round(self._commit_seconds * 1000 / batches, 3) if batches else 0.0,
+                "queued": self._queue.qsize(),
+                "closed": self._closed,
+            }
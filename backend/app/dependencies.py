@@ -5,7 +5,9 @@ import os
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from .catalog_cache import CatalogCache
 from .database import initialize_database
+from .memory_journal import MemoryJournal, get_memory_data_dir
 from .models import UserPublic
 from .repositories import InMemoryStore, SqliteStore
 from .seed_data import build_seed_events, build_seed_users
@@ -17,12 +19,15 @@ from .services import (
     EventService,
     RegistrationService,
 )
+from .user_cache import UserCache
 
 
 def _build_store():
     use_in_memory = os.getenv("APP_STORE_BACKEND", "sqlite").casefold() == "memory"
     if use_in_memory:
-        return InMemoryStore(users=build_seed_users(), events=build_seed_events())
+        data_dir = get_memory_data_dir()
+        journal = MemoryJournal(data_dir) if data_dir is not None else None
+        return InMemoryStore(users=build_seed_users(), events=build_seed_events(), journal=journal)
 
     initialize_database()
     sqlite_store = SqliteStore()
@@ -31,6 +36,8 @@ def _build_store():
 
 
 _store = _build_store()
+_catalog_cache = CatalogCache()
+_user_cache = UserCache()
 bearer_scheme = HTTPBearer(auto_error=False)
 
 
@@ -38,16 +45,28 @@ def get_store():
     return _store
 
 
-def get_auth_service(store=Depends(get_store)) -> AuthService:
-    return AuthService(store)
+def get_catalog_cache() -> CatalogCache:
+    return _catalog_cache
 
 
-def get_event_service(store=Depends(get_store)) -> EventService:
-    return EventService(store)
+def get_user_cache() -> UserCache:
+    return _user_cache
 
 
-def get_registration_service(store=Depends(get_store)) -> RegistrationService:
-    return RegistrationService(store)
+def close_store() -> None:
+    _store.close()
+
+
+def get_auth_service(store=Depends(get_store), user_cache=Depends(get_user_cache)) -> AuthService:
+    return AuthService(store, user_cache)
+
+
+def get_event_service(store=Depends(get_store), catalog_cache=Depends(get_catalog_cache)) -> EventService:
+    return EventService(store, catalog_cache)
+
+
+def get_registration_service(store=Depends(get_store), catalog_cache=Depends(get_catalog_cache)) -> RegistrationService:
+    return RegistrationService(store, catalog_cache)
 
 
 def get_admin_service(store=Depends(get_store)) -> AdminService:
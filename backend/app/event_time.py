@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import re
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import NamedTuple
+
+# Hours, minutes and an optional a.m./p.m. marker; the groups make a second pass over each token unnecessary.
+TIME_TOKEN_REGEX = re.compile(r"(\d{1,2}):(\d{2})\s*(?:([ap])\.?m\.?)?", re.IGNORECASE)
+WHITESPACE_REGEX = re.compile(r"\s+")
+PARSE_CACHE_SIZE = 1024
+
+
+class EventTime(NamedTuple):
+    """Everything the app derives from an event's free-text time, parsed once per distinct string."""
+
+    # (start, end) in minutes after midnight; end passes 24:00 for ranges that cross midnight.
+    window: tuple[int, int] | None
+    # True when the text holds two valid times, the only shape accepted for new events.
+    is_range: bool
+    # "HH:MM - HH:MM" for proper ranges, otherwise the stripped original text.
+    display: str
+    # Casefolded text without whitespace; how times that cannot be parsed are compared.
+    compact: str
+
+
+def _time_token_to_minutes(hours_text: str, minutes_text: str, meridiem: str | None) -> int | None:
+    hours = int(hours_text)
+    minutes = int(minutes_text)
+
+    if minutes < 0 or minutes > 59:
+        return None
+
+    if meridiem is not None:
+        if hours < 1 or hours > 12:
+            return None
+        if meridiem.lower() == "a":
+            hours = 0 if hours == 12 else hours
+        else:
+            hours = 12 if hours == 12 else hours + 12
+    else:
+        if hours < 0 or hours > 23:
+            return None
+
+    return hours * 60 + minutes
+
+
+def _minutes_to_hhmm(total_minutes: int) -> str:
+    hours, minutes = divmod(total_minutes % (24 * 60), 60)
+    return f"{hours:02d}:{minutes:02d}"
+
+
+def _extract_window(tokens: list[tuple[str, str, str]]) -> tuple[int, int] | None:
+    if not tokens:
+        return None
+
+    first = _time_token_to_minutes(tokens[0][0], tokens[0][1], tokens[0][2] or None)
+    if first is None:
+        return None
+
+    if len(tokens) == 1:
+        return first, first
+
+    second = _time_token_to_minutes(tokens[1][0], tokens[1][1], tokens[1][2] or None)
+    if second is None:
+        return None
+
+    if second < first:
+        # Gracefully support rare ranges that cross midnight.
+        second += 24 * 60
+
+    return first, second
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_event_time(raw_time: str) -> EventTime:
+    tokens = TIME_TOKEN_REGEX.findall(raw_time)
+    window = _extract_window(tokens)
+    is_range = window is not None and len(tokens) > 1
+    if is_range and window[1] > window[0]:
+        display = f"{_minutes_to_hhmm(window[0])} - {_minutes_to_hhmm(window[1])}"
+    else:
+        display = raw_time.strip()
+    compact = WHITESPACE_REGEX.sub("", raw_time.casefold())
+    return EventTime(window=window, is_range=is_range, display=display, compact=compact)
+
+
+def extract_time_window(raw_time: str) -> tuple[int, int] | None:
+    return parse_event_time(raw_time).window
+
+
+def normalize_interval(start: int, end: int) -> tuple[int, int]:
+    if end == start:
+        return start, start + 1
+    return start, end
+
+
+def schedule_interval(raw_time: str) -> tuple[int, int] | None:
+    window = parse_event_time(raw_time).window
+    return normalize_interval(*window) if window is not None else None
+
+
+def times_clash(time_a: str, time_b: str) -> bool:
+    """Same-day clash between two event times: the windows overlap, or neither parses and the text matches."""
+    interval_a, interval_b = schedule_interval(time_a), schedule_interval(time_b)
+    if interval_a is not None and interval_b is not None:
+        return max(interval_a[0], interval_b[0]) < min(interval_a[1], interval_b[1])
+    # Fallback for uncommon/invalid time formats: if both strings are effectively equal, treat as conflict.
+    return parse_event_time(time_a).compact == parse_event_time(time_b).compact
+
+
+def event_bounds(event_date: date, raw_time: str) -> tuple[datetime, datetime]:
+    base = datetime.combine(event_date, datetime.min.time())
+    time_window = extract_time_window(raw_time)
+    if time_window is None:
+        # Unknown formats are treated as whole-day events to avoid early "past" transitions.
+        return base, base + timedelta(hours=23, minutes=59, seconds=59)
+
+    start_minutes, end_minutes = normalize_interval(*time_window)
+    return base + timedelta(minutes=start_minutes), base + timedelta(minutes=end_minutes)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TypeVar
+
+from .database import get_write_batch_size, write_batching_enabled
+
+T = TypeVar("T")
+
+DEFAULT_READ_WORKERS = 6
+DEFAULT_WRITE_WORKERS = 2
+
+
+def _worker_count(env_name: str, default: int) -> int:
+    raw_value = os.getenv(env_name, "").strip()
+    try:
+        return max(1, int(raw_value)) if raw_value else default
+    except ValueError:
+        return default
+
+
+def _write_worker_count() -> int:
+    workers = _worker_count("APP_DB_WRITE_WORKERS", DEFAULT_WRITE_WORKERS)
+    # Each write thread blocks in WriteBatcher.submit with one job, so with group commit a pool smaller
+    # than the batch size would cap every COMMIT at the pool size.
+    if write_batching_enabled():
+        workers = max(workers, get_write_batch_size())
+    return workers
+
+
+# Store work runs on dedicated, bounded pools instead of Starlette's shared threadpool, and reads
+# never queue behind writes (or the other way around), so slow catalog/report reads cannot starve signups.
+_read_executor = ThreadPoolExecutor(
+    max_workers=_worker_count("APP_DB_READ_WORKERS", DEFAULT_READ_WORKERS),
+    thread_name_prefix="store-read",
+)
+_write_executor = ThreadPoolExecutor(
+    max_workers=_write_worker_count(),
+    thread_name_prefix="store-write",
+)
+
+
+async def run_read(func: Callable[..., T], /, *args, **kwargs) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_read_executor, partial(func, *args, **kwargs))
+
+
+async def run_write(func: Callable[..., T], /, *args, **kwargs) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_write_executor, partial(func, *args, **kwargs))
+
+
+def shutdown_executors() -> None:
+    _read_executor.shutdown(wait=True)
+    _write_executor.shutdown(wait=True)
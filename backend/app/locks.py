@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import time
+from threading import Lock
+from typing import Self
+
+# Upper bounds (ms) of the wait-time histogram buckets; waits above the last bound land in "inf".
+WAIT_BUCKETS_MS = (0.1, 1.0, 10.0, 100.0, 1000.0)
+DEFAULT_LOCK_STRIPES = 64
+
+
+class LockWaitStats:
+    """Contention counters shared by one lock or a whole stripe set."""
+
+    def __init__(self) -> None:
+        self._stats_lock = Lock()
+        self._acquisitions = 0
+        self._contended = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._histogram = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def record(self, waited_seconds: float | None) -> None:
+        # None marks an uncontended acquisition, which never enters the histogram.
+        with self._stats_lock:
+            self._acquisitions += 1
+            if waited_seconds is None:
+                return
+            self._contended += 1
+            self._wait_seconds += waited_seconds
+            self._max_wait_seconds = max(self._max_wait_seconds, waited_seconds)
+            waited_ms = waited_seconds * 1000
+            bucket = next(
+                (index for index, bound in enumerate(WAIT_BUCKETS_MS) if waited_ms <= bound),
+                len(WAIT_BUCKETS_MS),
+            )
+            self._histogram[bucket] += 1
+
+    def snapshot(self) -> dict[str, object]:
+        with self._stats_lock:
+            labels = [f"<={bound:g}ms" for bound in WAIT_BUCKETS_MS] + ["inf"]
+            return {
+                "acquisitions": self._acquisitions,
+                "contended": self._contended,
+                "wait_ms_total": round(self._wait_seconds * 1000, 3),
+                "wait_ms_max": round(self._max_wait_seconds * 1000, 3),
+                "wait_histogram": dict(zip(labels, self._histogram)),
+            }
+
+
+class TimedLock:
+    """A non-reentrant lock that records how long callers queued for it."""
+
+    def __init__(self, stats: LockWaitStats | None = None) -> None:
+        self._lock = Lock()
+        self.stats = stats or LockWaitStats()
+
+    def __enter__(self) -> Self:
+        # Only pay for the clock when the lock is actually held by someone else.
+        if self._lock.acquire(blocking=False):
+            self.stats.record(None)
+            return self
+        started = time.perf_counter()
+        self._lock.acquire()
+        self.stats.record(time.perf_counter() - started)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._lock.release()
+
+
+class LockStripes:
+    """A fixed set of locks picked by key, so writers on different keys rarely share one."""
+
+    def __init__(self, count: int = DEFAULT_LOCK_STRIPES) -> None:
+        self.stats = LockWaitStats()
+        self._locks = [TimedLock(self.stats) for _ in range(count)]
+
+    def for_key(self, key: str) -> TimedLock:
+        return self._locks[hash(key) % len(self._locks)]
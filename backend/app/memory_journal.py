@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import IO
+
+from pydantic import BaseModel, TypeAdapter
+
+from .database import BACKEND_DIR
+from .models import (
+    EventRecord,
+    EventReviewRecord,
+    RegistrationRecord,
+    UserRecord,
+    WaitlistRecord,
+)
+
+FSYNC_POLICIES = ("always", "interval", "off")
+DEFAULT_FSYNC_POLICY = "interval"
+DEFAULT_FSYNC_INTERVAL_MS = 1000.0
+DEFAULT_SNAPSHOT_EVERY = 100_000
+SNAPSHOT_CHUNK_SIZE = 10_000
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FILENAME = "snapshot.jsonl"
+SEGMENT_PATTERN = re.compile(r"^ops-(\d{8})\.log$")
+
+# Log lines are "<op>\t<json>"; snapshot lines are "<section>\t<json array>" after a header line.
+RECORD_TYPES: dict[str, type[BaseModel]] = {
+    "user": UserRecord,
+    "event": EventRecord,
+    "registration": RegistrationRecord,
+    "review": EventReviewRecord,
+    "waitlist": WaitlistRecord,
+}
+# Operations whose payload is just the id of the record they drop.
+ID_OPERATIONS = ("delete_event", "leave_waitlist")
+SNAPSHOT_SECTIONS = {
+    "users": "user",
+    "events": "event",
+    "registrations": "registration",
+    "reviews": "review",
+    "waitlist": "waitlist",
+}
+_SECTION_ADAPTERS = {
+    section: TypeAdapter(list[RECORD_TYPES[op]]) for section, op in SNAPSHOT_SECTIONS.items()
+}
+# Registrations are snapshotted column-wise ({"id": [...], "event_id": [...], ...} per line), which
+# skips building a pydantic record per registration on both the write and the load side.
+REGISTRATION_COLUMNS_SECTION = "registration_columns"
+
+
+class JournalCorruptedError(RuntimeError):
+    pass
+
+
+def get_memory_data_dir() -> Path | None:
+    configured = os.getenv("APP_MEMORY_DATA_DIR", "").strip()
+    if not configured:
+        return None
+    path = Path(configured).expanduser()
+    return path if path.is_absolute() else (BACKEND_DIR / path).resolve()
+
+
+def get_fsync_policy() -> str:
+    configured = os.getenv("APP_MEMORY_FSYNC", DEFAULT_FSYNC_POLICY).strip().casefold()
+    return configured if configured in FSYNC_POLICIES else DEFAULT_FSYNC_POLICY
+
+
+def get_fsync_interval_ms() -> float:
+    raw_interval = os.getenv("APP_MEMORY_FSYNC_INTERVAL_MS", "").strip()
+    try:
+        return max(1.0, float(raw_interval)) if raw_interval else DEFAULT_FSYNC_INTERVAL_MS
+    except ValueError:
+        return DEFAULT_FSYNC_INTERVAL_MS
+
+
+def get_snapshot_every() -> int:
+    raw_every = os.getenv("APP_MEMORY_SNAPSHOT_EVERY", "").strip()
+    try:
+        return max(1, int(raw_every)) if raw_every else DEFAULT_SNAPSHOT_EVERY
+    except ValueError:
+        return DEFAULT_SNAPSHOT_EVERY
+
+
+@dataclass
+class MemorySnapshot:
+    # First log segment *not* folded into this snapshot; replay starts there.
+    segment: int
+    users: list[UserRecord] = field(default_factory=list)
+    events: list[EventRecord] = field(default_factory=list)
+    registrations: list[RegistrationRecord] = field(default_factory=list)
+    registration_columns: Iterable[dict[str, list]] = field(default_factory=list)
+    reviews: list[EventReviewRecord] = field(default_factory=list)
+    # In queue order per event; snapshots written before the waitlist existed simply lack the section.
+    waitlist: list[WaitlistRecord] = field(default_factory=list)
+
+
+class MemoryJournal:
+    """Durability for InMemoryStore: an append-only operation log plus periodic compact snapshots.
+
+    The log is split into numbered segments. A snapshot records the first segment it does not cover,
+    so startup loads the snapshot and replays only the newer segments; older ones are deleted once a
+    snapshot has been written.
+    """
+
+    def __init__(
+        self,
+        data_dir: Path,
+        fsync_policy: str | None = None,
+        fsync_interval_ms: float | None = None,
+        snapshot_every: int | None = None,
+    ) -> None:
+        self.data_dir = data_dir
+        self.fsync_policy = fsync_policy or get_fsync_policy()
+        if self.fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {self.fsync_policy}")
+        self.fsync_interval_seconds = (fsync_interval_ms or get_fsync_interval_ms()) / 1000
+        self.snapshot_every = snapshot_every or get_snapshot_every()
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = Lock()
+        self._file: IO[str] | None = None
+        self._segment = 0
+        self._dirty = False
+        self._closed = False
+        self._appends = 0
+        self._fsyncs = 0
+        self._ops_since_snapshot = 0
+        self._snapshots = 0
+        self._last_snapshot_ms = 0.0
+        self._last_snapshot_load_ms = 0.0
+        self._replayed_ops = 0
+        self._stop_flusher = Event()
+        self._flusher: Thread | None = None
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.data_dir / SNAPSHOT_FILENAME
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.data_dir / f"ops-{segment:08d}.log"
+
+    def _segments(self) -> list[int]:
+        segments = []
+        for path in self.data_dir.iterdir():
+            match = SEGMENT_PATTERN.match(path.name)
+            if match:
+                segments.append(int(match.group(1)))
+        return sorted(segments)
+
+    def has_state(self) -> bool:
+        return self.snapshot_path.exists() or bool(self._segments())
+
+    def load(self) -> tuple[MemorySnapshot | None, Iterator[tuple[str, object]]]:
+        """Read the snapshot (if any) and return it with an iterator over the log tail to replay."""
+        started = time.perf_counter()
+        snapshot = self._read_snapshot() if self.snapshot_path.exists() else None
+        first_segment = snapshot.segment if snapshot else 0
+        segments = [segment for segment in self._segments() if segment >= first_segment]
+        self._last_snapshot_load_ms = (time.perf_counter() - started) * 1000
+
+        def entries() -> Iterator[tuple[str, object]]:
+            for segment in segments:
+                yield from self._read_segment(segment)
+
+        return snapshot, entries()
+
+    def _read_snapshot(self) -> MemorySnapshot:
+        with self.snapshot_path.open("rb") as handle:
+            header_line = handle.readline()
+            op, _, payload = header_line.partition(b"\t")
+            if op != b"snapshot":
+                raise JournalCorruptedError(f"{self.snapshot_path} has no snapshot header")
+            header = json.loads(payload)
+            if header.get("version") != SNAPSHOT_VERSION:
+                raise JournalCorruptedError(f"Unsupported snapshot version: {header.get('version')}")
+            registration_columns: list[dict[str, list]] = []
+            snapshot = MemorySnapshot(segment=int(header["segment"]), registration_columns=registration_columns)
+            for line in handle:
+                raw_section, _, payload = line.rstrip(b"\n").partition(b"\t")
+                section = raw_section.decode()
+                if section == REGISTRATION_COLUMNS_SECTION:
+                    registration_columns.append(json.loads(payload))
+                    continue
+                adapter = _SECTION_ADAPTERS.get(section)
+                if adapter is None:
+                    raise JournalCorruptedError(f"Unknown snapshot section: {section!r}")
+                getattr(snapshot, section).extend(adapter.validate_json(payload))
+        return snapshot
+
+    def _read_segment(self, segment: int) -> Iterator[tuple[str, object]]:
+        with self._segment_path(segment).open("rb") as handle:
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    # A crash mid-append leaves a torn final line; the write was never acknowledged. The
+                    # segment is not reopened after a restart, so the tear stays its last line.
+                    return
+                op, _, payload = line.rstrip(b"\n").partition(b"\t")
+                op_name = op.decode()
+                self._replayed_ops += 1
+                if op_name in ID_OPERATIONS:
+                    yield op_name, json.loads(payload)
+                elif op_name in RECORD_TYPES:
+                    yield op_name, RECORD_TYPES[op_name].model_validate_json(payload)
+                else:
+                    raise JournalCorruptedError(f"Unknown journal operation: {op_name!r}")
+
+    def start(self) -> int:
+        """Open a fresh segment after replay and return its number; older segments are never appended to."""
+        segments = self._segments()
+        snapshot_segment = 0
+        if self.snapshot_path.exists():
+            with self.snapshot_path.open("rb") as handle:
+                snapshot_segment = int(json.loads(handle.readline().partition(b"\t")[2])["segment"])
+        with self._lock:
+            self._open_segment(max([snapshot_segment, *(segment + 1 for segment in segments)]))
+            # The replayed tail is still uncompacted, so it counts toward the next snapshot.
+            self._ops_since_snapshot = self._replayed_ops
+        if self.fsync_policy == "interval":
+            self._flusher = Thread(target=self._flush_periodically, name="memory-journal-fsync", daemon=True)
+            self._flusher.start()
+        return self._segment
+
+    def _open_segment(self, segment: int) -> None:
+        # Callers hold self._lock.
+        if self._file is not None:
+            self._sync_locked()
+            self._file.close()
+        self._segment = segment
+        self._file = self._segment_path(segment).open("a", encoding="utf-8")
+
+    def append(self, op: str, payload: BaseModel | str) -> bool:
+        """Log one operation. Returns True once enough operations piled up to warrant a snapshot."""
+        body = payload.model_dump_json() if isinstance(payload, BaseModel) else json.dumps(payload)
+        with self._lock:
+            if self._file is None:
+                raise RuntimeError("Memory journal is not open")
+            # Always hand the line to the OS so a process crash loses nothing; fsync guards power loss.
+            self._file.write(f"{op}\t{body}\n")
+            self._file.flush()
+            self._appends += 1
+            self._ops_since_snapshot += 1
+            if self.fsync_policy == "always":
+                self._sync_locked()
+            else:
+                self._dirty = True
+            return self._ops_since_snapshot >= self.snapshot_every
+
+    def _sync_locked(self) -> None:
+        if self._file is None or self.fsync_policy == "off":
+            return
+        os.fsync(self._file.fileno())
+        self._fsyncs += 1
+        self._dirty = False
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_flusher.wait(self.fsync_interval_seconds):
+            with self._lock:
+                if self._dirty:
+                    self._sync_locked()
+
+    def rotate(self) -> int:
+        """Start a new segment and return its number; a snapshot taken now covers everything before it."""
+        with self._lock:
+            self._open_segment(self._segment + 1)
+            self._ops_since_snapshot = 0
+            return self._segment
+
+    def write_snapshot(self, snapshot: MemorySnapshot) -> None:
+        started = time.perf_counter()
+        temporary_path = self.snapshot_path.with_suffix(".tmp")
+        with temporary_path.open("wb") as handle:
+            header = {"version": SNAPSHOT_VERSION, "segment": snapshot.segment}
+            handle.write(b"snapshot\t" + json.dumps(header).encode() + b"\n")
+            for section in SNAPSHOT_SECTIONS:
+                records = getattr(snapshot, section)
+                adapter = _SECTION_ADAPTERS[section]
+                # Chunked so a large snapshot never holds the GIL in one long serialization call.
+                for offset in range(0, len(records), SNAPSHOT_CHUNK_SIZE):
+                    chunk = records[offset : offset + SNAPSHOT_CHUNK_SIZE]
+                    handle.write(section.encode() + b"\t" + adapter.dump_json(chunk) + b"\n")
+            for columns in snapshot.registration_columns:
+                handle.write(REGISTRATION_COLUMNS_SECTION.encode() + b"\t" + json.dumps(columns).encode() + b"\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary_path, self.snapshot_path)
+        self._fsync_directory()
+
+        for segment in self._segments():
+            if segment < snapshot.segment:
+                self._segment_path(segment).unlink(missing_ok=True)
+        with self._lock:
+            self._snapshots += 1
+            self._last_snapshot_ms = (time.perf_counter() - started) * 1000
+
+    def _fsync_directory(self) -> None:
+        if os.name == "nt":
+            return
+        directory_fd = os.open(self.data_dir, os.O_RDONLY)
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
+
+    @property
+    def ops_since_snapshot(self) -> int:
+        return self._ops_since_snapshot
+
+    def close(self) -> None:
+        self._stop_flusher.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._file is not None:
+                self._sync_locked()
+                self._file.close()
+                self._file = None
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "data_dir": str(self.data_dir),
+                "fsync_policy": self.fsync_policy,
+                "segment": self._segment,
+                "appends": self._appends,
+                "fsyncs": self._fsyncs,
+                "ops_since_snapshot": self._ops_since_snapshot,
+                "snapshot_every": self.snapshot_every,
+                "snapshots": self._snapshots,
+                "last_snapshot_ms": round(self._last_snapshot_ms, 3),
+                "snapshot_load_ms": round(self._last_snapshot_load_ms, 3),
+                "replayed_ops": self._replayed_ops,
+            }
@@ -3,7 +3,9 @@ from __future__ import annotations
 from datetime import date, datetime
 from enum import Enum
 import re
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from .event_time import event_bounds, parse_event_time
 
 
 class Role(str, Enum):
@@ -30,10 +32,11 @@ class EventLifecycleFilter(str, Enum):
 class RegistrationStatus(str, Enum):
     REGISTERED = "registered"
     CANCELLED = "cancelled"
+    # Only reported back to students: waitlist entries are WaitlistRecords, never registration rows.
+    WAITLISTED = "waitlisted"
 
 
 STUDENT_ID_REGEX = re.compile(r"^[A-Z0-9]{8}-[A-Z0-9]{2}$")
-TIME_TOKEN_REGEX = re.compile(r"(\d{1,2}:\d{2}\s*(?:[ap]\.?m\.?)?)", re.IGNORECASE)
 
 
 def _normalize_student_id(value: str) -> str:
@@ -43,77 +46,20 @@ def _normalize_student_id(value: str) -> str:
     return normalized
 
 
-def _normalize_meridiem(token: str) -> tuple[str, str | None]:
-    cleaned = token.strip().lower().replace(" ", "")
-    meridiem: str | None = None
-    if re.search(r"a\.?m\.?$", cleaned):
-        meridiem = "am"
-    elif re.search(r"p\.?m\.?$", cleaned):
-        meridiem = "pm"
-    cleaned = re.sub(r"(a\.?m\.?|p\.?m\.?)$", "", cleaned).replace(".", "")
-    return cleaned, meridiem
-
-
-def _time_token_to_minutes(token: str) -> int | None:
-    normalized, meridiem = _normalize_meridiem(token)
-    match = re.fullmatch(r"(\d{1,2}):(\d{2})", normalized)
-    if not match:
-        return None
-
-    hours = int(match.group(1))
-    minutes = int(match.group(2))
-    if minutes < 0 or minutes > 59:
-        return None
-
-    if meridiem is not None:
-        if hours < 1 or hours > 12:
-            return None
-        if meridiem == "am":
-            hours = 0 if hours == 12 else hours
-        else:
-            hours = 12 if hours == 12 else hours + 12
-    elif hours < 0 or hours > 23:
-        return None
-
-    return (hours * 60) + minutes
-
-
-def _extract_time_window(raw_time: str) -> tuple[int, int] | None:
-    tokens = TIME_TOKEN_REGEX.findall(raw_time)
-    if len(tokens) < 2:
-        return None
-
-    start = _time_token_to_minutes(tokens[0])
-    end = _time_token_to_minutes(tokens[1])
-    if start is None or end is None:
-        return None
-
-    if end < start:
-        end += 24 * 60
-    return start, end
-
-
-def _minutes_to_hhmm(total_minutes: int) -> str:
-    minutes_per_day = 24 * 60
-    normalized = ((total_minutes % minutes_per_day) + minutes_per_day) % minutes_per_day
-    hours, minutes = divmod(normalized, 60)
-    return f"{hours:02d}:{minutes:02d}"
-
-
 def _normalize_event_time_range(raw_time: str) -> str:
-    time_window = _extract_time_window(raw_time)
-    if time_window is None:
+    parsed = parse_event_time(raw_time)
+    if not parsed.is_range:
         raise ValueError("Time must be in range format HH:MM - HH:MM")
 
-    start_minutes, end_minutes = time_window
+    start_minutes, end_minutes = parsed.window
     if end_minutes <= start_minutes:
         raise ValueError("End time must be later than start time")
 
-    return f"{_minutes_to_hhmm(start_minutes)} - {_minutes_to_hhmm(end_minutes)}"
+    return parsed.display
 
 
 class UserRecord(BaseModel):
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
 
     id: str
     username: str
@@ -164,7 +110,7 @@ class TokenPayload(BaseModel):
 
 
 class EventRecord(BaseModel):
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
 
     id: str
     image: str
@@ -176,10 +122,28 @@ class EventRecord(BaseModel):
     spots: int = Field(ge=0)
     type: EventType
     summary: str
-    agenda: list[str]
-    requirements: list[str]
+    agenda: tuple[str, ...]
+    requirements: tuple[str, ...]
     created_at: datetime
     updated_at: datetime
+    # Parsed once from the free-text time so lifecycle and range filters don't re-parse per request.
+    starts_at: datetime | None = None
+    ends_at: datetime | None = None
+
+    @model_validator(mode="after")
+    def fill_schedule_bounds(self) -> EventRecord:
+        if self.starts_at is None or self.ends_at is None:
+            # The record is frozen; this runs once while it is being built.
+            starts_at, ends_at = event_bounds(self.date, self.time)
+            object.__setattr__(self, "starts_at", starts_at)
+            object.__setattr__(self, "ends_at", ends_at)
+        return self
+
+
+class EventRatingSummary(BaseModel):
+    count: int = 0
+    average: float | None = None
+    histogram: dict[int, int] = Field(default_factory=lambda: {rating: 0 for rating in range(1, 6)})
 
 
 class EventSummary(BaseModel):
@@ -196,6 +160,7 @@ class EventSummary(BaseModel):
     type: EventType
     summary: str
     lifecycle: EventLifecycle
+    rating_summary: EventRatingSummary = Field(default_factory=EventRatingSummary)
 
 
 class EventDetail(EventSummary):
@@ -203,6 +168,11 @@ class EventDetail(EventSummary):
     requirements: list[str]
 
 
+class EventSummaryPage(BaseModel):
+    items: list[EventSummary]
+    next_cursor: str | None = None
+
+
 class EventMutationBase(BaseModel):
     image: str = Field(min_length=1, max_length=255)
     name: str = Field(min_length=3, max_length=255)
@@ -245,7 +215,7 @@ class EventImageUploadResponse(BaseModel):
 
 
 class RegistrationRecord(BaseModel):
-    model_config = ConfigDict(use_enum_values=True)
+    model_config = ConfigDict(use_enum_values=True, frozen=True)
 
     id: str
     event_id: str
@@ -258,6 +228,29 @@ class RegistrationRecord(BaseModel):
     created_at: datetime
 
 
+class WaitlistRecord(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    id: str
+    event_id: str
+    first_name: str
+    last_name: str
+    student_id: str
+    career: str
+    semester: int = Field(ge=1, le=12)
+    # Queue order is (created_at, id), oldest first.
+    created_at: datetime
+
+
+class EventRegistrationStatsRecord(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    event_id: str
+    registered_count: int = 0
+    cancelled_count: int = 0
+    last_registration_at: datetime | None = None
+
+
 class UserRegistrationData(BaseModel):
     first_name: str = Field(min_length=2, max_length=80)
     last_name: str = Field(min_length=2, max_length=80)
@@ -298,7 +291,14 @@ class RegistrationPublic(BaseModel):
     created_at: datetime
 
 
+class RegistrationPublicPage(BaseModel):
+    items: list[RegistrationPublic]
+    next_cursor: str | None = None
+
+
 class EventReviewRecord(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     event_id: str
     student_id: str
@@ -323,6 +323,16 @@ class EventReviewCreateRequest(BaseModel):
         return normalized
 
 
+class EventReviewStatsRecord(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    event_id: str
+    review_count: int = 0
+    rating_sum: int = 0
+    # rating_counts[i] is the number of reviews with rating i + 1.
+    rating_counts: tuple[int, ...] = (0, 0, 0, 0, 0)
+
+
 class EventReviewPublic(BaseModel):
     id: str
     event_id: str
@@ -334,6 +344,11 @@ class EventReviewPublic(BaseModel):
     updated_at: datetime
 
 
+class EventReviewPublicPage(BaseModel):
+    items: list[EventReviewPublic]
+    next_cursor: str | None = None
+
+
 class UserEventRegistration(BaseModel):
     model_config = ConfigDict(use_enum_values=True)
 
@@ -342,6 +357,14 @@ class UserEventRegistration(BaseModel):
     status: RegistrationStatus
     registered_at: datetime
     event: EventSummary
+    # 1-based place in the event's waitlist while status is "waitlisted".
+    waitlist_position: int | None = None
+
+
+class EventConflictHint(BaseModel):
+    event_id: str
+    # Events the student is registered to that overlap event_id; empty when it is free to register.
+    conflicting_event_ids: list[str]
 
 
 class SignUpRequest(UserRegistrationData):
@@ -358,6 +381,7 @@ class AdminEventStats(BaseModel):
     event_name: str
     total_registrations: int
     available_spots: int
+    last_registration_at: datetime | None = None
 
 
 class AdminSummary(BaseModel):
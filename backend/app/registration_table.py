@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime, timedelta
+
+from .locks import TimedLock
+from .models import RegistrationRecord
+
+EPOCH = datetime(1970, 1, 1)
+STATUS_CODES = ("registered", "cancelled")
+_STATUS_BY_NAME = {name: code for code, name in enumerate(STATUS_CODES)}
+SNAPSHOT_COLUMNS = (
+    "id",
+    "event_id",
+    "student_id",
+    "first_name",
+    "last_name",
+    "career",
+    "semester",
+    "status",
+    "created_at",
+)
+# Repack once retired rows are at least this many and at least half of all rows.
+COMPACT_MIN_DEAD_ROWS = 4096
+
+
+def _to_micros(value: datetime) -> int:
+    # Records carry naive UTC timestamps; aware ones are normalized so the column stays comparable.
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+def _from_micros(value: int) -> datetime:
+    return EPOCH + timedelta(microseconds=value)
+
+
+class _Columns:
+    """One generation of the table's storage: string table, columns and row indexes.
+
+    Compaction builds a fresh generation from the live rows and swaps it in whole, so a reader that
+    captured a generation (and the row numbers it handed out) keeps reading consistent values.
+    """
+
+    __slots__ = (
+        "careers",
+        "codes",
+        "created_at",
+        "event_codes",
+        "first_names",
+        "ids",
+        "last_names",
+        "row_by_id",
+        "rows_by_event",
+        "rows_by_student",
+        "semesters",
+        "statuses",
+        "strings",
+        "student_codes",
+    )
+
+    def __init__(self) -> None:
+        self.strings: list[str] = []
+        self.codes: dict[str, int] = {}
+        self.ids: list[str] = []
+        self.event_codes = array("I")
+        self.student_codes = array("I")
+        self.first_names = array("I")
+        self.last_names = array("I")
+        self.careers = array("I")
+        self.semesters = array("B")
+        self.statuses = array("B")
+        self.created_at = array("q")
+        self.row_by_id: dict[str, int] = {}
+        # event code -> {casefolded student code -> row}, and casefolded student code -> rows.
+        self.rows_by_event: dict[int, dict[int, int]] = {}
+        self.rows_by_student: dict[int, list[int]] = {}
+
+    def intern(self, value: str) -> int:
+        # Callers hold the table lock.
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.strings)
+            self.strings.append(value)
+            self.codes[value] = code
+        return code
+
+    def materialize(self, row: int) -> RegistrationRecord:
+        strings = self.strings
+        # Plain construction: pydantic-core validation of these flat fields is faster than model_construct.
+        return RegistrationRecord(
+            id=self.ids[row],
+            event_id=strings[self.event_codes[row]],
+            first_name=strings[self.first_names[row]],
+            last_name=strings[self.last_names[row]],
+            student_id=strings[self.student_codes[row]],
+            career=strings[self.careers[row]],
+            semester=self.semesters[row],
+            status=STATUS_CODES[self.statuses[row]],
+            created_at=_from_micros(self.created_at[row]),
+        )
+
+    def append_row(self, registration_id: str, values: tuple[int, ...], status: int, student_key: int) -> None:
+        # Callers hold the table lock. The row is fully written and indexed before it is reachable by id,
+        # and callers retire any previous row only afterwards, so lock-free readers never see a gap.
+        row = len(self.ids)
+        self.ids.append(registration_id)
+        self.event_codes.append(values[0])
+        self.student_codes.append(values[1])
+        self.first_names.append(values[2])
+        self.last_names.append(values[3])
+        self.careers.append(values[4])
+        self.semesters.append(values[5])
+        self.created_at.append(values[6])
+        self.statuses.append(status)
+        self.rows_by_event.setdefault(values[0], {})[student_key] = row
+        self.rows_by_student.setdefault(student_key, []).append(row)
+        self.row_by_id[registration_id] = row
+
+    def row_values(self, row: int) -> tuple[int, ...]:
+        return (
+            self.event_codes[row],
+            self.student_codes[row],
+            self.first_names[row],
+            self.last_names[row],
+            self.careers[row],
+            self.semesters[row],
+            self.created_at[row],
+        )
+
+    def unindex(self, row: int) -> None:
+        # Callers hold the table lock. Only row_by_id decides which rows are live: a retired row keeps its
+        # values for readers that already hold it until compaction drops the whole generation.
+        student_key = self.codes[self.strings[self.student_codes[row]].casefold()]
+        event_rows = self.rows_by_event.get(self.event_codes[row])
+        if event_rows is not None and event_rows.get(student_key) == row:
+            del event_rows[student_key]
+        student_rows = self.rows_by_student.get(student_key)
+        if student_rows is not None and row in student_rows:
+            student_rows.remove(row)
+
+    def find_row(self, event_id: str, student_id: str) -> int | None:
+        event_code = self.codes.get(event_id)
+        student_key = self.codes.get(student_id.casefold())
+        if event_code is None or student_key is None:
+            return None
+        return self.rows_by_event.get(event_code, {}).get(student_key)
+
+    def dead_rows(self) -> int:
+        return len(self.ids) - len(self.row_by_id)
+
+    def repacked(self) -> _Columns:
+        """A new generation holding only the live rows (in row order) and the strings they use."""
+        packed = _Columns()
+        intern, strings = packed.intern, self.strings
+        for row in sorted(self.row_by_id.values()):
+            student_id = strings[self.student_codes[row]]
+            values = (
+                intern(strings[self.event_codes[row]]),
+                intern(student_id),
+                intern(strings[self.first_names[row]]),
+                intern(strings[self.last_names[row]]),
+                intern(strings[self.careers[row]]),
+                self.semesters[row],
+                self.created_at[row],
+            )
+            packed.append_row(self.ids[row], values, self.statuses[row], intern(student_id.casefold()))
+        return packed
+
+
+class RowSelection(list):
+    """Row numbers returned by RegistrationTable.rows(), tied to the storage generation they index."""
+
+    __slots__ = ("columns",)
+
+    def __init__(self, rows: Iterable[int], columns: _Columns) -> None:
+        super().__init__(rows)
+        self.columns = columns
+
+
+class RegistrationTable:
+    """Registrations stored column-wise for InMemoryStore.
+
+    One row per registration: ids in a list, every other field as a typed array. Event ids, student ids,
+    names and careers are interned into one string table, status is a small code and created_at an
+    epoch in microseconds. RegistrationRecord objects are only built when a read hands them out.
+
+    Callers hold the stripe of the registration's event for writes. Row allocation, interning and the
+    per-student index (shared across stripes) sit behind the table's own short lock; reads take none.
+    Replaced and deleted rows are retired in place; once they make up half the table (and at least
+    compact_min_dead_rows) the storage is repacked into a new generation and swapped in.
+    """
+
+    def __init__(self, compact_min_dead_rows: int = COMPACT_MIN_DEAD_ROWS) -> None:
+        self.lock = TimedLock()
+        self.compact_min_dead_rows = compact_min_dead_rows
+        self._columns = _Columns()
+        self._compactions = 0
+
+    def __len__(self) -> int:
+        return len(self._columns.row_by_id)
+
+    def __contains__(self, registration_id: str) -> bool:
+        return registration_id in self._columns.row_by_id
+
+    def put(self, registration: RegistrationRecord) -> RegistrationRecord | None:
+        """Insert or replace a registration by id and return the record it replaced, if any."""
+        with self.lock:
+            columns = self._columns
+            previous_row = columns.row_by_id.get(registration.id)
+            previous = columns.materialize(previous_row) if previous_row is not None else None
+            intern = columns.intern
+            values = (
+                intern(registration.event_id),
+                intern(registration.student_id),
+                intern(registration.first_name),
+                intern(registration.last_name),
+                intern(registration.career),
+                registration.semester,
+                _to_micros(registration.created_at),
+            )
+            status = _STATUS_BY_NAME[registration.status]
+            if previous_row is not None and values == columns.row_values(previous_row):
+                # Registering again or cancelling only flips the status: one atomic column write.
+                columns.statuses[previous_row] = status
+                return previous
+            columns.append_row(registration.id, values, status, intern(registration.student_id.casefold()))
+            if previous_row is not None:
+                columns.unindex(previous_row)
+                self._compact_if_sparse()
+            return previous
+
+    def remove_event(self, event_id: str) -> int:
+        """Drop every registration of an event; returns how many were removed."""
+        with self.lock:
+            columns = self._columns
+            event_code = columns.codes.get(event_id)
+            if event_code is None:
+                return 0
+            rows = list(columns.rows_by_event.pop(event_code, {}).values())
+            for row in rows:
+                del columns.row_by_id[columns.ids[row]]
+                columns.unindex(row)
+            self._compact_if_sparse()
+            return len(rows)
+
+    def _compact_if_sparse(self) -> None:
+        # Callers hold self.lock. Repacking is O(rows), so it waits until retired rows are the majority.
+        columns = self._columns
+        dead_rows = columns.dead_rows()
+        if dead_rows < self.compact_min_dead_rows or dead_rows * 2 < len(columns.ids):
+            return
+        self._columns = columns.repacked()
+        self._compactions += 1
+
+    def get(self, registration_id: str) -> RegistrationRecord | None:
+        columns = self._columns
+        row = columns.row_by_id.get(registration_id)
+        return columns.materialize(row) if row is not None else None
+
+    def find(self, event_id: str, student_id: str) -> RegistrationRecord | None:
+        columns = self._columns
+        row = columns.find_row(event_id, student_id)
+        return columns.materialize(row) if row is not None else None
+
+    def is_registered(self, event_id: str, student_id: str) -> bool:
+        columns = self._columns
+        row = columns.find_row(event_id, student_id)
+        return row is not None and columns.statuses[row] == _STATUS_BY_NAME["registered"]
+
+    def rows(
+        self, event_id: str | None = None, student_id: str | None = None, status: str | None = None
+    ) -> RowSelection:
+        columns = self._columns
+        rows = self._rows(columns, event_id, student_id)
+        if status is None:
+            return RowSelection(rows, columns)
+        # Filtered on the status column, before anything is materialized.
+        status_code, statuses = _STATUS_BY_NAME[status], columns.statuses
+        return RowSelection((row for row in rows if statuses[row] == status_code), columns)
+
+    @staticmethod
+    def _rows(columns: _Columns, event_id: str | None, student_id: str | None) -> list[int]:
+        if event_id is not None and student_id is not None:
+            row = columns.find_row(event_id, student_id)
+            return [row] if row is not None else []
+        if event_id is not None:
+            event_code = columns.codes.get(event_id)
+            return list(columns.rows_by_event.get(event_code, {}).values()) if event_code is not None else []
+        if student_id is not None:
+            student_key = columns.codes.get(student_id.casefold())
+            return list(columns.rows_by_student.get(student_key, ())) if student_key is not None else []
+        return list(columns.row_by_id.values())
+
+    def pairs(self, rows: RowSelection) -> list[tuple[str, str]]:
+        """(event_id, student_id) per row, read off the columns without building records."""
+        columns = rows.columns
+        strings, event_codes, student_codes = columns.strings, columns.event_codes, columns.student_codes
+        return [(strings[event_codes[row]], strings[student_codes[row]]) for row in rows]
+
+    def page(
+        self, rows: RowSelection, after: tuple[datetime, str] | None, limit: int | None
+    ) -> list[RegistrationRecord]:
+        """Newest first by (created_at, id); sorts on the columns and only materializes the page."""
+        columns = rows.columns
+        created_at, ids = columns.created_at, columns.ids
+        keys = sorted((created_at[row], ids[row], row) for row in rows)
+        end = len(keys)
+        if after is not None:
+            end = bisect_left(keys, (_to_micros(after[0]), after[1]))
+        selected = keys[:end][::-1]
+        if limit is not None:
+            selected = selected[:limit]
+        return [columns.materialize(row) for _, _, row in selected]
+
+    def count_created_since(self, since: datetime) -> int:
+        cutoff = _to_micros(since)
+        columns = self._columns
+        created_at = columns.created_at
+        return sum(1 for row in columns.row_by_id.values() if created_at[row] >= cutoff)
+
+    def totals_by_event(self) -> dict[str, tuple[int, int, datetime | None]]:
+        """(registered, cancelled, newest created_at) per event, straight from the columns."""
+        registered_code = _STATUS_BY_NAME["registered"]
+        columns = self._columns
+        totals: dict[int, list[int]] = {}
+        for row in columns.row_by_id.values():
+            counts = totals.setdefault(columns.event_codes[row], [0, 0, -1])
+            counts[0 if columns.statuses[row] == registered_code else 1] += 1
+            counts[2] = max(counts[2], columns.created_at[row])
+        return {
+            columns.strings[event_code]: (registered, cancelled, _from_micros(newest) if newest >= 0 else None)
+            for event_code, (registered, cancelled, newest) in totals.items()
+        }
+
+    def export_columns(self, chunk_size: int) -> Iterator[dict[str, list]]:
+        """Capture the live rows now and render them lazily as column chunks (snapshot format).
+
+        Ids, strings and retired rows of a generation are never rewritten, and compaction swaps in a new
+        generation instead of repacking this one, so only the row list needs copying; a status flipped
+        after the capture is also in the log that follows the snapshot and replays over it.
+        """
+        columns = self._columns
+        rows = list(columns.row_by_id.values())
+        strings = columns.strings
+
+        def chunks() -> Iterator[dict[str, list]]:
+            for offset in range(0, len(rows), chunk_size):
+                chunk = rows[offset : offset + chunk_size]
+                yield {
+                    "id": [columns.ids[row] for row in chunk],
+                    "event_id": [strings[columns.event_codes[row]] for row in chunk],
+                    "student_id": [strings[columns.student_codes[row]] for row in chunk],
+                    "first_name": [strings[columns.first_names[row]] for row in chunk],
+                    "last_name": [strings[columns.last_names[row]] for row in chunk],
+                    "career": [strings[columns.careers[row]] for row in chunk],
+                    "semester": [columns.semesters[row] for row in chunk],
+                    "status": [STATUS_CODES[columns.statuses[row]] for row in chunk],
+                    "created_at": [columns.created_at[row] for row in chunk],
+                }
+
+        return chunks()
+
+    def load_columns(self, columns: dict[str, list]) -> None:
+        """Append rows exported by export_columns; they come from a snapshot, so they skip validation."""
+        with self.lock:
+            table = self._columns
+            intern = table.intern
+            for row_values in zip(*(columns[name] for name in SNAPSHOT_COLUMNS)):
+                registration_id, event_id, student_id, first_name, last_name, career, semester, status, created_at = (
+                    row_values
+                )
+                values = (
+                    intern(event_id),
+                    intern(student_id),
+                    intern(first_name),
+                    intern(last_name),
+                    intern(career),
+                    semester,
+                    created_at,
+                )
+                table.append_row(registration_id, values, _STATUS_BY_NAME[status], intern(student_id.casefold()))
+
+    def stats(self) -> dict[str, object]:
+        columns = self._columns
+        total_rows = len(columns.ids)
+        live_rows = len(columns.row_by_id)
+        return {
+            "live_rows": live_rows,
+            "dead_rows": total_rows - live_rows,
+            "interned_strings": len(columns.strings),
+            "compactions": self._compactions,
+            "column_bytes": sum(
+                column.itemsize * len(column)
+                for column in (
+                    columns.event_codes,
+                    columns.student_codes,
+                    columns.first_names,
+                    columns.last_names,
+                    columns.careers,
+                    columns.semesters,
+                    columns.statuses,
+                    columns.created_at,
+                )
+            ),
+            "lock": self.lock.stats.snapshot(),
+        }
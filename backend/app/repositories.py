@@ -1,13 +1,66 @@
 from __future__ import annotations
 
-from datetime import date, datetime
+import gc
+import json
+import time
+from bisect import bisect_left, bisect_right, insort
+from datetime import UTC, date, datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from threading import Lock
+from threading import Lock, Thread
 from uuid import uuid4
 
-from .database import get_connection, get_db_path
-from .models import EventRecord, EventReviewRecord, EventType, RegistrationRecord, UserRecord
+from pydantic import BaseModel
+
+from .database import (
+    ConnectionPool,
+    WriteBatcher,
+    describe_connection_profile,
+    get_db_path,
+    write_batching_enabled,
+)
+from .event_time import times_clash
+from .locks import LockStripes, TimedLock
+from .memory_journal import SNAPSHOT_CHUNK_SIZE, MemoryJournal, MemorySnapshot
+from .models import (
+    EventRecord,
+    EventRegistrationStatsRecord,
+    EventReviewRecord,
+    EventReviewStatsRecord,
+    EventType,
+    RegistrationRecord,
+    RegistrationStatus,
+    UserRecord,
+    WaitlistRecord,
+)
+from .registration_table import RegistrationTable
+from .schedule_index import ScheduleIndex
+
+
+class StoreError(Exception):
+    pass
+
+
+class NoSeatsAvailableError(StoreError):
+    pass
+
+
+class AlreadyRegisteredError(StoreError):
+    pass
+
+
+class AlreadyCancelledError(StoreError):
+    pass
+
+
+class SeatsAvailableError(StoreError):
+    # join_waitlist found a free seat (one was released in the meantime): reserve it instead.
+    pass
+
+
+def _utcnow() -> datetime:
+    # Records keep naive UTC timestamps.
+    return datetime.now(UTC).replace(tzinfo=None)
 
 
 def _to_datetime(value: str | datetime) -> datetime:
@@ -24,6 +77,70 @@ def _to_date(value: str | date) -> date:
     return date.fromisoformat(value)
 
 
+def _student_key(student_id: str) -> str:
+    # Student ids are stored upper-cased so lookups can use plain (BINARY) index seeks.
+    return student_id.strip().upper()
+
+
+def _keyset_page(records: list, sort_key, after: tuple | None, limit: int | None, descending: bool = False) -> list:
+    # Keyset pagination over an in-memory list: bisect past the cursor key instead of counting offsets.
+    records = sorted(records, key=sort_key)
+    if descending:
+        end = len(records) if after is None else bisect_left([sort_key(record) for record in records], after)
+        page = records[:end][::-1]
+    else:
+        start = 0 if after is None else bisect_right([sort_key(record) for record in records], after)
+        page = records[start:]
+    return page if limit is None else page[:limit]
+
+
+def _event_sort_key(event: EventRecord) -> tuple[date, str, str]:
+    return (event.date, event.time, event.id)
+
+
+def _review_sort_key(review: EventReviewRecord) -> tuple[datetime, datetime, str]:
+    return (review.updated_at, review.created_at, review.id)
+
+
+def _with_key(keys: list, add: tuple | None = None, remove: tuple | None = None) -> list:
+    # Copy-on-write update of a sorted key list: readers keep bisecting the old list until the swap.
+    updated = list(keys)
+    if remove is not None:
+        index = bisect_left(updated, remove)
+        if index < len(updated) and updated[index] == remove:
+            del updated[index]
+    if add is not None:
+        insort(updated, add)
+    return updated
+
+
+def _discard_from_bucket(
+    index: dict[str, dict[str, object]], key: str, record_id: str, drop_empty: bool = True
+) -> None:
+    bucket = index.get(key)
+    if bucket is None:
+        return
+    bucket.pop(record_id, None)
+    if drop_empty and not bucket:
+        del index[key]
+
+
+def _registration_from_waitlist(
+    entry: WaitlistRecord, registration_id: str, created_at: datetime
+) -> RegistrationRecord:
+    return RegistrationRecord(
+        id=registration_id,
+        event_id=entry.event_id,
+        first_name=entry.first_name,
+        last_name=entry.last_name,
+        student_id=entry.student_id,
+        career=entry.career,
+        semester=entry.semester,
+        status="registered",
+        created_at=created_at,
+    )
+
+
 def _enum_value(value: str | Enum) -> str:
     if isinstance(value, Enum):
         return str(value.value)
@@ -31,99 +148,610 @@ def _enum_value(value: str | Enum) -> str:
 
 
 class InMemoryStore:
-    def __init__(self, users: list[UserRecord], events: list[EventRecord]) -> None:
-        self._lock = Lock()
-        self._users_by_id = {user.id: user.model_copy(deep=True) for user in users}
-        self._users_by_username = {user.username.casefold(): user.model_copy(deep=True) for user in users}
-        self._users_by_student_id = {user.student_id.casefold(): user.model_copy(deep=True) for user in users}
-        self._events_by_id = {event.id: event.model_copy(deep=True) for event in events}
-        self._registrations_by_id: dict[str, RegistrationRecord] = {}
+    # Records are frozen models: reads hand out shared references and writes replace whole records.
+    # Readers take no lock. Writers lock the stripe of the event they touch (registrations, reviews,
+    # seat counts and the event record itself), so unrelated events never queue behind each other;
+    # users and the sorted event keys shared by every event sit behind the catalog lock.
+
+    def __init__(
+        self,
+        users: list[UserRecord],
+        events: list[EventRecord],
+        journal: MemoryJournal | None = None,
+    ) -> None:
+        self._event_locks = LockStripes()
+        self._catalog_lock = TimedLock()
+        self._snapshot_lock = Lock()
+        self._journal: MemoryJournal | None = None
+        self._snapshot_thread: Thread | None = None
+        self._restore_ms = 0.0
+        self._load_catalog(users, events)
+        # Registrations are the bulk of the data, so they live column-wise and carry their own indexes.
+        self._registrations = RegistrationTable()
         self._reviews_by_id: dict[str, EventReviewRecord] = {}
+        # Secondary indexes ({key: {record_id: record}}) kept in step with _reviews_by_id, so lookups
+        # and cascades touch only the matching records. Student keys are casefolded. Student buckets span
+        # event stripes, so they are never dropped once empty: another writer may already hold one.
+        self._reviews_by_event: dict[str, dict[str, EventReviewRecord]] = {}
+        self._reviews_by_student: dict[str, dict[str, EventReviewRecord]] = {}
+        self._review_ids_by_event_student: dict[tuple[str, str], str] = {}
+        # Sorted (updated_at, created_at, id) per event, swapped copy-on-write like _event_keys, so review
+        # pages bisect to the cursor instead of sorting the event's reviews on every call.
+        self._review_keys_by_event: dict[str, list[tuple[datetime, datetime, str]]] = {}
+        # Per-event counters updated on every registration write, mirroring event_registration_stats.
+        self._registration_stats: dict[str, EventRegistrationStatsRecord] = {}
+        self._review_stats: dict[str, EventReviewStatsRecord] = {}
+        # Active registrations per student and day, so conflict checks bisect instead of scanning.
+        self._schedule = ScheduleIndex()
+        # FIFO queue per event for full events, plus the same entries by id and by casefolded student.
+        self._waitlists: dict[str, list[WaitlistRecord]] = {}
+        self._waitlist_by_id: dict[str, WaitlistRecord] = {}
+        self._waitlist_by_student: dict[str, dict[str, WaitlistRecord]] = {}
+        if journal is not None:
+            self._restore(journal)
+
+    def _load_catalog(self, users: list[UserRecord], events: list[EventRecord]) -> None:
+        self._users_by_id = {user.id: user for user in users}
+        self._users_by_username = {user.username.casefold(): user for user in users}
+        self._users_by_student_id = {user.student_id.casefold(): user for user in users}
+        self._events_by_id = {event.id: event for event in events}
+        # (date, time, id) keys kept sorted, overall and per type/month bucket, so listings bisect to
+        # their range instead of filtering and re-sorting every event.
+        self._event_keys: list[tuple[date, str, str]] = sorted(_event_sort_key(event) for event in events)
+        self._event_keys_by_type: dict[str, list[tuple[date, str, str]]] = {}
+        self._event_keys_by_month: dict[int, list[tuple[date, str, str]]] = {}
+        for key in self._event_keys:
+            event = self._events_by_id[key[2]]
+            self._event_keys_by_type.setdefault(event.type, []).append(key)
+            self._event_keys_by_month.setdefault(event.date.month, []).append(key)
+
+    def _restore(self, journal: MemoryJournal) -> None:
+        # The seed catalog only stands when the data directory has no snapshot yet; the log tail is
+        # replayed before the journal is attached, so replay never logs itself again.
+        started = time.perf_counter()
+        # Loading allocates millions of objects and nothing here forms cycles; without pausing the
+        # collector, its full passes over the growing heap cost a large share of startup time.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            snapshot = self._replay(journal)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        # Move the loaded records out of the collector's generations so later passes skip them.
+        gc.freeze()
+        segment = journal.start()
+        if snapshot is None:
+            journal.write_snapshot(self._capture_snapshot(segment))
+        self._journal = journal
+        self._restore_ms = (time.perf_counter() - started) * 1000
+
+    def _replay(self, journal: MemoryJournal) -> MemorySnapshot | None:
+        snapshot, entries = journal.load()
+        if snapshot is not None:
+            self._load_catalog(snapshot.users, snapshot.events)
+            for registration in snapshot.registrations:
+                self._registrations.put(registration)
+            for columns in snapshot.registration_columns:
+                self._registrations.load_columns(columns)
+            for review in snapshot.reviews:
+                self._index_review(review)
+            for entry in snapshot.waitlist:
+                self._index_waitlist_entry(entry)
+            self._rebuild_stats()
+            self._rebuild_schedule()
+        for op, payload in entries:
+            if op == "user":
+                self._put_user(payload)
+            elif op == "event":
+                self._put_event(payload)
+            elif op == "registration":
+                self._put_registration(payload)
+            elif op == "review":
+                self._put_review(payload)
+            elif op == "waitlist":
+                self._put_waitlist_entry(payload)
+            elif op == "leave_waitlist":
+                self._remove_waitlist_entry(payload)
+            elif op == "delete_event":
+                self._remove_event(payload)
+        return snapshot
+
+    def _rebuild_stats(self) -> None:
+        # One aggregation pass for bulk loads, instead of a counter copy per record.
+        self._registration_stats = {
+            event_id: EventRegistrationStatsRecord(
+                event_id=event_id,
+                registered_count=registered_count,
+                cancelled_count=cancelled_count,
+                last_registration_at=last_registration_at,
+            )
+            for event_id, (registered_count, cancelled_count, last_registration_at) in (
+                self._registrations.totals_by_event().items()
+            )
+        }
+        review_totals: dict[str, list[int]] = {}
+        for review in self._reviews_by_id.values():
+            rating_counts = review_totals.setdefault(review.event_id, [0, 0, 0, 0, 0])
+            rating_counts[review.rating - 1] += 1
+        self._review_stats = {
+            event_id: EventReviewStatsRecord(
+                event_id=event_id,
+                review_count=sum(rating_counts),
+                rating_sum=sum(rating * count for rating, count in enumerate(rating_counts, start=1)),
+                rating_counts=tuple(rating_counts),
+            )
+            for event_id, rating_counts in review_totals.items()
+        }
+
+    def _rebuild_schedule(self) -> None:
+        self._schedule.clear()
+        registered = self._registrations.rows(status="registered")
+        for event_id, student_id in self._registrations.pairs(registered):
+            event = self._events_by_id.get(event_id)
+            if event is not None:
+                self._schedule.add(student_id, event.id, event.date, event.time)
+
+    def _capture_snapshot(self, segment: int) -> MemorySnapshot:
+        # Records are immutable, so copying the dict values is enough. Writes racing with the copy are
+        # already logged to the segment that follows the snapshot, and replaying them is idempotent.
+        return MemorySnapshot(
+            segment=segment,
+            users=list(self._users_by_id.values()),
+            events=list(self._events_by_id.values()),
+            registration_columns=self._registrations.export_columns(SNAPSHOT_CHUNK_SIZE),
+            reviews=list(self._reviews_by_id.values()),
+            waitlist=[entry for queue in list(self._waitlists.values()) for entry in list(queue)],
+        )
+
+    def _log(self, op: str, payload: BaseModel | str) -> None:
+        # Callers hold the stripe of the event they wrote, so each event's log order matches the order
+        # its writes were applied in; writes on different events commute.
+        if self._journal is None or not self._journal.append(op, payload):
+            return
+        with self._snapshot_lock:
+            if self._snapshot_thread is not None and self._snapshot_thread.is_alive():
+                return
+            snapshot = self._capture_snapshot(self._journal.rotate())
+            self._snapshot_thread = Thread(
+                target=self._journal.write_snapshot, args=(snapshot,), name="memory-snapshot", daemon=True
+            )
+            self._snapshot_thread.start()
+
+    def close(self) -> None:
+        journal = self._journal
+        if journal is None:
+            return
+        with self._snapshot_lock:
+            snapshot_thread = self._snapshot_thread
+        if snapshot_thread is not None:
+            snapshot_thread.join()
+        with self._snapshot_lock:
+            self._journal = None
+            snapshot = self._capture_snapshot(journal.rotate()) if journal.ops_since_snapshot else None
+        if snapshot is not None:
+            journal.write_snapshot(snapshot)
+        journal.close()
+
+    def _index_event(self, previous: EventRecord | None, current: EventRecord | None) -> None:
+        # Callers hold the event's stripe. Seat count changes keep the key, so they skip the catalog lock.
+        old_key = _event_sort_key(previous) if previous is not None else None
+        new_key = _event_sort_key(current) if current is not None else None
+        if old_key == new_key and (previous is None or previous.type == current.type):
+            return
+        with self._catalog_lock:
+            self._event_keys = _with_key(self._event_keys, add=new_key, remove=old_key)
+            for buckets, bucket_of in (
+                (self._event_keys_by_type, lambda event: event.type),
+                (self._event_keys_by_month, lambda event: event.date.month),
+            ):
+                if previous is not None:
+                    bucket = bucket_of(previous)
+                    buckets[bucket] = _with_key(buckets.get(bucket, []), remove=old_key)
+                if current is not None:
+                    bucket = bucket_of(current)
+                    buckets[bucket] = _with_key(buckets.get(bucket, []), add=new_key)
+
+    def _put_registration(self, registration: RegistrationRecord) -> RegistrationRecord | None:
+        # Callers hold the event's stripe. Returns the record it replaced, if any.
+        previous = self._registrations.put(registration)
+        self._track_registration(previous, registration)
+        self._schedule_registration(previous, registration)
+        self._log("registration", registration)
+        return previous
+
+    def _put_review(self, review: EventReviewRecord) -> EventReviewRecord | None:
+        # Callers hold the event's stripe. Returns the record it replaced, if any.
+        previous = self._index_review(review)
+        self._track_review(previous, review)
+        self._log("review", review)
+        return previous
+
+    def _index_review(self, review: EventReviewRecord) -> EventReviewRecord | None:
+        previous = self._reviews_by_id.get(review.id)
+        if previous is not None:
+            self._unindex_review(previous)
+        student_key = review.student_id.casefold()
+        self._reviews_by_id[review.id] = review
+        self._reviews_by_event.setdefault(review.event_id, {})[review.id] = review
+        self._review_keys_by_event[review.event_id] = _with_key(
+            self._review_keys_by_event.get(review.event_id, []), add=_review_sort_key(review)
+        )
+        self._reviews_by_student.setdefault(student_key, {})[review.id] = review
+        self._review_ids_by_event_student[(review.event_id, student_key)] = review.id
+        return previous
+
+    def _unindex_review(self, review: EventReviewRecord) -> None:
+        student_key = review.student_id.casefold()
+        _discard_from_bucket(self._reviews_by_event, review.event_id, review.id)
+        self._review_keys_by_event[review.event_id] = _with_key(
+            self._review_keys_by_event.get(review.event_id, []), remove=_review_sort_key(review)
+        )
+        _discard_from_bucket(self._reviews_by_student, student_key, review.id, drop_empty=False)
+        self._review_ids_by_event_student.pop((review.event_id, student_key), None)
+
+    def _put_waitlist_entry(self, entry: WaitlistRecord) -> None:
+        # Callers hold the event's stripe.
+        if self._index_waitlist_entry(entry):
+            self._log("waitlist", entry)
+
+    def _index_waitlist_entry(self, entry: WaitlistRecord) -> bool:
+        # Replaying an entry the snapshot already holds must not queue it twice.
+        if entry.id in self._waitlist_by_id:
+            return False
+        self._waitlist_by_id[entry.id] = entry
+        self._waitlists.setdefault(entry.event_id, []).append(entry)
+        self._waitlist_by_student.setdefault(entry.student_id.casefold(), {})[entry.event_id] = entry
+        return True
+
+    def _remove_waitlist_entry(self, entry_id: str) -> WaitlistRecord | None:
+        # Callers hold the event's stripe.
+        entry = self._waitlist_by_id.pop(entry_id, None)
+        if entry is None:
+            return None
+        queue = self._waitlists.get(entry.event_id)
+        if queue is not None:
+            queue.remove(entry)
+            if not queue:
+                del self._waitlists[entry.event_id]
+        _discard_from_bucket(self._waitlist_by_student, entry.student_id.casefold(), entry.event_id, drop_empty=False)
+        self._log("leave_waitlist", entry.id)
+        return entry
+
+    def _find_waitlist_entry(self, event_id: str, student_id: str) -> WaitlistRecord | None:
+        return self._waitlist_by_student.get(student_id.casefold(), {}).get(event_id)
+
+    def _promote_from_waitlist(self, event: EventRecord) -> RegistrationRecord | None:
+        # Callers hold the event's stripe. Students whose schedule now clashes with the event are
+        # passed over but keep their place for the next seat.
+        for entry in list(self._waitlists.get(event.id, ())):
+            if self._schedule.find(entry.student_id, event.date, event.time, exclude_event_id=event.id):
+                continue
+            existing = self._find_registration(event.id, entry.student_id)
+            if existing is not None and existing.status == "registered":
+                self._remove_waitlist_entry(entry.id)
+                continue
+            if existing is not None:
+                promoted = existing.model_copy(update={"status": "registered"})
+            else:
+                promoted = _registration_from_waitlist(entry, self.generate_registration_id(), _utcnow())
+            # Logged before the entry is dropped: a crash in between leaves a stale entry, never a lost seat.
+            self._put_registration(promoted)
+            self._remove_waitlist_entry(entry.id)
+            return promoted
+        return None
+
+    def _track_registration(self, previous: RegistrationRecord | None, current: RegistrationRecord) -> None:
+        if previous is not None:
+            self._bump_registration_stats(previous, -1)
+        self._bump_registration_stats(current, 1)
+
+    def _schedule_registration(self, previous: RegistrationRecord | None, current: RegistrationRecord) -> None:
+        event = self._events_by_id.get(current.event_id)
+        if event is None:
+            return
+        if previous is not None and previous.status == "registered":
+            self._schedule.remove(previous.student_id, previous.event_id, event.date, event.time)
+        if current.status == "registered":
+            self._schedule.add(current.student_id, current.event_id, event.date, event.time)
+
+    def _reschedule_event(self, previous: EventRecord, current: EventRecord | None) -> None:
+        # Callers hold the event's stripe. Seat count changes keep date and time, so they skip the index.
+        if current is not None and (previous.date, previous.time) == (current.date, current.time):
+            return
+        registered = self._registrations.rows(event_id=previous.id, status="registered")
+        for _, student_id in self._registrations.pairs(registered):
+            self._schedule.remove(student_id, previous.id, previous.date, previous.time)
+            if current is not None:
+                self._schedule.add(student_id, current.id, current.date, current.time)
+
+    def _bump_registration_stats(self, registration: RegistrationRecord, delta: int) -> None:
+        stats = self._registration_stats.get(registration.event_id) or EventRegistrationStatsRecord(
+            event_id=registration.event_id
+        )
+        last_registration_at = stats.last_registration_at
+        if delta > 0 and (last_registration_at is None or registration.created_at > last_registration_at):
+            last_registration_at = registration.created_at
+        field = "registered_count" if registration.status == "registered" else "cancelled_count"
+        self._registration_stats[registration.event_id] = stats.model_copy(
+            update={field: getattr(stats, field) + delta, "last_registration_at": last_registration_at}
+        )
+
+    def _track_review(self, previous: EventReviewRecord | None, current: EventReviewRecord) -> None:
+        if previous is not None:
+            self._bump_review_stats(previous, -1)
+        self._bump_review_stats(current, 1)
+
+    def _bump_review_stats(self, review: EventReviewRecord, delta: int) -> None:
+        stats = self._review_stats.get(review.event_id) or EventReviewStatsRecord(event_id=review.event_id)
+        rating_counts = list(stats.rating_counts)
+        rating_counts[review.rating - 1] += delta
+        self._review_stats[review.event_id] = stats.model_copy(
+            update={
+                "review_count": stats.review_count + delta,
+                "rating_sum": stats.rating_sum + delta * review.rating,
+                "rating_counts": tuple(rating_counts),
+            }
+        )
+
+    def stats(self) -> dict[str, object]:
+        stats: dict[str, object] = {
+            "backend": "memory",
+            "locks": {
+                "event_stripes": self._event_locks.stats.snapshot(),
+                "catalog": self._catalog_lock.stats.snapshot(),
+            },
+            "registrations": self._registrations.stats(),
+            "schedule": self._schedule.stats(),
+            "waitlist": {"events": len(self._waitlists), "entries": len(self._waitlist_by_id)},
+        }
+        journal = self._journal
+        if journal is not None:
+            stats["journal"] = {**journal.stats(), "restore_ms": round(self._restore_ms, 3)}
+        return stats
 
     def list_users(self) -> list[UserRecord]:
-        return [user.model_copy(deep=True) for user in self._users_by_id.values()]
+        return list(self._users_by_id.values())
 
     def get_user_by_id(self, user_id: str) -> UserRecord | None:
-        user = self._users_by_id.get(user_id)
-        return user.model_copy(deep=True) if user else None
+        return self._users_by_id.get(user_id)
 
     def get_user_by_username(self, username: str) -> UserRecord | None:
-        user = self._users_by_username.get(username.casefold())
-        return user.model_copy(deep=True) if user else None
+        return self._users_by_username.get(username.casefold())
 
     def get_user_by_student_id(self, student_id: str) -> UserRecord | None:
-        user = self._users_by_student_id.get(student_id.casefold())
-        return user.model_copy(deep=True) if user else None
+        return self._users_by_student_id.get(student_id.casefold())
 
     def create_user(self, user: UserRecord) -> UserRecord:
-        with self._lock:
-            saved_user = user.model_copy(deep=True)
-            self._users_by_id[saved_user.id] = saved_user
-            self._users_by_username[saved_user.username.casefold()] = saved_user
-            self._users_by_student_id[saved_user.student_id.casefold()] = saved_user
-            return saved_user.model_copy(deep=True)
-
-    def list_events(self, event_type: EventType | None = None, month: int | None = None) -> list[EventRecord]:
-        events = list(self._events_by_id.values())
-        if event_type is not None:
-            events = [event for event in events if event.type == event_type]
+        with self._catalog_lock:
+            self._put_user(user)
+            return user
+
+    def _put_user(self, user: UserRecord) -> None:
+        # Callers hold the catalog lock.
+        self._users_by_id[user.id] = user
+        self._users_by_username[user.username.casefold()] = user
+        self._users_by_student_id[user.student_id.casefold()] = user
+        self._log("user", user)
+
+    def list_events(
+        self,
+        event_type: EventType | None = None,
+        month: int | None = None,
+        with_details: bool = True,
+        limit: int | None = None,
+        after: tuple[date, str, str] | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        ends_at_from: datetime | None = None,
+        ends_at_before: datetime | None = None,
+    ) -> list[EventRecord]:
+        # Agenda and requirements already live on the record, so with_details is free here.
+        type_value = _enum_value(event_type) if event_type is not None else None
+        candidates = [self._event_keys]
+        if type_value is not None:
+            candidates.append(self._event_keys_by_type.get(type_value, []))
         if month is not None:
-            events = [event for event in events if event.date.month == month]
-        events.sort(key=lambda event: (event.date, event.time, event.id))
-        return [event.model_copy(deep=True) for event in events]
+            candidates.append(self._event_keys_by_month.get(month, []))
+        keys = min(candidates, key=len)
+
+        # ends_at lies in [date, date + 2 days) (time ranges may cross midnight), which turns the
+        # lifecycle bounds into conservative date bounds; the exact check happens per event below.
+        lower_dates = [date_from] if date_from is not None else []
+        upper_dates = [date_to] if date_to is not None else []
+        if ends_at_from is not None:
+            lower_dates.append((ends_at_from - timedelta(days=2)).date())
+        if ends_at_before is not None:
+            upper_dates.append(ends_at_before.date())
+
+        start = bisect_left(keys, (max(lower_dates),)) if lower_dates else 0
+        if after is not None:
+            start = max(start, bisect_right(keys, after))
+        end = len(keys)
+        if upper_dates and min(upper_dates) < date.max:
+            end = bisect_left(keys, (min(upper_dates) + timedelta(days=1),))
+
+        events: list[EventRecord] = []
+        for _, _, event_id in keys[start:end]:
+            event = self._events_by_id.get(event_id)
+            if event is None:
+                continue
+            if type_value is not None and event.type != type_value:
+                continue
+            if month is not None and event.date.month != month:
+                continue
+            if ends_at_from is not None and event.ends_at < ends_at_from:
+                continue
+            if ends_at_before is not None and event.ends_at >= ends_at_before:
+                continue
+            events.append(event)
+            if limit is not None and len(events) >= limit:
+                break
+        return events
 
     def get_event_by_id(self, event_id: str) -> EventRecord | None:
-        event = self._events_by_id.get(event_id)
-        return event.model_copy(deep=True) if event else None
+        return self._events_by_id.get(event_id)
+
+    def next_event_end(self, after: datetime) -> datetime | None:
+        upcoming = [event.ends_at for event in list(self._events_by_id.values()) if event.ends_at >= after]
+        return min(upcoming, default=None)
+
+    def _put_event(self, event: EventRecord) -> None:
+        # Callers hold the event's stripe.
+        previous = self._events_by_id.get(event.id)
+        self._events_by_id[event.id] = event
+        self._index_event(previous, event)
+        if previous is not None:
+            self._reschedule_event(previous, event)
+        self._log("event", event)
 
     def save_event(self, event: EventRecord) -> None:
-        with self._lock:
-            self._events_by_id[event.id] = event.model_copy(deep=True)
+        with self._event_locks.for_key(event.id):
+            self._put_event(event)
 
     def create_event(self, event: EventRecord) -> EventRecord:
-        with self._lock:
-            saved_event = event.model_copy(deep=True)
-            self._events_by_id[saved_event.id] = saved_event
-            return saved_event.model_copy(deep=True)
+        with self._event_locks.for_key(event.id):
+            self._put_event(event)
+            return event
 
     def update_event(self, event: EventRecord) -> EventRecord:
-        with self._lock:
+        with self._event_locks.for_key(event.id):
             if event.id not in self._events_by_id:
                 raise KeyError(event.id)
-            saved_event = event.model_copy(deep=True)
-            self._events_by_id[saved_event.id] = saved_event
-            return saved_event.model_copy(deep=True)
+            self._put_event(event)
+            return event
 
     def delete_event(self, event_id: str) -> bool:
-        with self._lock:
-            existing = self._events_by_id.pop(event_id, None)
-            if not existing:
-                return False
-            self._registrations_by_id = {
-                registration_id: registration
-                for registration_id, registration in self._registrations_by_id.items()
-                if registration.event_id != event_id
-            }
-            self._reviews_by_id = {
-                review_id: review
-                for review_id, review in self._reviews_by_id.items()
-                if review.event_id != event_id
-            }
-            return True
+        with self._event_locks.for_key(event_id):
+            return self._remove_event(event_id)
+
+    def _remove_event(self, event_id: str) -> bool:
+        # Callers hold the event's stripe.
+        existing = self._events_by_id.pop(event_id, None)
+        if not existing:
+            return False
+        self._index_event(existing, None)
+        self._reschedule_event(existing, None)
+        self._registrations.remove_event(event_id)
+        self._review_keys_by_event.pop(event_id, None)
+        for review in self._reviews_by_event.pop(event_id, {}).values():
+            student_key = review.student_id.casefold()
+            del self._reviews_by_id[review.id]
+            _discard_from_bucket(self._reviews_by_student, student_key, review.id, drop_empty=False)
+            self._review_ids_by_event_student.pop((event_id, student_key), None)
+        for entry in self._waitlists.pop(event_id, []):
+            del self._waitlist_by_id[entry.id]
+            _discard_from_bucket(self._waitlist_by_student, entry.student_id.casefold(), event_id, drop_empty=False)
+        self._registration_stats.pop(event_id, None)
+        self._review_stats.pop(event_id, None)
+        self._log("delete_event", event_id)
+        return True
 
     def create_registration(self, registration: RegistrationRecord) -> RegistrationRecord:
-        with self._lock:
-            saved_registration = registration.model_copy(deep=True)
-            self._registrations_by_id[saved_registration.id] = saved_registration
-            return saved_registration.model_copy(deep=True)
+        with self._event_locks.for_key(registration.event_id):
+            self._put_registration(registration)
+            return registration
 
     def update_registration(self, registration: RegistrationRecord) -> RegistrationRecord:
-        with self._lock:
-            if registration.id not in self._registrations_by_id:
+        with self._event_locks.for_key(registration.event_id):
+            if registration.id not in self._registrations:
                 raise KeyError(registration.id)
-            saved_registration = registration.model_copy(deep=True)
-            self._registrations_by_id[saved_registration.id] = saved_registration
-            return saved_registration.model_copy(deep=True)
+            self._put_registration(registration)
+            return registration
+
+    def reserve_seat(self, event_id: str, registration: RegistrationRecord) -> RegistrationRecord:
+        with self._event_locks.for_key(event_id):
+            event = self._events_by_id.get(event_id)
+            if event is None:
+                raise KeyError(event_id)
+
+            existing = self._find_registration(event_id, registration.student_id)
+            if existing and existing.status == "registered":
+                raise AlreadyRegisteredError(existing.id)
+            if event.spots <= 0:
+                raise NoSeatsAvailableError(event_id)
+
+            now = _utcnow()
+            self._put_event(event.model_copy(update={"spots": event.spots - 1, "updated_at": now}))
+            if existing:
+                # Reuse the same registration row if it was previously cancelled.
+                saved_registration = existing.model_copy(update={"status": "registered"})
+            else:
+                saved_registration = registration
+            self._put_registration(saved_registration)
+            # A seat can open up without a cancellation (an admin raising spots); the queued place is moot.
+            waiting = self._find_waitlist_entry(event_id, registration.student_id)
+            if waiting is not None:
+                self._remove_waitlist_entry(waiting.id)
+            return saved_registration
+
+    def release_seat(self, event_id: str, student_id: str, *, local_now: datetime) -> RegistrationRecord:
+        """Cancel the student's registration and free the seat.
+
+        The freed seat goes to the head of the waitlist under the same stripe, so it is never up for grabs,
+        unless the event already ended by local_now (the app-timezone clock ends_at is kept in).
+        """
+        with self._event_locks.for_key(event_id):
+            existing = self._find_registration(event_id, student_id)
+            if existing is None:
+                raise KeyError(student_id)
+            if existing.status == "cancelled":
+                raise AlreadyCancelledError(existing.id)
+
+            saved_registration = existing.model_copy(update={"status": "cancelled"})
+            self._put_registration(saved_registration)
+            event = self._events_by_id.get(event_id)
+            if event is None:
+                return saved_registration
+            promoted = self._promote_from_waitlist(event) if event.ends_at >= local_now else None
+            if promoted is None:
+                self._put_event(event.model_copy(update={"spots": event.spots + 1, "updated_at": _utcnow()}))
+            return saved_registration
+
+    def join_waitlist(self, event_id: str, entry: WaitlistRecord) -> tuple[WaitlistRecord, int]:
+        """Queue a student for a full event; returns the entry and its 1-based position.
+
+        Joining again returns the existing entry, so retries never move a student back in line.
+        """
+        with self._event_locks.for_key(event_id):
+            event = self._events_by_id.get(event_id)
+            if event is None:
+                raise KeyError(event_id)
+            registration = self._find_registration(event_id, entry.student_id)
+            if registration is not None and registration.status == "registered":
+                raise AlreadyRegisteredError(registration.id)
+
+            queued = self._find_waitlist_entry(event_id, entry.student_id)
+            if queued is None:
+                if event.spots > 0:
+                    raise SeatsAvailableError(event_id)
+                self._put_waitlist_entry(entry)
+                queued = entry
+            return queued, self._waitlists[event_id].index(queued) + 1
+
+    def get_waitlist_entry(self, event_id: str, student_id: str) -> WaitlistRecord | None:
+        return self._find_waitlist_entry(event_id, student_id)
+
+    def leave_waitlist(self, event_id: str, student_id: str) -> WaitlistRecord | None:
+        with self._event_locks.for_key(event_id):
+            queued = self._find_waitlist_entry(event_id, student_id)
+            return self._remove_waitlist_entry(queued.id) if queued is not None else None
+
+    def list_waitlist_entries_with_events(
+        self, student_id: str
+    ) -> list[tuple[WaitlistRecord, int, EventRecord | None]]:
+        """The student's waitlist entries (newest first) with their 1-based positions and their event."""
+        entries = sorted(
+            self._waitlist_by_student.get(student_id.casefold(), {}).values(),
+            key=lambda entry: (entry.created_at, entry.id),
+            reverse=True,
+        )
+        positions: list[tuple[WaitlistRecord, int, EventRecord | None]] = []
+        for entry in entries:
+            queue = self._waitlists.get(entry.event_id, [])
+            if entry in queue:
+                positions.append((entry, queue.index(entry) + 1, self._events_by_id.get(entry.event_id)))
+        return positions
 
     def generate_registration_id(self) -> str:
         return f"reg_{uuid4().hex[:16]}"
@@ -134,85 +762,157 @@ class InMemoryStore:
     def generate_event_id(self) -> str:
         return f"evt_{uuid4().hex[:16]}"
 
+    def generate_waitlist_id(self) -> str:
+        return f"wtl_{uuid4().hex[:16]}"
+
+    def _find_registration(self, event_id: str, student_id: str) -> RegistrationRecord | None:
+        return self._registrations.find(event_id, student_id)
+
     def has_registration_for_student(self, event_id: str, student_id: str) -> bool:
-        student_key = student_id.casefold()
-        return any(
-            registration.event_id == event_id
-            and registration.student_id.casefold() == student_key
-            and registration.status == "registered"
-            for registration in self._registrations_by_id.values()
-        )
+        return self._registrations.is_registered(event_id, student_id)
 
     def get_registration_by_event_and_student(self, event_id: str, student_id: str) -> RegistrationRecord | None:
-        student_key = student_id.casefold()
-        for registration in self._registrations_by_id.values():
-            if registration.event_id == event_id and registration.student_id.casefold() == student_key:
-                return registration.model_copy(deep=True)
-        return None
+        return self._find_registration(event_id, student_id)
 
     def list_registrations(
         self,
         event_id: str | None = None,
         student_id: str | None = None,
+        limit: int | None = None,
+        after: tuple[datetime, str] | None = None,
     ) -> list[RegistrationRecord]:
-        records = list(self._registrations_by_id.values())
-        if event_id is not None:
-            records = [record for record in records if record.event_id == event_id]
-        if student_id is not None:
-            student_key = student_id.casefold()
-            records = [record for record in records if record.student_id.casefold() == student_key]
-        records.sort(key=lambda item: item.created_at, reverse=True)
-        return [record.model_copy(deep=True) for record in records]
+        rows = self._registrations.rows(event_id=event_id, student_id=student_id)
+        return self._registrations.page(rows, after, limit)
+
+    def find_conflicts(
+        self, student_id: str, event_date: date, event_time: str, exclude_event_id: str | None = None
+    ) -> list[str]:
+        """Events the student is registered to on event_date whose time clashes with event_time."""
+        return self._schedule.find(student_id, event_date, event_time, exclude_event_id)
+
+    def list_registrations_with_events(
+        self,
+        student_id: str | None = None,
+        status: RegistrationStatus | None = None,
+        event_date: date | None = None,
+    ) -> list[tuple[RegistrationRecord, EventRecord | None]]:
+        """Registrations (newest first) paired with their event; None when the event no longer exists."""
+        rows = self._registrations.rows(student_id=student_id, status=status)
+        pairs: list[tuple[RegistrationRecord, EventRecord | None]] = []
+        for registration in self._registrations.page(rows, None, None):
+            event = self._events_by_id.get(registration.event_id)
+            if event_date is not None and (event is None or event.date != event_date):
+                continue
+            pairs.append((registration, event))
+        return pairs
 
     def count_registrations_created_since(self, since: datetime) -> int:
-        return sum(1 for registration in self._registrations_by_id.values() if registration.created_at >= since)
+        return self._registrations.count_created_since(since)
+
+    def list_registration_stats(self) -> list[EventRegistrationStatsRecord]:
+        return list(self._registration_stats.values())
+
+    def get_review_stats(self, event_id: str) -> EventReviewStatsRecord | None:
+        return self._review_stats.get(event_id)
+
+    def list_review_stats(self, event_ids: list[str] | None = None) -> list[EventReviewStatsRecord]:
+        if event_ids is None:
+            return list(self._review_stats.values())
+        return [self._review_stats[event_id] for event_id in event_ids if event_id in self._review_stats]
 
     def create_review(self, review: EventReviewRecord) -> EventReviewRecord:
-        with self._lock:
-            saved_review = review.model_copy(deep=True)
-            self._reviews_by_id[saved_review.id] = saved_review
-            return saved_review.model_copy(deep=True)
+        with self._event_locks.for_key(review.event_id):
+            self._put_review(review)
+            return review
 
     def update_review(self, review: EventReviewRecord) -> EventReviewRecord:
-        with self._lock:
+        with self._event_locks.for_key(review.event_id):
             if review.id not in self._reviews_by_id:
                 raise KeyError(review.id)
-            saved_review = review.model_copy(deep=True)
-            self._reviews_by_id[saved_review.id] = saved_review
-            return saved_review.model_copy(deep=True)
+            self._put_review(review)
+            return review
 
     def generate_review_id(self) -> str:
         return f"rev_{uuid4().hex[:16]}"
 
     def get_review_by_event_and_student(self, event_id: str, student_id: str) -> EventReviewRecord | None:
-        student_key = student_id.casefold()
-        for review in self._reviews_by_id.values():
-            if review.event_id == event_id and review.student_id.casefold() == student_key:
-                return review.model_copy(deep=True)
-        return None
+        review_id = self._review_ids_by_event_student.get((event_id, student_id.casefold()))
+        return self._reviews_by_id.get(review_id) if review_id else None
 
     def list_reviews(
         self,
         event_id: str | None = None,
         student_id: str | None = None,
+        limit: int | None = None,
+        after: tuple[datetime, datetime, str] | None = None,
     ) -> list[EventReviewRecord]:
-        records = list(self._reviews_by_id.values())
-        if event_id is not None:
-            records = [record for record in records if record.event_id == event_id]
-        if student_id is not None:
-            student_key = student_id.casefold()
-            records = [record for record in records if record.student_id.casefold() == student_key]
-        records.sort(key=lambda item: (item.updated_at, item.created_at), reverse=True)
-        return [record.model_copy(deep=True) for record in records]
+        if event_id is not None and student_id is not None:
+            review = self.get_review_by_event_and_student(event_id, student_id)
+            records = [review] if review else []
+        elif event_id is not None:
+            # Newest first: walk the event's sorted keys backwards from the cursor.
+            keys = self._review_keys_by_event.get(event_id, [])
+            end = len(keys) if after is None else bisect_left(keys, after)
+            start = 0 if limit is None else max(0, end - limit)
+            reviews = (self._reviews_by_id.get(review_id) for _, _, review_id in reversed(keys[start:end]))
+            return [review for review in reviews if review is not None]
+        elif student_id is not None:
+            records = list(self._reviews_by_student.get(student_id.casefold(), {}).values())
+        else:
+            records = list(self._reviews_by_id.values())
+        return _keyset_page(
+            records,
+            _review_sort_key,
+            after,
+            limit,
+            descending=True,
+        )
 
 
 class SqliteStore:
-    def __init__(self, db_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        pool_size: int | None = None,
+        profile_name: str | None = None,
+        write_batching: bool | None = None,
+    ) -> None:
         self._db_path = db_path or get_db_path()
-        self._lock = Lock()
+        # SQLite admits one writer per database file however the rows are partitioned, so writes share
+        # a single gate instead of lock stripes; queueing here is cheaper than spinning on busy_timeout.
+        self._lock = TimedLock()
+        self._pool = ConnectionPool(self._db_path, max_size=pool_size, profile_name=profile_name)
+        if write_batching is None:
+            write_batching = write_batching_enabled()
+        self._batcher = WriteBatcher(self._db_path, profile_name=profile_name) if write_batching else None
 
     def _conn(self):
-        return get_connection(self._db_path)
+        return self._pool.connection()
+
+    def _write(self, apply):
+        # apply(connection) runs inside a write transaction and must not commit itself.
+        if self._batcher is not None:
+            return self._batcher.submit(apply)
+        with self._lock:
+            with self._conn() as connection:
+                connection.execute("BEGIN IMMEDIATE")
+                return apply(connection)
+
+    def close(self) -> None:
+        if self._batcher is not None:
+            self._batcher.close()
+        self._pool.close()
+
+    def stats(self) -> dict[str, object]:
+        with self._conn() as connection:
+            pragmas = describe_connection_profile(connection)
+        return {
+            "backend": "sqlite",
+            "profile": {"name": self._pool.profile_name, **pragmas},
+            "pool": self._pool.stats(),
+            "write_batcher": self._batcher.stats() if self._batcher is not None else None,
+            "locks": {"writer": self._lock.stats.snapshot()},
+        }
 
     @staticmethod
     def _row_to_user(row) -> UserRecord:
@@ -231,20 +931,30 @@ class SqliteStore:
         )
 
     @staticmethod
-    def _event_text_items(connection, table_name: str, event_id: str) -> list[str]:
+    def _event_text_items(connection, table_name: str, event_ids: list[str]) -> dict[str, list[str]]:
         if table_name not in {"event_agenda_items", "event_requirements"}:
             raise ValueError("Invalid event table name")
+        items_by_event: dict[str, list[str]] = {event_id: [] for event_id in event_ids}
+        if not event_ids:
+            return items_by_event
+        # One query per child table for the whole batch; json_each avoids SQLite's bound-parameter limit.
         rows = connection.execute(
-            f"SELECT description FROM {table_name} WHERE event_id = ? ORDER BY item_order ASC",
-            (event_id,),
+            f"""
+            SELECT event_id, description
+            FROM {table_name}
+            WHERE event_id IN (SELECT value FROM json_each(?))
+            ORDER BY event_id ASC, item_order ASC
+            """,
+            (json.dumps(event_ids),),
         ).fetchall()
-        return [row["description"] for row in rows]
+        for row in rows:
+            items_by_event[row["event_id"]].append(row["description"])
+        return items_by_event
 
-    @classmethod
-    def _row_to_event(cls, connection, row) -> EventRecord:
-        event_id = row["id"]
+    @staticmethod
+    def _row_to_event(row, agenda: list[str], requirements: list[str]) -> EventRecord:
         return EventRecord(
-            id=event_id,
+            id=row["id"],
             image=row["image"],
             name=row["name"],
             date=_to_date(row["event_date"]),
@@ -254,12 +964,27 @@ class SqliteStore:
             spots=row["spots"],
             type=row["event_type"],
             summary=row["summary"],
-            agenda=cls._event_text_items(connection, "event_agenda_items", event_id),
-            requirements=cls._event_text_items(connection, "event_requirements", event_id),
+            agenda=agenda,
+            requirements=requirements,
             created_at=_to_datetime(row["created_at"]),
             updated_at=_to_datetime(row["updated_at"]),
+            starts_at=_to_datetime(row["starts_at"]) if row["starts_at"] else None,
+            ends_at=_to_datetime(row["ends_at"]) if row["ends_at"] else None,
         )
 
+    @classmethod
+    def _rows_to_events(cls, connection, rows, with_details: bool = True) -> list[EventRecord]:
+        if not with_details:
+            return [cls._row_to_event(row, agenda=[], requirements=[]) for row in rows]
+
+        event_ids = [row["id"] for row in rows]
+        agenda_by_event = cls._event_text_items(connection, "event_agenda_items", event_ids)
+        requirements_by_event = cls._event_text_items(connection, "event_requirements", event_ids)
+        return [
+            cls._row_to_event(row, agenda_by_event[row["id"]], requirements_by_event[row["id"]])
+            for row in rows
+        ]
+
     @staticmethod
     def _row_to_registration(row) -> RegistrationRecord:
         return RegistrationRecord(
@@ -274,6 +999,19 @@ class SqliteStore:
             created_at=_to_datetime(row["created_at"]),
         )
 
+    @staticmethod
+    def _row_to_waitlist_entry(row) -> WaitlistRecord:
+        return WaitlistRecord(
+            id=row["id"],
+            event_id=row["event_id"],
+            first_name=row["first_name"],
+            last_name=row["last_name"],
+            student_id=row["student_id"],
+            career=row["career"],
+            semester=row["semester"],
+            created_at=_to_datetime(row["created_at"]),
+        )
+
     @staticmethod
     def _row_to_review(row) -> EventReviewRecord:
         return EventReviewRecord(
@@ -315,7 +1053,7 @@ class SqliteStore:
                                 user.username,
                                 user.first_name,
                                 user.last_name,
-                                user.student_id,
+                                _student_key(user.student_id),
                                 user.career,
                                 user.semester,
                                 _enum_value(user.role),
@@ -335,10 +1073,10 @@ class SqliteStore:
                             SELECT id
                             FROM users
                             WHERE username = ? COLLATE NOCASE
-                               OR student_id = ? COLLATE NOCASE
+                               OR student_id = ?
                             LIMIT 1
                             """,
-                            (admin_seed.username, admin_seed.student_id),
+                            (admin_seed.username, _student_key(admin_seed.student_id)),
                         ).fetchone()
                         if existing:
                             connection.execute(
@@ -376,7 +1114,7 @@ class SqliteStore:
                                     admin_seed.username,
                                     admin_seed.first_name,
                                     admin_seed.last_name,
-                                    admin_seed.student_id,
+                                    _student_key(admin_seed.student_id),
                                     admin_seed.career,
                                     admin_seed.semester,
                                     _enum_value(admin_seed.role),
@@ -393,9 +1131,9 @@ class SqliteStore:
                             """
                             INSERT INTO events (
                                 id, image, name, event_date, event_time, place, location, spots, event_type,
-                                summary, is_active, created_at, updated_at
+                                summary, is_active, created_at, updated_at, starts_at, ends_at
                             )
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                             """,
                             (
                                 event.id,
@@ -411,6 +1149,8 @@ class SqliteStore:
                                 1,
                                 self._format_datetime(event.created_at),
                                 self._format_datetime(event.updated_at),
+                                self._format_datetime(event.starts_at),
+                                self._format_datetime(event.ends_at),
                             ),
                         )
 
@@ -455,55 +1195,85 @@ class SqliteStore:
     def get_user_by_student_id(self, student_id: str) -> UserRecord | None:
         with self._conn() as connection:
             row = connection.execute(
-                "SELECT * FROM users WHERE student_id = ? COLLATE NOCASE LIMIT 1",
-                (student_id,),
+                "SELECT * FROM users WHERE student_id = ? LIMIT 1",
+                (_student_key(student_id),),
             ).fetchone()
         return self._row_to_user(row) if row else None
 
     def create_user(self, user: UserRecord) -> UserRecord:
-        with self._lock:
-            with self._conn() as connection:
-                created_at = self._format_datetime(user.created_at)
-                connection.execute(
-                    """
-                    INSERT INTO users (
-                        id, username, first_name, last_name, student_id, career, semester, role,
-                        password_hash, is_active, created_at, updated_at
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        user.id,
-                        user.username,
-                        user.first_name,
-                        user.last_name,
-                        user.student_id,
-                        user.career,
-                        user.semester,
-                        _enum_value(user.role),
-                        user.password_hash,
-                        int(user.is_active),
-                        created_at,
-                        created_at,
-                    ),
+        def apply(connection) -> None:
+            created_at = self._format_datetime(user.created_at)
+            connection.execute(
+                """
+                INSERT INTO users (
+                    id, username, first_name, last_name, student_id, career, semester, role,
+                    password_hash, is_active, created_at, updated_at
                 )
-                connection.commit()
-        return user.model_copy(deep=True)
-
-    def list_events(self, event_type: EventType | None = None, month: int | None = None) -> list[EventRecord]:
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    user.id,
+                    user.username,
+                    user.first_name,
+                    user.last_name,
+                    _student_key(user.student_id),
+                    user.career,
+                    user.semester,
+                    _enum_value(user.role),
+                    user.password_hash,
+                    int(user.is_active),
+                    created_at,
+                    created_at,
+                ),
+            )
+
+        self._write(apply)
+        return user
+
+    def list_events(
+        self,
+        event_type: EventType | None = None,
+        month: int | None = None,
+        with_details: bool = True,
+        limit: int | None = None,
+        after: tuple[date, str, str] | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        ends_at_from: datetime | None = None,
+        ends_at_before: datetime | None = None,
+    ) -> list[EventRecord]:
         query = "SELECT * FROM events WHERE is_active = 1"
         params: list[object] = []
         if event_type is not None:
             query += " AND event_type = ?"
             params.append(_enum_value(event_type))
         if month is not None:
+            # Matches the idx_events_month expression index.
             query += " AND CAST(strftime('%m', event_date) AS INTEGER) = ?"
             params.append(month)
+        if date_from is not None:
+            query += " AND event_date >= ?"
+            params.append(date_from.isoformat())
+        if date_to is not None:
+            query += " AND event_date <= ?"
+            params.append(date_to.isoformat())
+        if ends_at_from is not None:
+            query += " AND ends_at >= ?"
+            params.append(self._format_datetime(ends_at_from))
+        if ends_at_before is not None:
+            query += " AND ends_at < ?"
+            params.append(self._format_datetime(ends_at_before))
+        if after is not None:
+            query += " AND (event_date, event_time, id) > (?, ?, ?)"
+            params.extend([after[0].isoformat(), after[1], after[2]])
         query += " ORDER BY event_date ASC, event_time ASC, id ASC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
 
         with self._conn() as connection:
             rows = connection.execute(query, tuple(params)).fetchall()
-            return [self._row_to_event(connection, row) for row in rows]
+            return self._rows_to_events(connection, rows, with_details=with_details)
 
     def get_event_by_id(self, event_id: str) -> EventRecord | None:
         with self._conn() as connection:
@@ -513,224 +1283,512 @@ class SqliteStore:
             ).fetchone()
             if not row:
                 return None
-            return self._row_to_event(connection, row)
+            return self._rows_to_events(connection, [row])[0]
+
+    def next_event_end(self, after: datetime) -> datetime | None:
+        with self._conn() as connection:
+            row = connection.execute(
+                "SELECT MIN(ends_at) AS next_end FROM events WHERE is_active = 1 AND ends_at >= ?",
+                (self._format_datetime(after),),
+            ).fetchone()
+        return _to_datetime(row["next_end"]) if row["next_end"] else None
 
     def save_event(self, event: EventRecord) -> None:
-        with self._lock:
-            with self._conn() as connection:
+        def apply(connection) -> None:
+            connection.execute(
+                """
+                UPDATE events
+                SET
+                    image = ?,
+                    name = ?,
+                    event_date = ?,
+                    event_time = ?,
+                    place = ?,
+                    location = ?,
+                    spots = ?,
+                    event_type = ?,
+                    summary = ?,
+                    is_active = ?,
+                    updated_at = ?,
+                    starts_at = ?,
+                    ends_at = ?
+                WHERE id = ?
+                """,
+                (
+                    event.image,
+                    event.name,
+                    event.date.isoformat(),
+                    event.time,
+                    event.place,
+                    event.location,
+                    event.spots,
+                    _enum_value(event.type),
+                    event.summary,
+                    1,
+                    self._format_datetime(event.updated_at),
+                    self._format_datetime(event.starts_at),
+                    self._format_datetime(event.ends_at),
+                    event.id,
+                ),
+            )
+
+        self._write(apply)
+
+    def create_event(self, event: EventRecord) -> EventRecord:
+        def apply(connection) -> None:
+            connection.execute(
+                """
+                INSERT INTO events (
+                    id, image, name, event_date, event_time, place, location, spots, event_type,
+                    summary, is_active, created_at, updated_at, starts_at, ends_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    event.id,
+                    event.image,
+                    event.name,
+                    event.date.isoformat(),
+                    event.time,
+                    event.place,
+                    event.location,
+                    event.spots,
+                    _enum_value(event.type),
+                    event.summary,
+                    1,
+                    self._format_datetime(event.created_at),
+                    self._format_datetime(event.updated_at),
+                    self._format_datetime(event.starts_at),
+                    self._format_datetime(event.ends_at),
+                ),
+            )
+
+            for index, item in enumerate(event.agenda, start=1):
                 connection.execute(
                     """
-                    UPDATE events
-                    SET
-                        image = ?,
-                        name = ?,
-                        event_date = ?,
-                        event_time = ?,
-                        place = ?,
-                        location = ?,
-                        spots = ?,
-                        event_type = ?,
-                        summary = ?,
-                        is_active = ?,
-                        updated_at = ?
-                    WHERE id = ?
+                    INSERT INTO event_agenda_items (event_id, item_order, description)
+                    VALUES (?, ?, ?)
                     """,
-                    (
-                        event.image,
-                        event.name,
-                        event.date.isoformat(),
-                        event.time,
-                        event.place,
-                        event.location,
-                        event.spots,
-                        _enum_value(event.type),
-                        event.summary,
-                        1,
-                        self._format_datetime(event.updated_at),
-                        event.id,
-                    ),
+                    (event.id, index, item),
                 )
-                connection.commit()
 
-    def create_event(self, event: EventRecord) -> EventRecord:
-        with self._lock:
-            with self._conn() as connection:
+            for index, item in enumerate(event.requirements, start=1):
                 connection.execute(
                     """
-                    INSERT INTO events (
-                        id, image, name, event_date, event_time, place, location, spots, event_type,
-                        summary, is_active, created_at, updated_at
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    INSERT INTO event_requirements (event_id, item_order, description)
+                    VALUES (?, ?, ?)
                     """,
-                    (
-                        event.id,
-                        event.image,
-                        event.name,
-                        event.date.isoformat(),
-                        event.time,
-                        event.place,
-                        event.location,
-                        event.spots,
-                        _enum_value(event.type),
-                        event.summary,
-                        1,
-                        self._format_datetime(event.created_at),
-                        self._format_datetime(event.updated_at),
-                    ),
+                    (event.id, index, item),
                 )
 
-                for index, item in enumerate(event.agenda, start=1):
-                    connection.execute(
-                        """
-                        INSERT INTO event_agenda_items (event_id, item_order, description)
-                        VALUES (?, ?, ?)
-                        """,
-                        (event.id, index, item),
-                    )
-
-                for index, item in enumerate(event.requirements, start=1):
-                    connection.execute(
-                        """
-                        INSERT INTO event_requirements (event_id, item_order, description)
-                        VALUES (?, ?, ?)
-                        """,
-                        (event.id, index, item),
-                    )
-                connection.commit()
-        return event.model_copy(deep=True)
+        self._write(apply)
+        return event
 
     def update_event(self, event: EventRecord) -> EventRecord:
-        with self._lock:
-            with self._conn() as connection:
-                row = connection.execute(
+        def apply(connection) -> None:
+            row = connection.execute(
+                "SELECT 1 FROM events WHERE id = ? AND is_active = 1 LIMIT 1",
+                (event.id,),
+            ).fetchone()
+            if row is None:
+                raise KeyError(event.id)
+
+            connection.execute(
+                """
+                UPDATE events
+                SET
+                    image = ?,
+                    name = ?,
+                    event_date = ?,
+                    event_time = ?,
+                    place = ?,
+                    location = ?,
+                    spots = ?,
+                    event_type = ?,
+                    summary = ?,
+                    updated_at = ?,
+                    starts_at = ?,
+                    ends_at = ?
+                WHERE id = ?
+                """,
+                (
+                    event.image,
+                    event.name,
+                    event.date.isoformat(),
+                    event.time,
+                    event.place,
+                    event.location,
+                    event.spots,
+                    _enum_value(event.type),
+                    event.summary,
+                    self._format_datetime(event.updated_at),
+                    self._format_datetime(event.starts_at),
+                    self._format_datetime(event.ends_at),
+                    event.id,
+                ),
+            )
+
+            self._replace_event_text_items(connection, "event_agenda_items", event.id, event.agenda)
+            self._replace_event_text_items(connection, "event_requirements", event.id, event.requirements)
+
+        self._write(apply)
+        return event
+
+    @staticmethod
+    def _replace_event_text_items(connection, table_name: str, event_id: str, items: tuple[str, ...]) -> None:
+        # Most edits leave agenda and requirements untouched; skipping the delete/reinsert keeps the
+        # write transaction (and the writer gate) short.
+        if table_name not in {"event_agenda_items", "event_requirements"}:
+            raise ValueError("Invalid event table name")
+        current = connection.execute(
+            f"SELECT description FROM {table_name} WHERE event_id = ? ORDER BY item_order ASC",
+            (event_id,),
+        ).fetchall()
+        if [row["description"] for row in current] == list(items):
+            return
+        connection.execute(f"DELETE FROM {table_name} WHERE event_id = ?", (event_id,))
+        connection.executemany(
+            f"INSERT INTO {table_name} (event_id, item_order, description) VALUES (?, ?, ?)",
+            [(event_id, index, item) for index, item in enumerate(items, start=1)],
+        )
+
+    def delete_event(self, event_id: str) -> bool:
+        def apply(connection) -> int:
+            return connection.execute("DELETE FROM events WHERE id = ?", (event_id,)).rowcount
+
+        deleted = self._write(apply)
+        return deleted > 0
+
+    def create_registration(self, registration: RegistrationRecord) -> RegistrationRecord:
+        def apply(connection) -> None:
+            created_at = self._format_datetime(registration.created_at)
+            connection.execute(
+                """
+                INSERT INTO event_registrations (
+                    id, event_id, first_name, last_name, student_id, career, semester,
+                    status, created_at, updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    registration.id,
+                    registration.event_id,
+                    registration.first_name,
+                    registration.last_name,
+                    _student_key(registration.student_id),
+                    registration.career,
+                    registration.semester,
+                    _enum_value(registration.status),
+                    created_at,
+                    created_at,
+                ),
+            )
+
+        self._write(apply)
+        return registration
+
+    def update_registration(self, registration: RegistrationRecord) -> RegistrationRecord:
+        def apply(connection) -> None:
+            updated_at = self._format_datetime(_utcnow())
+            updated = connection.execute(
+                """
+                UPDATE event_registrations
+                SET
+                    first_name = ?,
+                    last_name = ?,
+                    student_id = ?,
+                    career = ?,
+                    semester = ?,
+                    status = ?,
+                    updated_at = ?
+                WHERE id = ?
+                """,
+                (
+                    registration.first_name,
+                    registration.last_name,
+                    _student_key(registration.student_id),
+                    registration.career,
+                    registration.semester,
+                    _enum_value(registration.status),
+                    updated_at,
+                    registration.id,
+                ),
+            ).rowcount
+            if updated == 0:
+                raise KeyError(registration.id)
+
+        self._write(apply)
+        return registration
+
+    def reserve_seat(self, event_id: str, registration: RegistrationRecord) -> RegistrationRecord:
+        # _write runs this inside BEGIN IMMEDIATE, so the spot check and the insert/reactivation are
+        # atomic across processes, not only across threads of this worker.
+        def apply(connection) -> RegistrationRecord:
+            now = self._format_datetime(_utcnow())
+            existing = connection.execute(
+                "SELECT * FROM event_registrations WHERE event_id = ? AND student_id = ? LIMIT 1",
+                (event_id, _student_key(registration.student_id)),
+            ).fetchone()
+            if existing and existing["status"] == "registered":
+                raise AlreadyRegisteredError(existing["id"])
+
+            reserved = connection.execute(
+                """
+                UPDATE events
+                SET spots = spots - 1, updated_at = ?
+                WHERE id = ? AND is_active = 1 AND spots > 0
+                """,
+                (now, event_id),
+            ).rowcount
+            if reserved == 0:
+                event_row = connection.execute(
                     "SELECT 1 FROM events WHERE id = ? AND is_active = 1 LIMIT 1",
-                    (event.id,),
+                    (event_id,),
                 ).fetchone()
-                if row is None:
-                    raise KeyError(event.id)
-
+                if event_row is None:
+                    raise KeyError(event_id)
+                raise NoSeatsAvailableError(event_id)
+
+            # A seat can open up without a cancellation (an admin raising spots); the queued place is moot.
+            connection.execute(
+                "DELETE FROM event_waitlist WHERE event_id = ? AND student_id = ?",
+                (event_id, _student_key(registration.student_id)),
+            )
+            if existing:
+                # Reuse the same registration row if it was previously cancelled.
                 connection.execute(
-                    """
-                    UPDATE events
-                    SET
-                        image = ?,
-                        name = ?,
-                        event_date = ?,
-                        event_time = ?,
-                        place = ?,
-                        location = ?,
-                        spots = ?,
-                        event_type = ?,
-                        summary = ?,
-                        updated_at = ?
-                    WHERE id = ?
-                    """,
-                    (
-                        event.image,
-                        event.name,
-                        event.date.isoformat(),
-                        event.time,
-                        event.place,
-                        event.location,
-                        event.spots,
-                        _enum_value(event.type),
-                        event.summary,
-                        self._format_datetime(event.updated_at),
-                        event.id,
-                    ),
+                    "UPDATE event_registrations SET status = 'registered', updated_at = ? WHERE id = ?",
+                    (now, existing["id"]),
                 )
+                return self._row_to_registration(existing).model_copy(update={"status": "registered"})
 
-                connection.execute("DELETE FROM event_agenda_items WHERE event_id = ?", (event.id,))
-                connection.execute("DELETE FROM event_requirements WHERE event_id = ?", (event.id,))
+            connection.execute(
+                """
+                INSERT INTO event_registrations (
+                    id, event_id, first_name, last_name, student_id, career, semester,
+                    status, created_at, updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    registration.id,
+                    event_id,
+                    registration.first_name,
+                    registration.last_name,
+                    _student_key(registration.student_id),
+                    registration.career,
+                    registration.semester,
+                    "registered",
+                    self._format_datetime(registration.created_at),
+                    now,
+                ),
+            )
+            return registration
+
+        return self._write(apply)
+
+    def release_seat(self, event_id: str, student_id: str, *, local_now: datetime) -> RegistrationRecord:
+        """Cancel the student's registration and free the seat (see InMemoryStore.release_seat)."""
+        ends_after = self._format_datetime(local_now)
+
+        def apply(connection) -> RegistrationRecord:
+            now = self._format_datetime(_utcnow())
+            existing = connection.execute(
+                "SELECT * FROM event_registrations WHERE event_id = ? AND student_id = ? LIMIT 1",
+                (event_id, _student_key(student_id)),
+            ).fetchone()
+            if existing is None:
+                raise KeyError(student_id)
+            if existing["status"] == "cancelled":
+                raise AlreadyCancelledError(existing["id"])
+
+            connection.execute(
+                "UPDATE event_registrations SET status = 'cancelled', updated_at = ? WHERE id = ?",
+                (now, existing["id"]),
+            )
+            # Same transaction: the freed seat goes to the head of the waitlist, or back to the event.
+            if self._promote_from_waitlist(connection, event_id, now, ends_after) is None:
+                connection.execute(
+                    "UPDATE events SET spots = spots + 1, updated_at = ? WHERE id = ?",
+                    (now, event_id),
+                )
+            return self._row_to_registration(existing).model_copy(update={"status": "cancelled"})
+
+        return self._write(apply)
+
+    def _promote_from_waitlist(
+        self, connection, event_id: str, now: str, ends_after: str
+    ) -> RegistrationRecord | None:
+        # Nobody is promoted into an event that already ended. Students whose schedule now clashes with
+        # the event are passed over but keep their place.
+        event = connection.execute(
+            "SELECT event_date, event_time FROM events WHERE id = ? AND is_active = 1 AND ends_at >= ?",
+            (event_id, ends_after),
+        ).fetchone()
+        if event is None:
+            return None
+        queue = connection.execute(
+            "SELECT * FROM event_waitlist WHERE event_id = ? ORDER BY created_at ASC, id ASC",
+            (event_id,),
+        ).fetchall()
+        event_date = _to_date(event["event_date"])
+        for row in queue:
+            entry = self._row_to_waitlist_entry(row)
+            if self._find_conflicts(connection, entry.student_id, event_date, event["event_time"], event_id):
+                continue
+            connection.execute("DELETE FROM event_waitlist WHERE id = ?", (entry.id,))
+            existing = connection.execute(
+                "SELECT * FROM event_registrations WHERE event_id = ? AND student_id = ? LIMIT 1",
+                (event_id, entry.student_id),
+            ).fetchone()
+            if existing is not None and existing["status"] == "registered":
+                continue
+            if existing is not None:
+                connection.execute(
+                    "UPDATE event_registrations SET status = 'registered', updated_at = ? WHERE id = ?",
+                    (now, existing["id"]),
+                )
+                return self._row_to_registration(existing).model_copy(update={"status": "registered"})
+            promoted = _registration_from_waitlist(entry, self.generate_registration_id(), _to_datetime(now))
+            connection.execute(
+                """
+                INSERT INTO event_registrations (
+                    id, event_id, first_name, last_name, student_id, career, semester,
+                    status, created_at, updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, 'registered', ?, ?)
+                """,
+                (
+                    promoted.id,
+                    event_id,
+                    promoted.first_name,
+                    promoted.last_name,
+                    promoted.student_id,
+                    promoted.career,
+                    promoted.semester,
+                    now,
+                    now,
+                ),
+            )
+            return promoted
+        return None
 
-                for index, item in enumerate(event.agenda, start=1):
-                    connection.execute(
-                        """
-                        INSERT INTO event_agenda_items (event_id, item_order, description)
-                        VALUES (?, ?, ?)
-                        """,
-                        (event.id, index, item),
-                    )
+    def join_waitlist(self, event_id: str, entry: WaitlistRecord) -> tuple[WaitlistRecord, int]:
+        """Queue a student for a full event; returns the entry and its 1-based position.
 
-                for index, item in enumerate(event.requirements, start=1):
-                    connection.execute(
-                        """
-                        INSERT INTO event_requirements (event_id, item_order, description)
-                        VALUES (?, ?, ?)
-                        """,
-                        (event.id, index, item),
-                    )
-                connection.commit()
-        return event.model_copy(deep=True)
+        Joining again returns the existing entry, so retries never move a student back in line.
+        """
 
-    def delete_event(self, event_id: str) -> bool:
-        with self._lock:
-            with self._conn() as connection:
-                deleted = connection.execute("DELETE FROM events WHERE id = ?", (event_id,)).rowcount
-                connection.commit()
-        return deleted > 0
+        def apply(connection) -> tuple[WaitlistRecord, int]:
+            student_key = _student_key(entry.student_id)
+            event = connection.execute(
+                "SELECT spots FROM events WHERE id = ? AND is_active = 1",
+                (event_id,),
+            ).fetchone()
+            if event is None:
+                raise KeyError(event_id)
+            registration = connection.execute(
+                "SELECT id FROM event_registrations WHERE event_id = ? AND student_id = ? AND status = 'registered'",
+                (event_id, student_key),
+            ).fetchone()
+            if registration is not None:
+                raise AlreadyRegisteredError(registration["id"])
 
-    def create_registration(self, registration: RegistrationRecord) -> RegistrationRecord:
-        with self._lock:
-            with self._conn() as connection:
-                created_at = self._format_datetime(registration.created_at)
+            queued_row = connection.execute(
+                "SELECT * FROM event_waitlist WHERE event_id = ? AND student_id = ?",
+                (event_id, student_key),
+            ).fetchone()
+            if queued_row is not None:
+                queued = self._row_to_waitlist_entry(queued_row)
+                queued_at = queued_row["created_at"]
+            else:
+                if event["spots"] > 0:
+                    raise SeatsAvailableError(event_id)
+                queued = entry.model_copy(update={"event_id": event_id, "student_id": student_key})
+                # Microseconds, unlike other timestamps: joins within the same second must keep their order.
+                queued_at = queued.created_at.isoformat(sep=" ", timespec="microseconds")
                 connection.execute(
                     """
-                    INSERT INTO event_registrations (
-                        id, event_id, first_name, last_name, student_id, career, semester,
-                        status, created_at, updated_at
+                    INSERT INTO event_waitlist (
+                        id, event_id, first_name, last_name, student_id, career, semester, created_at
                     )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                     """,
                     (
-                        registration.id,
-                        registration.event_id,
-                        registration.first_name,
-                        registration.last_name,
-                        registration.student_id,
-                        registration.career,
-                        registration.semester,
-                        _enum_value(registration.status),
-                        created_at,
-                        created_at,
+                        queued.id,
+                        event_id,
+                        queued.first_name,
+                        queued.last_name,
+                        student_key,
+                        queued.career,
+                        queued.semester,
+                        queued_at,
                     ),
                 )
-                connection.commit()
-        return registration.model_copy(deep=True)
+            position = connection.execute(
+                """
+                SELECT COUNT(*) AS position FROM event_waitlist
+                WHERE event_id = ? AND (created_at, id) <= (?, ?)
+                """,
+                (event_id, queued_at, queued.id),
+            ).fetchone()["position"]
+            return queued, int(position)
 
-    def update_registration(self, registration: RegistrationRecord) -> RegistrationRecord:
-        with self._lock:
-            with self._conn() as connection:
-                updated_at = self._format_datetime(datetime.utcnow())
-                updated = connection.execute(
-                    """
-                    UPDATE event_registrations
-                    SET
-                        first_name = ?,
-                        last_name = ?,
-                        student_id = ?,
-                        career = ?,
-                        semester = ?,
-                        status = ?,
-                        updated_at = ?
-                    WHERE id = ?
-                    """,
-                    (
-                        registration.first_name,
-                        registration.last_name,
-                        registration.student_id,
-                        registration.career,
-                        registration.semester,
-                        _enum_value(registration.status),
-                        updated_at,
-                        registration.id,
-                    ),
-                ).rowcount
-                if updated == 0:
-                    raise KeyError(registration.id)
-                connection.commit()
-        return registration.model_copy(deep=True)
+        return self._write(apply)
+
+    def get_waitlist_entry(self, event_id: str, student_id: str) -> WaitlistRecord | None:
+        with self._conn() as connection:
+            row = connection.execute(
+                "SELECT * FROM event_waitlist WHERE event_id = ? AND student_id = ?",
+                (event_id, _student_key(student_id)),
+            ).fetchone()
+        return self._row_to_waitlist_entry(row) if row is not None else None
+
+    def leave_waitlist(self, event_id: str, student_id: str) -> WaitlistRecord | None:
+        def apply(connection) -> WaitlistRecord | None:
+            row = connection.execute(
+                "SELECT * FROM event_waitlist WHERE event_id = ? AND student_id = ?",
+                (event_id, _student_key(student_id)),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute("DELETE FROM event_waitlist WHERE id = ?", (row["id"],))
+            return self._row_to_waitlist_entry(row)
+
+        return self._write(apply)
+
+    def list_waitlist_entries_with_events(
+        self, student_id: str
+    ) -> list[tuple[WaitlistRecord, int, EventRecord | None]]:
+        """The student's waitlist entries (newest first) with their 1-based positions and their event.
+
+        Events are joined and read in the same pass as list_registrations_with_events.
+        """
+        with self._conn() as connection:
+            rows = connection.execute(
+                """
+                SELECT w.*, e.id AS joined_event_id, (
+                    SELECT COUNT(*) FROM event_waitlist AS q
+                    WHERE q.event_id = w.event_id AND (q.created_at, q.id) <= (w.created_at, w.id)
+                ) AS position
+                FROM event_waitlist AS w
+                LEFT JOIN events AS e ON e.id = w.event_id AND e.is_active = 1
+                WHERE w.student_id = ?
+                ORDER BY w.created_at DESC, w.id DESC
+                """,
+                (_student_key(student_id),),
+            ).fetchall()
+            event_ids = list(dict.fromkeys(row["joined_event_id"] for row in rows if row["joined_event_id"]))
+            event_rows = connection.execute(
+                "SELECT * FROM events WHERE id IN (SELECT value FROM json_each(?))",
+                (json.dumps(event_ids),),
+            ).fetchall()
+            events = self._rows_to_events(connection, event_rows, with_details=False)
+        events_by_id = {event.id: event for event in events}
+        return [
+            (self._row_to_waitlist_entry(row), int(row["position"]), events_by_id.get(row["joined_event_id"]))
+            for row in rows
+        ]
 
     def generate_registration_id(self) -> str:
         return f"reg_{uuid4().hex[:16]}"
@@ -741,6 +1799,9 @@ class SqliteStore:
     def generate_event_id(self) -> str:
         return f"evt_{uuid4().hex[:16]}"
 
+    def generate_waitlist_id(self) -> str:
+        return f"wtl_{uuid4().hex[:16]}"
+
     def has_registration_for_student(self, event_id: str, student_id: str) -> bool:
         with self._conn() as connection:
             row = connection.execute(
@@ -748,11 +1809,11 @@ class SqliteStore:
                 SELECT 1
                 FROM event_registrations
                 WHERE event_id = ?
-                  AND LOWER(student_id) = LOWER(?)
+                  AND student_id = ?
                   AND status = 'registered'
                 LIMIT 1
                 """,
-                (event_id, student_id),
+                (event_id, _student_key(student_id)),
             ).fetchone()
         return row is not None
 
@@ -763,10 +1824,10 @@ class SqliteStore:
                 SELECT *
                 FROM event_registrations
                 WHERE event_id = ?
-                  AND LOWER(student_id) = LOWER(?)
+                  AND student_id = ?
                 LIMIT 1
                 """,
-                (event_id, student_id),
+                (event_id, _student_key(student_id)),
             ).fetchone()
         return self._row_to_registration(row) if row else None
 
@@ -774,6 +1835,8 @@ class SqliteStore:
         self,
         event_id: str | None = None,
         student_id: str | None = None,
+        limit: int | None = None,
+        after: tuple[datetime, str] | None = None,
     ) -> list[RegistrationRecord]:
         query = "SELECT * FROM event_registrations"
         params: list[object] = []
@@ -782,16 +1845,97 @@ class SqliteStore:
             conditions.append("event_id = ?")
             params.append(event_id)
         if student_id is not None:
-            conditions.append("LOWER(student_id) = LOWER(?)")
-            params.append(student_id)
+            conditions.append("student_id = ?")
+            params.append(_student_key(student_id))
+        if after is not None:
+            conditions.append("(created_at, id) < (?, ?)")
+            params.extend([self._format_datetime(after[0]), after[1]])
         if conditions:
             query += " WHERE " + " AND ".join(conditions)
-        query += " ORDER BY created_at DESC"
+        query += " ORDER BY created_at DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
 
         with self._conn() as connection:
             rows = connection.execute(query, tuple(params)).fetchall()
         return [self._row_to_registration(row) for row in rows]
 
+    def list_registrations_with_events(
+        self,
+        student_id: str | None = None,
+        status: RegistrationStatus | None = None,
+        event_date: date | None = None,
+    ) -> list[tuple[RegistrationRecord, EventRecord | None]]:
+        """Registrations (newest first) paired with their event; None when the event no longer exists.
+
+        Replaces a get_event_by_id per row: the LEFT JOIN resolves and filters the events, then their rows
+        are read once per distinct event (without agenda and requirements, like list_events(with_details=False)).
+        Carrying every event column on each joined row doubled the query time for large result sets.
+        """
+        query = (
+            "SELECT r.*, e.id AS joined_event_id FROM event_registrations AS r "
+            "LEFT JOIN events AS e ON e.id = r.event_id AND e.is_active = 1"
+        )
+        params: list[object] = []
+        conditions: list[str] = []
+        if student_id is not None:
+            conditions.append("r.student_id = ?")
+            params.append(_student_key(student_id))
+        if status is not None:
+            conditions.append("r.status = ?")
+            params.append(_enum_value(status))
+        if event_date is not None:
+            conditions.append("e.event_date = ?")
+            params.append(event_date.isoformat())
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY r.created_at DESC, r.id DESC"
+
+        with self._conn() as connection:
+            rows = connection.execute(query, tuple(params)).fetchall()
+            event_ids = list(dict.fromkeys(row["joined_event_id"] for row in rows if row["joined_event_id"]))
+            event_rows = connection.execute(
+                "SELECT * FROM events WHERE id IN (SELECT value FROM json_each(?))",
+                (json.dumps(event_ids),),
+            ).fetchall()
+            events = self._rows_to_events(connection, event_rows, with_details=False)
+        events_by_id = {event.id: event for event in events}
+        return [
+            (self._row_to_registration(row), events_by_id.get(row["joined_event_id"]))
+            for row in rows
+        ]
+
+    def find_conflicts(
+        self, student_id: str, event_date: date, event_time: str, exclude_event_id: str | None = None
+    ) -> list[str]:
+        """Events the student is registered to on event_date whose time clashes with event_time.
+
+        Workers share the database, so an in-process index could miss their writes; the student's
+        active registrations for the day come off idx_registrations_student_status instead.
+        """
+        with self._conn() as connection:
+            return self._find_conflicts(connection, student_id, event_date, event_time, exclude_event_id)
+
+    @staticmethod
+    def _find_conflicts(
+        connection, student_id: str, event_date: date, event_time: str, exclude_event_id: str | None
+    ) -> list[str]:
+        rows = connection.execute(
+            """
+            SELECT e.id, e.event_time FROM event_registrations AS r
+            JOIN events AS e ON e.id = r.event_id AND e.is_active = 1
+            WHERE r.student_id = ? AND r.status = ? AND e.event_date = ?
+            ORDER BY e.event_time ASC, e.id ASC
+            """,
+            (_student_key(student_id), _enum_value(RegistrationStatus.REGISTERED), event_date.isoformat()),
+        ).fetchall()
+        return [
+            row["id"]
+            for row in rows
+            if row["id"] != exclude_event_id and times_clash(row["event_time"], event_time)
+        ]
+
     def count_registrations_created_since(self, since: datetime) -> int:
         with self._conn() as connection:
             row = connection.execute(
@@ -800,62 +1944,108 @@ class SqliteStore:
             ).fetchone()
         return int(row["total"])
 
+    def list_registration_stats(self) -> list[EventRegistrationStatsRecord]:
+        # Maintained by the event_registration_stats triggers; one row per event with registrations.
+        with self._conn() as connection:
+            rows = connection.execute(
+                """
+                SELECT event_id, registered_count, cancelled_count, last_registration_at
+                FROM event_registration_stats
+                """
+            ).fetchall()
+        return [
+            EventRegistrationStatsRecord(
+                event_id=row["event_id"],
+                registered_count=row["registered_count"],
+                cancelled_count=row["cancelled_count"],
+                last_registration_at=(
+                    _to_datetime(row["last_registration_at"]) if row["last_registration_at"] else None
+                ),
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def _row_to_review_stats(row) -> EventReviewStatsRecord:
+        return EventReviewStatsRecord(
+            event_id=row["event_id"],
+            review_count=row["review_count"],
+            rating_sum=row["rating_sum"],
+            rating_counts=[row[f"rating_{rating}"] for rating in range(1, 6)],
+        )
+
+    def get_review_stats(self, event_id: str) -> EventReviewStatsRecord | None:
+        with self._conn() as connection:
+            row = connection.execute("SELECT * FROM event_review_stats WHERE event_id = ?", (event_id,)).fetchone()
+        return self._row_to_review_stats(row) if row else None
+
+    def list_review_stats(self, event_ids: list[str] | None = None) -> list[EventReviewStatsRecord]:
+        # Maintained by the event_review_stats triggers; one row per event with reviews.
+        query = "SELECT * FROM event_review_stats"
+        params: tuple[object, ...] = ()
+        if event_ids is not None:
+            query += " WHERE event_id IN (SELECT value FROM json_each(?))"
+            params = (json.dumps(event_ids),)
+        with self._conn() as connection:
+            rows = connection.execute(query, params).fetchall()
+        return [self._row_to_review_stats(row) for row in rows]
+
     def create_review(self, review: EventReviewRecord) -> EventReviewRecord:
-        with self._lock:
-            with self._conn() as connection:
-                created_at = self._format_datetime(review.created_at)
-                updated_at = self._format_datetime(review.updated_at)
-                connection.execute(
-                    """
-                    INSERT INTO event_reviews (
-                        id, event_id, student_id, first_name, last_name, rating, comment,
-                        created_at, updated_at
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        review.id,
-                        review.event_id,
-                        review.student_id,
-                        review.first_name,
-                        review.last_name,
-                        review.rating,
-                        review.comment,
-                        created_at,
-                        updated_at,
-                    ),
+        def apply(connection) -> None:
+            created_at = self._format_datetime(review.created_at)
+            updated_at = self._format_datetime(review.updated_at)
+            connection.execute(
+                """
+                INSERT INTO event_reviews (
+                    id, event_id, student_id, first_name, last_name, rating, comment,
+                    created_at, updated_at
                 )
-                connection.commit()
-        return review.model_copy(deep=True)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    review.id,
+                    review.event_id,
+                    _student_key(review.student_id),
+                    review.first_name,
+                    review.last_name,
+                    review.rating,
+                    review.comment,
+                    created_at,
+                    updated_at,
+                ),
+            )
+
+        self._write(apply)
+        return review
 
     def update_review(self, review: EventReviewRecord) -> EventReviewRecord:
-        with self._lock:
-            with self._conn() as connection:
-                updated_at = self._format_datetime(review.updated_at)
-                updated = connection.execute(
-                    """
-                    UPDATE event_reviews
-                    SET
-                        first_name = ?,
-                        last_name = ?,
-                        rating = ?,
-                        comment = ?,
-                        updated_at = ?
-                    WHERE id = ?
-                    """,
-                    (
-                        review.first_name,
-                        review.last_name,
-                        review.rating,
-                        review.comment,
-                        updated_at,
-                        review.id,
-                    ),
-                ).rowcount
-                if updated == 0:
-                    raise KeyError(review.id)
-                connection.commit()
-        return review.model_copy(deep=True)
+        def apply(connection) -> None:
+            updated_at = self._format_datetime(review.updated_at)
+            updated = connection.execute(
+                """
+                UPDATE event_reviews
+                SET
+                    first_name = ?,
+                    last_name = ?,
+                    rating = ?,
+                    comment = ?,
+                    updated_at = ?
+                WHERE id = ?
+                """,
+                (
+                    review.first_name,
+                    review.last_name,
+                    review.rating,
+                    review.comment,
+                    updated_at,
+                    review.id,
+                ),
+            ).rowcount
+            if updated == 0:
+                raise KeyError(review.id)
+
+        self._write(apply)
+        return review
 
     def generate_review_id(self) -> str:
         return f"rev_{uuid4().hex[:16]}"
@@ -867,10 +2057,10 @@ class SqliteStore:
                 SELECT *
                 FROM event_reviews
                 WHERE event_id = ?
-                  AND LOWER(student_id) = LOWER(?)
+                  AND student_id = ?
                 LIMIT 1
                 """,
-                (event_id, student_id),
+                (event_id, _student_key(student_id)),
             ).fetchone()
         return self._row_to_review(row) if row else None
 
@@ -878,6 +2068,8 @@ class SqliteStore:
         self,
         event_id: str | None = None,
         student_id: str | None = None,
+        limit: int | None = None,
+        after: tuple[datetime, datetime, str] | None = None,
     ) -> list[EventReviewRecord]:
         query = "SELECT * FROM event_reviews"
         params: list[object] = []
@@ -886,11 +2078,17 @@ class SqliteStore:
             conditions.append("event_id = ?")
             params.append(event_id)
         if student_id is not None:
-            conditions.append("LOWER(student_id) = LOWER(?)")
-            params.append(student_id)
+            conditions.append("student_id = ?")
+            params.append(_student_key(student_id))
+        if after is not None:
+            conditions.append("(updated_at, created_at, id) < (?, ?, ?)")
+            params.extend([self._format_datetime(after[0]), self._format_datetime(after[1]), after[2]])
         if conditions:
             query += " WHERE " + " AND ".join(conditions)
-        query += " ORDER BY updated_at DESC, created_at DESC"
+        query += " ORDER BY updated_at DESC, created_at DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
 
         with self._conn() as connection:
             rows = connection.execute(query, tuple(params)).fetchall()
@@ -1,25 +1,38 @@
 from __future__ import annotations
 
+from datetime import date
 from pathlib import Path
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, Query, Response, status
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, Query, Request, Response, status
 
 from ..dependencies import get_current_user, get_event_service, get_registration_service, require_admin
+from ..executors import run_read
 from ..models import (
     EventCreateRequest,
     EventDetail,
     EventImageUploadResponse,
     EventLifecycleFilter,
+    EventRatingSummary,
     EventReviewCreateRequest,
     EventReviewPublic,
+    EventReviewPublicPage,
     EventSummary,
+    EventSummaryPage,
     EventType,
     EventUpdateRequest,
     RegistrationPublic,
+    RegistrationPublicPage,
     UserPublic,
 )
-from ..services import AuthorizationError, ConflictError, EventService, NotFoundError, RegistrationService
+from ..services import (
+    AuthorizationError,
+    ConflictError,
+    EventService,
+    InvalidCursorError,
+    NotFoundError,
+    RegistrationService,
+)
 
 
 router = APIRouter(prefix="/api/events", tags=["events"])
@@ -31,6 +44,23 @@ ALLOWED_IMAGE_CONTENT_TYPES = {
     "image/png": ".png",
     "image/webp": ".webp",
 }
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def _page_size(limit: int | None, cursor: str | None) -> int | None:
+    # Without limit/cursor the endpoints keep returning the full list for older clients.
+    if limit is None and cursor is None:
+        return None
+    return limit or DEFAULT_PAGE_SIZE
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    # If-None-Match uses weak comparison, so a W/ prefix from an intermediary still matches.
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
 
 
 @router.post("/upload-image", response_model=EventImageUploadResponse, status_code=status.HTTP_201_CREATED)
@@ -65,20 +95,43 @@ async def upload_event_image(
     return EventImageUploadResponse(image_url=f"/uploads/{filename}")
 
 
-@router.get("", response_model=list[EventSummary])
-def list_events(
+@router.get("", response_model=list[EventSummary] | EventSummaryPage)
+async def list_events(
+    request: Request,
     event_service: EventService = Depends(get_event_service),
     event_type: EventType | None = Query(default=None, alias="type"),
     month: int | None = Query(default=None, ge=1, le=12),
     lifecycle: EventLifecycleFilter = Query(default=EventLifecycleFilter.ALL),
-) -> list[EventSummary]:
-    return event_service.list_events(event_type=event_type, month=month, lifecycle=lifecycle)
+    date_from: date | None = Query(default=None),
+    date_to: date | None = Query(default=None),
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+) -> Response:
+    try:
+        listing = await run_read(
+            event_service.list_events_cached,
+            limit=_page_size(limit, cursor),
+            cursor=cursor,
+            event_type=event_type,
+            month=month,
+            lifecycle=lifecycle,
+            date_from=date_from,
+            date_to=date_to,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    # no-cache: clients keep the body but revalidate every time, so writes show up immediately.
+    headers = {"ETag": listing.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), listing.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=listing.body, media_type="application/json", headers=headers)
 
 
 @router.get("/{event_id}", response_model=EventDetail)
-def get_event(event_id: str, event_service: EventService = Depends(get_event_service)) -> EventDetail:
+async def get_event(event_id: str, event_service: EventService = Depends(get_event_service)) -> EventDetail:
     try:
-        return event_service.get_event(event_id)
+        return await run_read(event_service.get_event, event_id)
     except NotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
@@ -118,25 +171,52 @@ def delete_event(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
 
-@router.get("/{event_id}/registrations", response_model=list[RegistrationPublic])
+@router.get("/{event_id}/registrations", response_model=list[RegistrationPublic] | RegistrationPublicPage)
 def list_event_registrations(
     event_id: str,
     registration_service: RegistrationService = Depends(get_registration_service),
     _current_user: UserPublic = Depends(require_admin),
-) -> list[RegistrationPublic]:
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+) -> Response:
     try:
-        return registration_service.list_registrations_by_event(event_id)
+        body = registration_service.list_registrations_by_event_json(
+            event_id,
+            limit=_page_size(limit, cursor),
+            cursor=cursor,
+        )
     except NotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return Response(content=body, media_type="application/json")
 
 
-@router.get("/{event_id}/reviews", response_model=list[EventReviewPublic])
+@router.get("/{event_id}/reviews", response_model=list[EventReviewPublic] | EventReviewPublicPage)
 def list_event_reviews(
     event_id: str,
     event_service: EventService = Depends(get_event_service),
-) -> list[EventReviewPublic]:
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None),
+) -> list[EventReviewPublic] | EventReviewPublicPage:
+    page_size = _page_size(limit, cursor)
+    try:
+        if page_size is None:
+            return event_service.list_event_reviews(event_id)
+        return event_service.list_event_reviews_page(event_id, limit=page_size, cursor=cursor)
+    except NotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.get("/{event_id}/reviews/summary", response_model=EventRatingSummary)
+async def get_event_review_summary(
+    event_id: str,
+    event_service: EventService = Depends(get_event_service),
+) -> EventRatingSummary:
     try:
-        return event_service.list_event_reviews(event_id)
+        return await run_read(event_service.get_event_review_summary, event_id)
     except NotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
@@ -2,17 +2,28 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from ..dependencies import get_catalog_cache, get_store, get_user_cache
+from ..security import token_cache_stats
 
 
 router = APIRouter(prefix="/api", tags=["health"])
 
 
 @router.get("/health")
-def healthcheck() -> dict[str, str]:
+def healthcheck(
+    store=Depends(get_store),
+    catalog_cache=Depends(get_catalog_cache),
+    user_cache=Depends(get_user_cache),
+) -> dict[str, object]:
     return {
         "status": "ok",
         "timestamp": datetime.utcnow().isoformat(),
+        "store": store.stats(),
+        "catalog_cache": catalog_cache.stats(),
+        "user_cache": user_cache.stats(),
+        "token_cache": token_cache_stats(),
     }
 
 
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from ..dependencies import get_current_user, get_registration_service
-from ..models import RegistrationEnrollRequest, RegistrationPublic, UserEventRegistration, UserPublic
+from ..executors import run_read, run_write
+from ..models import (
+    EventConflictHint,
+    RegistrationEnrollRequest,
+    RegistrationPublic,
+    UserEventRegistration,
+    UserPublic,
+)
 from ..services import (
     AuthorizationError,
     CapacityError,
@@ -16,26 +23,41 @@ from ..services import (
 
 router = APIRouter(prefix="/api/registrations", tags=["registrations"])
 
+MAX_CONFLICT_EVENT_IDS = 200
+
 
 @router.get("/me", response_model=list[UserEventRegistration])
-def list_my_registrations(
+async def list_my_registrations(
     registration_service: RegistrationService = Depends(get_registration_service),
     current_user: UserPublic = Depends(get_current_user),
 ) -> list[UserEventRegistration]:
     try:
-        return registration_service.list_registrations_by_current_user(current_user)
+        return await run_read(registration_service.list_registrations_by_current_user, current_user)
+    except AuthorizationError as exc:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
+
+
+@router.get("/me/conflicts", response_model=list[EventConflictHint])
+async def list_my_conflicts(
+    event_id: list[str] = Query(min_length=1, max_length=MAX_CONFLICT_EVENT_IDS),
+    registration_service: RegistrationService = Depends(get_registration_service),
+    current_user: UserPublic = Depends(get_current_user),
+) -> list[EventConflictHint]:
+    # One round trip for a whole listing: ?event_id=a&event_id=b...
+    try:
+        return await run_read(registration_service.list_conflict_hints_for_user, event_id, current_user)
     except AuthorizationError as exc:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
 
 
 @router.post("", response_model=RegistrationPublic, status_code=status.HTTP_201_CREATED)
-def create_registration(
+async def create_registration(
     payload: RegistrationEnrollRequest,
     registration_service: RegistrationService = Depends(get_registration_service),
     current_user: UserPublic = Depends(get_current_user),
 ) -> RegistrationPublic:
     try:
-        return registration_service.create_registration_from_user(payload.event_id, current_user)
+        return await run_write(registration_service.create_registration_from_user, payload.event_id, current_user)
     except NotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     except ConflictError as exc:
@@ -49,13 +71,13 @@ def create_registration(
 
 
 @router.delete("/event/{event_id}", response_model=RegistrationPublic)
-def cancel_registration(
+async def cancel_registration(
     event_id: str,
     registration_service: RegistrationService = Depends(get_registration_service),
     current_user: UserPublic = Depends(get_current_user),
 ) -> RegistrationPublic:
     try:
-        return registration_service.cancel_registration_from_user(event_id, current_user)
+        return await run_write(registration_service.cancel_registration_from_user, event_id, current_user)
     except NotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     except ConflictError as exc:
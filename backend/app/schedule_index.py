@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from datetime import date
+from threading import Lock
+
+from .event_time import parse_event_time, schedule_interval
+
+
+class ScheduleIndex:
+    """Active registrations per (student, date) as intervals sorted by start, for conflict lookups.
+
+    Intervals are minutes after midnight, as schedule_interval returns them. Times that do not parse
+    have no interval; they are kept by their compact text, which is what the clash rule compares.
+    Writers serialize on the index's own lock, since one student's day spans several event stripes;
+    lookups copy a bucket and take no lock.
+    """
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self._intervals: dict[tuple[str, date], list[tuple[int, int, str]]] = {}
+        self._untimed: dict[tuple[str, date], dict[str, str]] = {}
+
+    def add(self, student_id: str, event_id: str, event_date: date, event_time: str) -> None:
+        key = (student_id.casefold(), event_date)
+        interval = schedule_interval(event_time)
+        with self.lock:
+            if interval is None:
+                self._untimed.setdefault(key, {})[event_id] = parse_event_time(event_time).compact
+                return
+            entries = self._intervals.setdefault(key, [])
+            entry = (interval[0], interval[1], event_id)
+            if entry not in entries:
+                insort(entries, entry)
+
+    def remove(self, student_id: str, event_id: str, event_date: date, event_time: str) -> None:
+        key = (student_id.casefold(), event_date)
+        interval = schedule_interval(event_time)
+        with self.lock:
+            if interval is None:
+                untimed = self._untimed.get(key)
+                if untimed is not None:
+                    untimed.pop(event_id, None)
+                    if not untimed:
+                        del self._untimed[key]
+                return
+            entries = self._intervals.get(key)
+            entry = (interval[0], interval[1], event_id)
+            if entries is None or entry not in entries:
+                return
+            entries.remove(entry)
+            if not entries:
+                del self._intervals[key]
+
+    def find(
+        self, student_id: str, event_date: date, event_time: str, exclude_event_id: str | None = None
+    ) -> list[str]:
+        """Ids of the student's events on that date whose time clashes with event_time."""
+        key = (student_id.casefold(), event_date)
+        interval = schedule_interval(event_time)
+        if interval is None:
+            compact = parse_event_time(event_time).compact
+            untimed = dict(self._untimed.get(key, {}))
+            return [event_id for event_id, text in untimed.items() if text == compact and event_id != exclude_event_id]
+
+        entries = list(self._intervals.get(key, ()))
+        start, end = interval
+        # Only entries starting before the window ends can overlap it; a student's day holds a handful.
+        candidates = entries[: bisect_left(entries, (end,))]
+        return [
+            event_id
+            for entry_start, entry_end, event_id in candidates
+            if entry_end > start and event_id != exclude_event_id
+        ]
+
+    def clear(self) -> None:
+        with self.lock:
+            self._intervals.clear()
+            self._untimed.clear()
+
+    def stats(self) -> dict[str, object]:
+        with self.lock:
+            return {
+                "student_days": len(self._intervals.keys() | self._untimed.keys()),
+                "intervals": sum(len(entries) for entries in self._intervals.values()),
+                "untimed": sum(len(entries) for entries in self._untimed.values()),
+            }
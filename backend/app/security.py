@@ -6,6 +6,8 @@ import hmac
 import json
 import os
 import time
+from collections import OrderedDict
+from threading import Lock
 
 from .models import TokenPayload
 
@@ -13,12 +15,101 @@ from .models import TokenPayload
 SECRET_KEY = os.getenv("APP_SECRET_KEY", "change-me-in-production")
 PASSWORD_SALT = os.getenv("APP_PASSWORD_SALT", "change-me-password-salt")
 ACCESS_TOKEN_TTL_SECONDS = int(os.getenv("APP_ACCESS_TOKEN_TTL_SECONDS", "86400"))
+DEFAULT_TOKEN_CACHE_SIZE = 4096
 
 
 class TokenError(ValueError):
     pass
 
 
+def get_token_cache_size() -> int:
+    raw_size = os.getenv("APP_TOKEN_CACHE_SIZE", "").strip()
+    try:
+        return max(0, int(raw_size)) if raw_size else DEFAULT_TOKEN_CACHE_SIZE
+    except ValueError:
+        return DEFAULT_TOKEN_CACHE_SIZE
+
+
+def _build_signing_key(secret_key: str):
+    # Keyed once; signing copies this state instead of re-deriving the HMAC pads from the secret.
+    return hmac.new(secret_key.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+class _VerifiedTokenCache:
+    """Bounded LRU of tokens whose signature and payload already passed decode_access_token.
+
+    Keyed by the signature segment; a hit still requires the payload segment to match byte for byte,
+    so only a token identical to one verified before skips the HMAC. Entries leave at exp.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._lock = Lock()
+        self._entries: OrderedDict[str, tuple[str, TokenPayload]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._expirations = 0
+        self._evictions = 0
+
+    def get(self, payload_segment: str, signature_segment: str, now: int) -> TokenPayload | None:
+        with self._lock:
+            cached = self._entries.get(signature_segment)
+            if cached is None or not hmac.compare_digest(cached[0].encode(), payload_segment.encode()):
+                self._misses += 1
+                return None
+            if cached[1].exp < now:
+                del self._entries[signature_segment]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(signature_segment)
+            self._hits += 1
+            return cached[1]
+
+    def put(self, payload_segment: str, signature_segment: str, payload: TokenPayload) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[signature_segment] = (payload_segment, payload)
+            self._entries.move_to_end(signature_segment)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                "expirations": self._expirations,
+                "evictions": self._evictions,
+            }
+
+
+_signing_key = _build_signing_key(SECRET_KEY)
+_token_cache = _VerifiedTokenCache(get_token_cache_size())
+
+
+def rotate_secret_key(secret_key: str) -> None:
+    """Sign with a new secret from now on; tokens verified under the old one must verify again."""
+    global SECRET_KEY, _signing_key
+    SECRET_KEY = secret_key
+    _signing_key = _build_signing_key(secret_key)
+    _token_cache.clear()
+
+
+def token_cache_stats() -> dict[str, object]:
+    return _token_cache.stats()
+
+
 def hash_password(plain_password: str) -> str:
     payload = f"{PASSWORD_SALT}:{plain_password}".encode("utf-8")
     return hashlib.sha256(payload).hexdigest()
@@ -38,6 +129,12 @@ def _b64decode(encoded: str) -> bytes:
     return base64.urlsafe_b64decode(f"{encoded}{padding}")
 
 
+def _sign(payload_segment: str) -> str:
+    signer = _signing_key.copy()
+    signer.update(payload_segment.encode("utf-8"))
+    return _b64encode(signer.digest())
+
+
 def create_access_token(subject: str, role: str) -> str:
     payload = {
         "sub": subject,
@@ -47,10 +144,7 @@ def create_access_token(subject: str, role: str) -> str:
     payload_segment = _b64encode(
         json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
     )
-    signature_segment = _b64encode(
-        hmac.new(SECRET_KEY.encode("utf-8"), payload_segment.encode("utf-8"), hashlib.sha256).digest()
-    )
-    return f"{payload_segment}.{signature_segment}"
+    return f"{payload_segment}.{_sign(payload_segment)}"
 
 
 def decode_access_token(token: str) -> TokenPayload:
@@ -59,10 +153,12 @@ def decode_access_token(token: str) -> TokenPayload:
     except ValueError as exc:
         raise TokenError("Invalid token format") from exc
 
-    expected_signature = _b64encode(
-        hmac.new(SECRET_KEY.encode("utf-8"), payload_segment.encode("utf-8"), hashlib.sha256).digest()
-    )
-    if not hmac.compare_digest(expected_signature, signature_segment):
+    now = int(time.time())
+    cached = _token_cache.get(payload_segment, signature_segment, now)
+    if cached is not None:
+        return cached
+
+    if not hmac.compare_digest(_sign(payload_segment), signature_segment):
         raise TokenError("Invalid token signature")
 
     try:
@@ -71,7 +167,8 @@ def decode_access_token(token: str) -> TokenPayload:
         raise TokenError("Malformed token payload") from exc
 
     payload = TokenPayload.model_validate(payload_data)
-    if payload.exp < int(time.time()):
+    if payload.exp < now:
         raise TokenError("Token expired")
+    _token_cache.put(payload_segment, signature_segment, payload)
     return payload
 
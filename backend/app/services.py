@@ -1,23 +1,32 @@
 from __future__ import annotations
 
+import base64
+import json
 import os
 import re
-from collections import Counter
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
 
+from pydantic import BaseModel, TypeAdapter
+
+from .catalog_cache import CatalogCache, CatalogEntry
 from .models import (
     AdminEventStats,
     AdminSummary,
     EventDetail,
+    EventConflictHint,
     EventCreateRequest,
     EventLifecycle,
     EventLifecycleFilter,
+    EventRatingSummary,
     EventRecord,
     EventReviewCreateRequest,
     EventReviewPublic,
+    EventReviewPublicPage,
     EventReviewRecord,
+    EventReviewStatsRecord,
     EventSummary,
+    EventSummaryPage,
     EventType,
     EventUpdateRequest,
     LoginRequest,
@@ -30,9 +39,18 @@ from .models import (
     UserEventRegistration,
     UserPublic,
     UserRecord,
+    WaitlistRecord,
+)
+from .event_time import parse_event_time
+from .repositories import (
+    AlreadyCancelledError,
+    AlreadyRegisteredError,
+    InMemoryStore,
+    NoSeatsAvailableError,
+    SeatsAvailableError,
 )
-from .repositories import InMemoryStore
 from .security import create_access_token, hash_password, verify_password
+from .user_cache import UserCache
 
 APP_TIMEZONE = os.getenv("APP_TIMEZONE", "America/Mexico_City")
 try:
@@ -40,6 +58,23 @@ try:
 except Exception:
     APP_ZONE = ZoneInfo("UTC")
 
+# A seat can free up between a failed reserve_seat and join_waitlist; past this many rounds of that the
+# event counts as full.
+WAITLIST_JOIN_ATTEMPTS = 3
+
+_EVENT_SUMMARY_LIST = TypeAdapter(list[EventSummary])
+
+
+# RegistrationPublic mirrors RegistrationRecord field for field, so stored records serialize as the
+# public payload directly instead of being copied into RegistrationPublic models first.
+_REGISTRATION_RECORD_LIST = TypeAdapter(list[RegistrationRecord])
+
+
+class _RegistrationRecordPage(BaseModel):
+    # Same JSON as RegistrationPublicPage; the records are already validated, so building it is a type check.
+    items: list[RegistrationRecord]
+    next_cursor: str | None = None
+
 
 class ServiceError(Exception):
     pass
@@ -69,6 +104,61 @@ class ProfileIncompleteError(ServiceError):
     pass
 
 
+class InvalidCursorError(ServiceError):
+    pass
+
+
+def _encode_cursor(*values: str) -> str:
+    raw = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, size: int) -> list[str]:
+    # Cursors are opaque to clients: base64url(JSON list of the sort key of the last item served).
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(f"{cursor}{padding}").decode("utf-8"))
+    except ValueError as exc:
+        raise InvalidCursorError("Invalid pagination cursor") from exc
+    if not isinstance(values, list) or len(values) != size or not all(isinstance(value, str) for value in values):
+        raise InvalidCursorError("Invalid pagination cursor")
+    return values
+
+
+def _event_sort_key(event: EventRecord) -> tuple[date, str, str]:
+    return event.date, event.time, event.id
+
+
+def _decode_event_cursor(cursor: str | None) -> tuple[date, str, str] | None:
+    if cursor is None:
+        return None
+    event_date, event_time, event_id = _decode_cursor(cursor, 3)
+    try:
+        return date.fromisoformat(event_date), event_time, event_id
+    except ValueError as exc:
+        raise InvalidCursorError("Invalid pagination cursor") from exc
+
+
+def _decode_registration_cursor(cursor: str | None) -> tuple[datetime, str] | None:
+    if cursor is None:
+        return None
+    created_at, registration_id = _decode_cursor(cursor, 2)
+    try:
+        return datetime.fromisoformat(created_at), registration_id
+    except ValueError as exc:
+        raise InvalidCursorError("Invalid pagination cursor") from exc
+
+
+def _decode_review_cursor(cursor: str | None) -> tuple[datetime, datetime, str] | None:
+    if cursor is None:
+        return None
+    updated_at, created_at, review_id = _decode_cursor(cursor, 3)
+    try:
+        return datetime.fromisoformat(updated_at), datetime.fromisoformat(created_at), review_id
+    except ValueError as exc:
+        raise InvalidCursorError("Invalid pagination cursor") from exc
+
+
 def _to_user_public(user: UserRecord) -> UserPublic:
     return UserPublic(
         id=user.id,
@@ -82,33 +172,62 @@ def _to_user_public(user: UserRecord) -> UserPublic:
     )
 
 
-def _to_event_summary(event: EventRecord) -> EventSummary:
-    lifecycle = _event_lifecycle(event)
-    return EventSummary(
-        id=event.id,
-        image=event.image,
-        name=event.name,
-        date=event.date,
-        time=_normalize_event_time_for_output(event.time),
-        place=event.place,
-        location=event.location,
-        spots=event.spots,
-        type=event.type,
-        summary=event.summary,
-        lifecycle=lifecycle,
+def _to_rating_summary(stats: EventReviewStatsRecord | None) -> EventRatingSummary:
+    if stats is None or stats.review_count <= 0:
+        return EventRatingSummary()
+    return EventRatingSummary(
+        count=stats.review_count,
+        average=round(stats.rating_sum / stats.review_count, 2),
+        histogram={rating: stats.rating_counts[rating - 1] for rating in range(1, 6)},
     )
 
 
-def _to_event_detail(event: EventRecord) -> EventDetail:
+def _event_summary_fields(event: EventRecord, review_stats: EventReviewStatsRecord | None) -> dict[str, object]:
+    return {
+        "id": event.id,
+        "image": event.image,
+        "name": event.name,
+        "date": event.date,
+        "time": parse_event_time(event.time).display,
+        "place": event.place,
+        "location": event.location,
+        "spots": event.spots,
+        "type": event.type,
+        "summary": event.summary,
+        "lifecycle": _event_lifecycle(event),
+        "rating_summary": _to_rating_summary(review_stats),
+    }
+
+
+def _to_event_summary(event: EventRecord, review_stats: EventReviewStatsRecord | None = None) -> EventSummary:
+    return EventSummary(**_event_summary_fields(event, review_stats))
+
+
+def _to_event_detail(event: EventRecord, review_stats: EventReviewStatsRecord | None = None) -> EventDetail:
+    # Built in one pass: going through EventSummary.model_dump() validated every summary field twice.
     return EventDetail(
-        **_to_event_summary(event).model_dump(),
+        **_event_summary_fields(event, review_stats),
         agenda=event.agenda,
         requirements=event.requirements,
     )
 
 
 def _to_registration_public(registration: RegistrationRecord) -> RegistrationPublic:
-    return RegistrationPublic(**registration.model_dump())
+    return RegistrationPublic.model_validate(registration, from_attributes=True)
+
+
+def _to_waitlist_public(entry: WaitlistRecord, status: RegistrationStatus) -> RegistrationPublic:
+    return RegistrationPublic(
+        id=entry.id,
+        event_id=entry.event_id,
+        first_name=entry.first_name,
+        last_name=entry.last_name,
+        student_id=entry.student_id,
+        career=entry.career,
+        semester=entry.semester,
+        status=status,
+        created_at=entry.created_at,
+    )
 
 
 def _to_event_review_public(review: EventReviewRecord) -> EventReviewPublic:
@@ -124,13 +243,33 @@ def _to_event_review_public(review: EventReviewRecord) -> EventReviewPublic:
     )
 
 
-def _to_user_event_registration(registration: RegistrationRecord, event: EventRecord) -> UserEventRegistration:
+def _to_user_event_registration(
+    registration: RegistrationRecord,
+    event: EventRecord,
+    review_stats: EventReviewStatsRecord | None = None,
+) -> UserEventRegistration:
     return UserEventRegistration(
         registration_id=registration.id,
         event_id=registration.event_id,
         status=registration.status,
         registered_at=registration.created_at,
-        event=_to_event_summary(event),
+        event=_to_event_summary(event, review_stats),
+    )
+
+
+def _to_waitlisted_user_event_registration(
+    entry: WaitlistRecord,
+    position: int,
+    event: EventRecord,
+    review_stats: EventReviewStatsRecord | None = None,
+) -> UserEventRegistration:
+    return UserEventRegistration(
+        registration_id=entry.id,
+        event_id=entry.event_id,
+        status=RegistrationStatus.WAITLISTED,
+        registered_at=entry.created_at,
+        event=_to_event_summary(event, review_stats),
+        waitlist_position=position,
     )
 
 
@@ -139,108 +278,6 @@ def _build_username_from_student_id(student_id: str) -> str:
     return (normalized or "user").lower()
 
 
-TIME_TOKEN_REGEX = re.compile(r"(\d{1,2}:\d{2}\s*(?:[ap]\.?m\.?)?)", re.IGNORECASE)
-
-
-def _normalize_meridiem(token: str) -> tuple[str, str | None]:
-    cleaned = token.strip().lower().replace(" ", "")
-    meridiem: str | None = None
-    if re.search(r"a\.?m\.?$", cleaned):
-        meridiem = "am"
-    elif re.search(r"p\.?m\.?$", cleaned):
-        meridiem = "pm"
-    cleaned = re.sub(r"(a\.?m\.?|p\.?m\.?)$", "", cleaned)
-    cleaned = cleaned.replace(".", "")
-    return cleaned, meridiem
-
-
-def _time_token_to_minutes(token: str) -> int | None:
-    normalized_token, meridiem = _normalize_meridiem(token)
-    match = re.fullmatch(r"(\d{1,2}):(\d{2})", normalized_token)
-    if not match:
-        return None
-
-    hours = int(match.group(1))
-    minutes = int(match.group(2))
-
-    if minutes < 0 or minutes > 59:
-        return None
-
-    if meridiem is not None:
-        if hours < 1 or hours > 12:
-            return None
-        if meridiem == "am":
-            hours = 0 if hours == 12 else hours
-        else:
-            hours = 12 if hours == 12 else hours + 12
-    else:
-        if hours < 0 or hours > 23:
-            return None
-
-    return hours * 60 + minutes
-
-
-def _extract_time_window(raw_time: str) -> tuple[int, int] | None:
-    tokens = TIME_TOKEN_REGEX.findall(raw_time)
-    if not tokens:
-        return None
-
-    first = _time_token_to_minutes(tokens[0])
-    if first is None:
-        return None
-
-    if len(tokens) == 1:
-        return first, first
-
-    second = _time_token_to_minutes(tokens[1])
-    if second is None:
-        return None
-
-    if second < first:
-        # Gracefully support rare ranges that cross midnight.
-        second += 24 * 60
-
-    return first, second
-
-
-def _normalize_interval(start: int, end: int) -> tuple[int, int]:
-    if end == start:
-        return start, start + 1
-    return start, end
-
-
-def _has_time_overlap(window_a: tuple[int, int] | None, window_b: tuple[int, int] | None) -> bool:
-    if window_a is not None and window_b is not None:
-        a_start, a_end = _normalize_interval(*window_a)
-        b_start, b_end = _normalize_interval(*window_b)
-        return max(a_start, b_start) < min(a_end, b_end)
-
-    return False
-
-
-def _normalize_time_text(raw_time: str) -> str:
-    return re.sub(r"\s+", "", raw_time.casefold())
-
-
-def _minutes_to_hhmm(total_minutes: int) -> str:
-    minutes_per_day = 24 * 60
-    normalized = ((total_minutes % minutes_per_day) + minutes_per_day) % minutes_per_day
-    hours, minutes = divmod(normalized, 60)
-    return f"{hours:02d}:{minutes:02d}"
-
-
-def _normalize_event_time_for_output(raw_time: str) -> str:
-    time_window = _extract_time_window(raw_time)
-    if time_window is None:
-        return raw_time.strip()
-
-    start_minutes, end_minutes = time_window
-    if end_minutes <= start_minutes:
-        return raw_time.strip()
-
-    return f"{_minutes_to_hhmm(start_minutes)} - {_minutes_to_hhmm(end_minutes)}"
-
-
 def _local_now() -> datetime:
     # Compare event schedule with a stable app timezone to avoid server-tz drift.
     return datetime.now(APP_ZONE).replace(tzinfo=None)
@@ -253,27 +290,26 @@ def _to_csv_cell(value: object) -> str:
     return text
 
 
-def _event_end_datetime(event: EventRecord) -> datetime:
-    base = datetime.combine(event.date, datetime.min.time())
-    time_window = _extract_time_window(event.time)
-    if time_window is None:
-        # Unknown formats are treated as whole-day events to avoid early "past" transitions.
-        return base + timedelta(hours=23, minutes=59, seconds=59)
-
-    _, end_minutes = _normalize_interval(*time_window)
-    return base + timedelta(minutes=end_minutes)
-
-
 def _event_lifecycle(event: EventRecord, now: datetime | None = None) -> EventLifecycle:
     reference = now or _local_now()
-    if _event_end_datetime(event) < reference:
+    if event.ends_at < reference:
         return EventLifecycle.PAST
     return EventLifecycle.ACTIVE
 
 
+def _lifecycle_bounds(lifecycle: EventLifecycleFilter) -> dict[str, datetime]:
+    # Same rule as _event_lifecycle, expressed as an ends_at range the stores can filter on.
+    if lifecycle == EventLifecycleFilter.ACTIVE:
+        return {"ends_at_from": _local_now()}
+    if lifecycle == EventLifecycleFilter.PAST:
+        return {"ends_at_before": _local_now()}
+    return {}
+
+
 class AuthService:
-    def __init__(self, store: InMemoryStore) -> None:
+    def __init__(self, store: InMemoryStore, user_cache: UserCache | None = None) -> None:
         self.store = store
+        self.user_cache = user_cache
 
     def login(self, payload: LoginRequest) -> LoginResponse:
         user = self.store.get_user_by_student_id(payload.student_id)
@@ -309,39 +345,138 @@ class AuthService:
             created_at=datetime.utcnow(),
         )
         saved_user = self.store.create_user(new_user)
+        if self.user_cache is not None:
+            self.user_cache.invalidate(saved_user.id)
 
         token = create_access_token(subject=saved_user.id, role=saved_user.role)
         return LoginResponse(access_token=token, user=_to_user_public(saved_user))
 
     def get_user_public_by_id(self, user_id: str) -> UserPublic:
+        generation = 0
+        if self.user_cache is not None:
+            cached = self.user_cache.get(user_id)
+            if cached is not None:
+                return cached
+            generation = self.user_cache.generation
+
         user = self.store.get_user_by_id(user_id)
         if not user or not user.is_active:
             raise AuthenticationError("Invalid user")
-        return _to_user_public(user)
+        user_public = _to_user_public(user)
+        if self.user_cache is not None:
+            self.user_cache.put(user_public, generation)
+        return user_public
 
 
 class EventService:
-    def __init__(self, store: InMemoryStore) -> None:
+    def __init__(self, store: InMemoryStore, catalog_cache: CatalogCache | None = None) -> None:
         self.store = store
+        self.catalog_cache = catalog_cache
+
+    def _invalidate_catalog(self) -> None:
+        if self.catalog_cache is not None:
+            self.catalog_cache.invalidate()
+
+    def list_events_cached(
+        self,
+        limit: int | None = None,
+        cursor: str | None = None,
+        event_type: EventType | None = None,
+        month: int | None = None,
+        lifecycle: EventLifecycleFilter = EventLifecycleFilter.ALL,
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> CatalogEntry:
+        """JSON body of list_events (or list_events_page when limit is set), served from the catalog cache."""
+        key = (event_type, month, lifecycle, date_from, date_to, limit, cursor)
+        now = _local_now()
+        generation = 0
+        if self.catalog_cache is not None:
+            cached = self.catalog_cache.get(key, now)
+            if cached is not None:
+                return cached
+            generation = self.catalog_cache.generation
+
+        filters = {
+            "event_type": event_type,
+            "month": month,
+            "lifecycle": lifecycle,
+            "date_from": date_from,
+            "date_to": date_to,
+        }
+        if limit is None:
+            body = _EVENT_SUMMARY_LIST.dump_json(self.list_events(**filters))
+        else:
+            body = self.list_events_page(limit=limit, cursor=cursor, **filters).model_dump_json().encode()
+        expires_at = self.store.next_event_end(now)
+        if self.catalog_cache is None:
+            return CatalogEntry.build(body, expires_at)
+        return self.catalog_cache.put(key, body, expires_at, generation, now)
 
     def list_events(
         self,
         event_type: EventType | None = None,
         month: int | None = None,
         lifecycle: EventLifecycleFilter = EventLifecycleFilter.ALL,
+        date_from: date | None = None,
+        date_to: date | None = None,
     ) -> list[EventSummary]:
-        events = self.store.list_events(event_type=event_type, month=month)
-        if lifecycle != EventLifecycleFilter.ALL:
-            target_lifecycle = EventLifecycle.ACTIVE if lifecycle == EventLifecycleFilter.ACTIVE else EventLifecycle.PAST
-            now = _local_now()
-            events = [event for event in events if _event_lifecycle(event, now) == target_lifecycle]
-        return [_to_event_summary(event) for event in events]
+        events = self.store.list_events(
+            event_type=event_type,
+            month=month,
+            with_details=False,
+            date_from=date_from,
+            date_to=date_to,
+            **_lifecycle_bounds(lifecycle),
+        )
+        return self._to_event_summaries(events)
+
+    def list_events_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        event_type: EventType | None = None,
+        month: int | None = None,
+        lifecycle: EventLifecycleFilter = EventLifecycleFilter.ALL,
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> EventSummaryPage:
+        after = _decode_event_cursor(cursor)
+        # Fetch one extra row to know whether another page exists.
+        events = self.store.list_events(
+            event_type=event_type,
+            month=month,
+            with_details=False,
+            limit=limit + 1,
+            after=after,
+            date_from=date_from,
+            date_to=date_to,
+            **_lifecycle_bounds(lifecycle),
+        )
+
+        page = events[:limit]
+        next_cursor = None
+        if len(events) > limit:
+            event_date, event_time, event_id = _event_sort_key(page[-1])
+            next_cursor = _encode_cursor(event_date.isoformat(), event_time, event_id)
+        return EventSummaryPage(items=self._to_event_summaries(page), next_cursor=next_cursor)
+
+    def _to_event_summaries(self, events: list[EventRecord]) -> list[EventSummary]:
+        stats_by_event = {
+            stats.event_id: stats for stats in self.store.list_review_stats([event.id for event in events])
+        }
+        return [_to_event_summary(event, stats_by_event.get(event.id)) for event in events]
 
     def get_event(self, event_id: str) -> EventDetail:
         event = self.store.get_event_by_id(event_id)
         if not event:
             raise NotFoundError(f"Event {event_id} not found")
-        return _to_event_detail(event)
+        return _to_event_detail(event, self.store.get_review_stats(event_id))
+
+    def get_event_review_summary(self, event_id: str) -> EventRatingSummary:
+        if not self.store.get_event_by_id(event_id):
+            raise NotFoundError(f"Event {event_id} not found")
+        return _to_rating_summary(self.store.get_review_stats(event_id))
 
     def list_event_reviews(self, event_id: str) -> list[EventReviewPublic]:
         event = self.store.get_event_by_id(event_id)
@@ -350,6 +485,20 @@ class EventService:
         reviews = self.store.list_reviews(event_id=event_id)
         return [_to_event_review_public(review) for review in reviews]
 
+    def list_event_reviews_page(self, event_id: str, limit: int, cursor: str | None = None) -> EventReviewPublicPage:
+        after = _decode_review_cursor(cursor)
+        event = self.store.get_event_by_id(event_id)
+        if not event:
+            raise NotFoundError(f"Event {event_id} not found")
+
+        reviews = self.store.list_reviews(event_id=event_id, limit=limit + 1, after=after)
+        page = reviews[:limit]
+        next_cursor = None
+        if len(reviews) > limit:
+            last = page[-1]
+            next_cursor = _encode_cursor(last.updated_at.isoformat(), last.created_at.isoformat(), last.id)
+        return EventReviewPublicPage(items=[_to_event_review_public(review) for review in page], next_cursor=next_cursor)
+
     def create_or_update_review(
         self,
         event_id: str,
@@ -374,12 +523,17 @@ class EventService:
         existing = self.store.get_review_by_event_and_student(event_id, current_user.student_id)
         now = datetime.utcnow()
         if existing:
-            existing.rating = payload.rating
-            existing.comment = payload.comment
-            existing.first_name = current_user.first_name
-            existing.last_name = current_user.last_name
-            existing.updated_at = now
-            saved = self.store.update_review(existing)
+            updated = existing.model_copy(
+                update={
+                    "rating": payload.rating,
+                    "comment": payload.comment,
+                    "first_name": current_user.first_name,
+                    "last_name": current_user.last_name,
+                    "updated_at": now,
+                }
+            )
+            saved = self.store.update_review(updated)
+            self._invalidate_catalog()
             return _to_event_review_public(saved)
 
         review = EventReviewRecord(
@@ -394,6 +548,7 @@ class EventService:
             updated_at=now,
         )
         saved = self.store.create_review(review)
+        self._invalidate_catalog()
         return _to_event_review_public(saved)
 
     def create_event(self, payload: EventCreateRequest) -> EventDetail:
@@ -415,6 +570,7 @@ class EventService:
             updated_at=now,
         )
         created = self.store.create_event(event)
+        self._invalidate_catalog()
         return _to_event_detail(created)
 
     def update_event(self, event_id: str, payload: EventUpdateRequest) -> EventDetail:
@@ -439,45 +595,30 @@ class EventService:
             updated_at=datetime.utcnow(),
         )
         saved = self.store.update_event(updated)
-        return _to_event_detail(saved)
+        self._invalidate_catalog()
+        return _to_event_detail(saved, self.store.get_review_stats(event_id))
 
     def delete_event(self, event_id: str) -> None:
         if not self.store.delete_event(event_id):
             raise NotFoundError(f"Event {event_id} not found")
+        self._invalidate_catalog()
 
 
 class RegistrationService:
-    def __init__(self, store: InMemoryStore) -> None:
+    def __init__(self, store: InMemoryStore, catalog_cache: CatalogCache | None = None) -> None:
         self.store = store
+        self.catalog_cache = catalog_cache
 
-    def _has_schedule_conflict(self, student_id: str, target_event: EventRecord) -> bool:
-        target_window = _extract_time_window(target_event.time)
-
-        registrations = self.store.list_registrations(student_id=student_id)
-        for registration in registrations:
-            if registration.status != RegistrationStatus.REGISTERED:
-                continue
-            if registration.event_id == target_event.id:
-                continue
-
-            existing_event = self.store.get_event_by_id(registration.event_id)
-            if not existing_event:
-                continue
-            if existing_event.date != target_event.date:
-                continue
-
-            existing_window = _extract_time_window(existing_event.time)
-            if _has_time_overlap(target_window, existing_window):
-                return True
+    def _invalidate_catalog(self) -> None:
+        # Seat counts are part of every catalog listing.
+        if self.catalog_cache is not None:
+            self.catalog_cache.invalidate()
 
-            # Fallback for uncommon/invalid time formats: if both strings are effectively equal, treat as conflict.
-            if (
-                (target_window is None or existing_window is None)
-                and _normalize_time_text(target_event.time) == _normalize_time_text(existing_event.time)
-            ):
-                return True
-
-        return False
+    def _has_schedule_conflict(self, student_id: str, target_event: EventRecord) -> bool:
+        conflicts = self.store.find_conflicts(
+            student_id, target_event.date, target_event.time, exclude_event_id=target_event.id
+        )
+        return bool(conflicts)
 
     def create_registration(self, payload: RegistrationCreate) -> RegistrationPublic:
         event = self.store.get_event_by_id(payload.event_id)
@@ -486,25 +627,14 @@ class RegistrationService:
         if _event_lifecycle(event) == EventLifecycle.PAST:
             raise ConflictError("No puedes registrarte a un evento que ya finalizó")
 
-        if self._has_schedule_conflict(payload.student_id, event):
-            raise ConflictError("Ya tienes otro evento registrado que se empalma en fecha y horario")
-
-        existing = self.store.get_registration_by_event_and_student(payload.event_id, payload.student_id)
-        if existing and existing.status == RegistrationStatus.REGISTERED:
-            raise ConflictError("Ya te encuentras registrado en este evento")
-
         if event.spots <= 0:
-            raise CapacityError("No spots available for this event")
-
-        # Reuse the same registration row if it was previously cancelled.
-        if existing and existing.status == RegistrationStatus.CANCELLED:
-            existing.status = RegistrationStatus.REGISTERED
-            saved = self.store.update_registration(existing)
+            # Retries from a student already in line are answered by this read, off the write path.
+            queued = self.store.get_waitlist_entry(payload.event_id, payload.student_id)
+            if queued is not None:
+                return _to_waitlist_public(queued, RegistrationStatus.WAITLISTED)
 
-            event.spots -= 1
-            event.updated_at = datetime.utcnow()
-            self.store.save_event(event)
-            return _to_registration_public(saved)
+        if self._has_schedule_conflict(payload.student_id, event):
+            raise ConflictError("Ya tienes otro evento registrado que se empalma en fecha y horario")
 
         registration = RegistrationRecord(
             id=self.store.generate_registration_id(),
@@ -517,31 +647,108 @@ class RegistrationService:
             status=RegistrationStatus.REGISTERED,
             created_at=datetime.utcnow(),
         )
-        saved = self.store.create_registration(registration)
-
-        event.spots -= 1
-        event.updated_at = datetime.utcnow()
-        self.store.save_event(event)
-
-        return _to_registration_public(saved)
-
-    def list_registrations_by_event(self, event_id: str) -> list[RegistrationPublic]:
+        # reserve_seat re-checks spots and duplicates inside a single write transaction. A full event
+        # queues the student instead of failing.
+        seat_free = event.spots > 0
+        try:
+            for _ in range(WAITLIST_JOIN_ATTEMPTS):
+                if seat_free:
+                    try:
+                        saved = self.store.reserve_seat(payload.event_id, registration)
+                    except NoSeatsAvailableError:
+                        pass
+                    else:
+                        self._invalidate_catalog()
+                        return _to_registration_public(saved)
+
+                entry = WaitlistRecord(
+                    id=self.store.generate_waitlist_id(),
+                    event_id=payload.event_id,
+                    first_name=payload.first_name,
+                    last_name=payload.last_name,
+                    student_id=payload.student_id,
+                    career=payload.career,
+                    semester=payload.semester,
+                    created_at=datetime.utcnow(),
+                )
+                try:
+                    queued, _ = self.store.join_waitlist(payload.event_id, entry)
+                except SeatsAvailableError:
+                    seat_free = True
+                    continue
+                return _to_waitlist_public(queued, RegistrationStatus.WAITLISTED)
+        except KeyError as exc:
+            raise NotFoundError(f"Event {payload.event_id} not found") from exc
+        except AlreadyRegisteredError as exc:
+            raise ConflictError("Ya te encuentras registrado en este evento") from exc
+
+        raise CapacityError("No spots available for this event")
+
+    def list_registrations_by_event_json(
+        self,
+        event_id: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> bytes:
+        """JSON body of list[RegistrationPublic], or RegistrationPublicPage when limit is set."""
+        after = _decode_registration_cursor(cursor)
         if not self.store.get_event_by_id(event_id):
             raise NotFoundError(f"Event {event_id} not found")
-        records = self.store.list_registrations(event_id=event_id)
-        return [_to_registration_public(record) for record in records]
+
+        if limit is None:
+            return _REGISTRATION_RECORD_LIST.dump_json(self.store.list_registrations(event_id=event_id))
+
+        records = self.store.list_registrations(event_id=event_id, limit=limit + 1, after=after)
+        page = records[:limit]
+        next_cursor = None
+        if len(records) > limit:
+            last = page[-1]
+            next_cursor = _encode_cursor(last.created_at.isoformat(), last.id)
+        return _RegistrationRecordPage(items=page, next_cursor=next_cursor).model_dump_json().encode()
 
     def list_registrations_by_current_user(self, current_user: UserPublic) -> list[UserEventRegistration]:
         if current_user.role != "user":
             raise AuthorizationError("Only student accounts can list personal registrations")
 
-        records = self.store.list_registrations(student_id=current_user.student_id)
-        registrations: list[UserEventRegistration] = []
-        for record in records:
-            event = self.store.get_event_by_id(record.event_id)
-            if event:
-                registrations.append(_to_user_event_registration(record, event))
-        return registrations
+        pairs = [
+            (record, event)
+            for record, event in self.store.list_registrations_with_events(student_id=current_user.student_id)
+            if event is not None
+        ]
+        waitlisted = [
+            (entry, position, event)
+            for entry, position, event in self.store.list_waitlist_entries_with_events(current_user.student_id)
+            if event is not None
+        ]
+        event_ids = [record.event_id for record, _ in pairs] + [entry.event_id for entry, _, _ in waitlisted]
+        stats_by_event = {stats.event_id: stats for stats in self.store.list_review_stats(event_ids)}
+
+        items = [
+            _to_user_event_registration(record, event, stats_by_event.get(record.event_id))
+            for record, event in pairs
+        ]
+        if waitlisted:
+            items.extend(
+                _to_waitlisted_user_event_registration(entry, position, event, stats_by_event.get(entry.event_id))
+                for entry, position, event in waitlisted
+            )
+            items.sort(key=lambda item: item.registered_at, reverse=True)
+        return items
+
+    def list_conflict_hints_for_user(self, event_ids: list[str], current_user: UserPublic) -> list[EventConflictHint]:
+        if current_user.role != "user":
+            raise AuthorizationError("Only student accounts can check schedule conflicts")
+
+        hints: list[EventConflictHint] = []
+        for event_id in dict.fromkeys(event_ids):
+            event = self.store.get_event_by_id(event_id)
+            if event is None:
+                continue
+            conflicts = self.store.find_conflicts(
+                current_user.student_id, event.date, event.time, exclude_event_id=event.id
+            )
+            hints.append(EventConflictHint(event_id=event.id, conflicting_event_ids=conflicts))
+        return hints
 
     def create_registration_from_user(self, event_id: str, current_user: UserPublic) -> RegistrationPublic:
         if current_user.role != "user":
@@ -575,20 +782,22 @@ class RegistrationService:
         if not event:
             raise NotFoundError(f"Event {event_id} not found")
 
-        existing = self.store.get_registration_by_event_and_student(event_id, current_user.student_id)
-        if not existing:
-            raise NotFoundError("You are not registered for this event")
-
-        if existing.status == RegistrationStatus.CANCELLED:
-            raise ConflictError("This registration is already cancelled")
-
-        existing.status = RegistrationStatus.CANCELLED
-        saved = self.store.update_registration(existing)
-
-        event.spots += 1
-        event.updated_at = datetime.utcnow()
-        self.store.save_event(event)
-
+        # A queued student holds no active registration for the event: cancelling means leaving the queue.
+        # The read-only check keeps the usual cancel to a single write; if the student is promoted in
+        # between, leave_waitlist finds nothing and the seat is released below.
+        if self.store.get_waitlist_entry(event_id, current_user.student_id) is not None:
+            left = self.store.leave_waitlist(event_id, current_user.student_id)
+            if left is not None:
+                return _to_waitlist_public(left, RegistrationStatus.CANCELLED)
+
+        try:
+            saved = self.store.release_seat(event_id, current_user.student_id, local_now=_local_now())
+        except KeyError as exc:
+            raise NotFoundError("You are not registered for this event") from exc
+        except AlreadyCancelledError as exc:
+            raise ConflictError("This registration is already cancelled") from exc
+
+        self._invalidate_catalog()
         return _to_registration_public(saved)
 
 
@@ -598,16 +807,16 @@ class AdminService:
 
     def summary(self) -> AdminSummary:
         users = self.store.list_users()
-        events = self.store.list_events()
-        registrations = self.store.list_registrations()
+        events = self.store.list_events(with_details=False)
+        stats_by_event = {stats.event_id: stats for stats in self.store.list_registration_stats()}
         registrations_today = self.store.count_registrations_created_since(
             datetime.utcnow() - timedelta(days=1)
         )
 
-        registrations_counter = Counter(registration.event_id for registration in registrations)
         top_events: list[AdminEventStats] = []
         for event in events:
-            total = registrations_counter.get(event.id, 0)
+            stats = stats_by_event.get(event.id)
+            total = stats.registered_count + stats.cancelled_count if stats else 0
             if total == 0:
                 continue
             top_events.append(
@@ -616,6 +825,7 @@ class AdminService:
                     event_name=event.name,
                     total_registrations=total,
                     available_spots=event.spots,
+                    last_registration_at=stats.last_registration_at,
                 )
             )
         top_events.sort(key=lambda item: item.total_registrations, reverse=True)
@@ -623,25 +833,16 @@ class AdminService:
         return AdminSummary(
             total_users=len(users),
             total_events=len(events),
-            total_registrations=len(registrations),
+            total_registrations=sum(
+                stats.registered_count + stats.cancelled_count for stats in stats_by_event.values()
+            ),
             registrations_today=registrations_today,
             top_events=top_events[:5],
         )
 
     def events_report(self) -> tuple[list[str], list[list[str]]]:
-        events = self.store.list_events()
-        registrations = self.store.list_registrations()
-
-        registered_counter = Counter(
-            registration.event_id
-            for registration in registrations
-            if registration.status == RegistrationStatus.REGISTERED
-        )
-        cancelled_counter = Counter(
-            registration.event_id
-            for registration in registrations
-            if registration.status == RegistrationStatus.CANCELLED
-        )
+        events = self.store.list_events(with_details=False)
+        stats_by_event = {stats.event_id: stats for stats in self.store.list_registration_stats()}
 
         headers = [
             "event_id",
@@ -657,17 +858,18 @@ class AdminService:
         ]
         rows: list[list[str]] = []
         for event in events:
+            stats = stats_by_event.get(event.id)
             rows.append(
                 [
                     _to_csv_cell(event.id),
                     _to_csv_cell(event.name),
                     _to_csv_cell(event.date.isoformat()),
-                    _to_csv_cell(_normalize_event_time_for_output(event.time)),
+                    _to_csv_cell(parse_event_time(event.time).display),
                     _to_csv_cell(event.type),
                     _to_csv_cell(event.place),
                     _to_csv_cell(event.location),
-                    _to_csv_cell(registered_counter.get(event.id, 0)),
-                    _to_csv_cell(cancelled_counter.get(event.id, 0)),
+                    _to_csv_cell(stats.registered_count if stats else 0),
+                    _to_csv_cell(stats.cancelled_count if stats else 0),
                     _to_csv_cell(event.spots),
                 ]
             )
@@ -675,8 +877,7 @@ class AdminService:
         return headers, rows
 
     def registrations_report(self) -> tuple[list[str], list[list[str]]]:
-        events_by_id = {event.id: event for event in self.store.list_events()}
-        registrations = self.store.list_registrations()
+        registrations = self.store.list_registrations_with_events()
 
         headers = [
             "registration_id",
@@ -693,15 +894,14 @@ class AdminService:
             "registered_at",
         ]
         rows: list[list[str]] = []
-        for registration in registrations:
-            event = events_by_id.get(registration.event_id)
+        for registration, event in registrations:
             rows.append(
                 [
                     _to_csv_cell(registration.id),
                     _to_csv_cell(registration.event_id),
                     _to_csv_cell(event.name if event else ""),
                     _to_csv_cell(event.date.isoformat() if event else ""),
-                    _to_csv_cell(_normalize_event_time_for_output(event.time) if event else ""),
+                    _to_csv_cell(parse_event_time(event.time).display if event else ""),
                     _to_csv_cell(registration.status),
                     _to_csv_cell(registration.student_id),
                     _to_csv_cell(registration.first_name),
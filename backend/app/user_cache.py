@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from .models import UserPublic
+
+DEFAULT_USER_CACHE_SIZE = 1024
+DEFAULT_USER_CACHE_TTL_SECONDS = 60.0
+
+
+def get_user_cache_size() -> int:
+    raw_size = os.getenv("APP_USER_CACHE_SIZE", "").strip()
+    try:
+        return max(0, int(raw_size)) if raw_size else DEFAULT_USER_CACHE_SIZE
+    except ValueError:
+        return DEFAULT_USER_CACHE_SIZE
+
+
+def get_user_cache_ttl_seconds() -> float:
+    raw_ttl = os.getenv("APP_USER_CACHE_TTL_SECONDS", "").strip()
+    try:
+        return max(0.0, float(raw_ttl)) if raw_ttl else DEFAULT_USER_CACHE_TTL_SECONDS
+    except ValueError:
+        return DEFAULT_USER_CACHE_TTL_SECONDS
+
+
+class UserCache:
+    """Bounded TTL/LRU of the active users resolved for authenticated requests.
+
+    Writes in this process invalidate the user they touch; the TTL bounds how long a change made by
+    another process (or directly in the database) can go unnoticed. Lookups that fail are not cached.
+    """
+
+    def __init__(self, max_entries: int | None = None, ttl_seconds: float | None = None) -> None:
+        self.max_entries = get_user_cache_size() if max_entries is None else max_entries
+        self.ttl_seconds = get_user_cache_ttl_seconds() if ttl_seconds is None else ttl_seconds
+        self._lock = Lock()
+        self._entries: OrderedDict[str, tuple[UserPublic, float]] = OrderedDict()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._expirations = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, user_id: str) -> UserPublic | None:
+        with self._lock:
+            cached = self._entries.get(user_id)
+            if cached is not None and time.monotonic() >= cached[1]:
+                del self._entries[user_id]
+                self._expirations += 1
+                cached = None
+            if cached is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self._hits += 1
+            return cached[0]
+
+    def put(self, user: UserPublic, generation: int) -> None:
+        # A user written after the caller read it bumped the generation; the stale copy is dropped.
+        with self._lock:
+            if generation != self._generation or self.max_entries <= 0 or self.ttl_seconds <= 0:
+                return
+            self._entries[user.id] = (user, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(user.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, user_id: str) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(user_id, None)
+            self._invalidations += 1
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                "expirations": self._expirations,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
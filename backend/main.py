@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -11,6 +12,8 @@ from fastapi.staticfiles import StaticFiles
 # Load backend/.env before importing modules that read environment variables.
 load_dotenv(Path(__file__).resolve().parent / ".env")
 
+from app.dependencies import close_store
+from app.executors import shutdown_executors
 from app.routers import (
     admin_router,
     auth_router,
@@ -25,6 +28,14 @@ def _get_cors_origins() -> list[str]:
     return [origin.strip() for origin in raw_origins.split(",") if origin.strip()]
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    yield
+    # Drain in-flight store work first, then release pooled SQLite connections instead of waiting for GC.
+    shutdown_executors()
+    close_store()
+
+
 def create_app() -> FastAPI:
     app = FastAPI(
         title="UNIMEX API",
@@ -33,6 +44,7 @@ def create_app() -> FastAPI:
             "Backend base para autenticación, catálogo de eventos y registros de alumnos. "
             "Persistencia SQLite conectada con schema SQL."
         ),
+        lifespan=lifespan,
     )
 
     app.add_middleware(
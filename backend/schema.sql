@@ -33,11 +33,15 @@ CREATE TABLE events (
     summary TEXT NOT NULL,
     is_active BOOLEAN NOT NULL DEFAULT TRUE,
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    starts_at TIMESTAMP,
+    ends_at TIMESTAMP
 );
 
 CREATE INDEX idx_events_date ON events(event_date);
 CREATE INDEX idx_events_type ON events(event_type);
+CREATE INDEX idx_events_date_time_id ON events(event_date, event_time, id);
+CREATE INDEX idx_events_ends_at ON events(ends_at);
 
 -- EVENT AGENDA
 CREATE TABLE event_agenda_items (
@@ -81,6 +85,33 @@ CREATE TABLE event_registrations (
 CREATE INDEX idx_registrations_event_id ON event_registrations(event_id);
 CREATE INDEX idx_registrations_status ON event_registrations(status);
 CREATE INDEX idx_registrations_created_at ON event_registrations(created_at);
+-- student_id is stored upper-cased; this backs /registrations/me and schedule-conflict lookups.
+CREATE INDEX idx_registrations_student_status ON event_registrations(student_id, status);
+CREATE INDEX idx_registrations_event_created ON event_registrations(event_id, created_at, id);
+
+-- EVENT REGISTRATION STATS (kept in sync by triggers on event_registrations)
+CREATE TABLE event_registration_stats (
+    event_id VARCHAR(32) PRIMARY KEY REFERENCES events(id) ON DELETE CASCADE,
+    registered_count INTEGER NOT NULL DEFAULT 0,
+    cancelled_count INTEGER NOT NULL DEFAULT 0,
+    last_registration_at TIMESTAMP
+);
+
+-- EVENT WAITLIST (FIFO by created_at, id; the head takes the seat a cancellation frees)
+CREATE TABLE event_waitlist (
+    id VARCHAR(64) PRIMARY KEY,
+    event_id VARCHAR(32) NOT NULL REFERENCES events(id) ON DELETE CASCADE,
+    first_name VARCHAR(80) NOT NULL,
+    last_name VARCHAR(80) NOT NULL,
+    student_id VARCHAR(40) NOT NULL,
+    career VARCHAR(120) NOT NULL,
+    semester SMALLINT NOT NULL CHECK (semester BETWEEN 1 AND 12),
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (event_id, student_id)
+);
+
+CREATE INDEX idx_event_waitlist_event_created ON event_waitlist(event_id, created_at, id);
+CREATE INDEX idx_event_waitlist_student_id ON event_waitlist(student_id);
 
 -- EVENT REVIEWS
 CREATE TABLE event_reviews (
@@ -99,3 +130,16 @@ CREATE TABLE event_reviews (
 CREATE INDEX idx_event_reviews_event_id ON event_reviews(event_id);
 CREATE INDEX idx_event_reviews_student_id ON event_reviews(student_id);
 CREATE INDEX idx_event_reviews_rating ON event_reviews(rating);
+CREATE INDEX idx_event_reviews_event_updated ON event_reviews(event_id, updated_at, created_at, id);
+
+-- EVENT REVIEW STATS (kept in sync by triggers on event_reviews)
+CREATE TABLE event_review_stats (
+    event_id VARCHAR(32) PRIMARY KEY REFERENCES events(id) ON DELETE CASCADE,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    rating_sum INTEGER NOT NULL DEFAULT 0,
+    rating_1 INTEGER NOT NULL DEFAULT 0,
+    rating_2 INTEGER NOT NULL DEFAULT 0,
+    rating_3 INTEGER NOT NULL DEFAULT 0,
+    rating_4 INTEGER NOT NULL DEFAULT 0,
+    rating_5 INTEGER NOT NULL DEFAULT 0
+);
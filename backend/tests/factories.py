@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from app.models import (
+    EventRecord,
+    EventReviewRecord,
+    EventType,
+    RegistrationRecord,
+    Role,
+    UserRecord,
+    WaitlistRecord,
+)
+
+CAREER = "Ingeniería en Sistemas"
+
+
+def make_student(index: int, created_at: datetime) -> UserRecord:
+    return UserRecord(
+        id=f"usr_test_{index}",
+        username=f"alumno{index}",
+        first_name="Alumno",
+        last_name=f"Prueba {index}",
+        role=Role.USER,
+        password_hash="x",
+        student_id=f"TEST{index:04d}-01",
+        career=CAREER,
+        semester=3,
+        created_at=created_at,
+    )
+
+
+def make_event(event_id: str, event_date: date, created_at: datetime, spots: int = 100) -> EventRecord:
+    return EventRecord(
+        id=event_id,
+        image="/Photos/photo1.jpg",
+        name=f"Evento de prueba {event_id}",
+        date=event_date,
+        time="10:00 a.m.-12:00 p.m.",
+        place="Aula 1",
+        location="Campus",
+        spots=spots,
+        type=EventType.ONSITE,
+        summary="Evento creado para las pruebas del backend.",
+        agenda=[],
+        requirements=[],
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+def make_registration(registration_id: str, event_id: str, student_id: str, created_at: datetime) -> RegistrationRecord:
+    return RegistrationRecord(
+        id=registration_id,
+        event_id=event_id,
+        first_name="Alumno",
+        last_name="Prueba",
+        student_id=student_id,
+        career=CAREER,
+        semester=3,
+        status="registered",
+        created_at=created_at,
+    )
+
+
+def make_waitlist_entry(entry_id: str, event_id: str, student_id: str, created_at: datetime) -> WaitlistRecord:
+    return WaitlistRecord(
+        id=entry_id,
+        event_id=event_id,
+        first_name="Alumno",
+        last_name="Prueba",
+        student_id=student_id,
+        career=CAREER,
+        semester=3,
+        created_at=created_at,
+    )
+
+
+def make_review(review_id: str, event_id: str, student_id: str, rating: int, updated_at: datetime) -> EventReviewRecord:
+    return EventReviewRecord(
+        id=review_id,
+        event_id=event_id,
+        student_id=student_id,
+        first_name="Alumno",
+        last_name="Prueba",
+        rating=rating,
+        comment="Buen evento.",
+        created_at=updated_at,
+        updated_at=updated_at,
+    )
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from app.database import initialize_database
+from app.repositories import InMemoryStore, SqliteStore
+
+from .factories import make_event, make_review
+
+REVIEWS = 25
+
+
+class ReviewPagesTest(unittest.TestCase):
+    def _stores(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        db_path = Path(tmp_dir.name) / "reviews.db"
+        initialize_database(db_path)
+        sqlite_store = SqliteStore(db_path, write_batching=False)
+        self.addCleanup(sqlite_store.close)
+        return {"memory": InMemoryStore(users=[], events=[]), "sqlite": sqlite_store}
+
+    @staticmethod
+    def _walk(store, event_id: str, limit: int) -> list[str]:
+        ids: list[str] = []
+        after = None
+        while True:
+            page = store.list_reviews(event_id=event_id, limit=limit, after=after)
+            ids.extend(review.id for review in page)
+            if len(page) < limit:
+                return ids
+            last = page[-1]
+            after = (last.updated_at, last.created_at, last.id)
+
+    def test_pages_follow_updates_newest_first(self) -> None:
+        base = datetime(2026, 3, 1, 12, 0)
+        for name, store in self._stores().items():
+            with self.subTest(store=name):
+                store.create_event(make_event("evt_rev", date(2026, 2, 1), base))
+                store.create_event(make_event("evt_other", date(2026, 2, 1), base))
+                reviews = [
+                    make_review(f"rev_{index:02d}", "evt_rev", f"REV{index:04d}-01", 4, base + timedelta(minutes=index % 7))
+                    for index in range(REVIEWS)
+                ]
+                for review in reviews:
+                    store.create_review(review)
+                store.create_review(make_review("rev_other", "evt_other", "REV0000-01", 5, base))
+                edited = reviews[3].model_copy(update={"rating": 2, "updated_at": base + timedelta(hours=1)})
+                store.update_review(edited)
+
+                expected = [
+                    review.id
+                    for review in sorted(
+                        [edited, *(review for review in reviews if review.id != edited.id)],
+                        key=lambda review: (review.updated_at, review.created_at, review.id),
+                        reverse=True,
+                    )
+                ]
+                self.assertEqual(self._walk(store, "evt_rev", limit=4), expected)
+                self.assertEqual([review.id for review in store.list_reviews(event_id="evt_rev")], expected)
+
+                store.delete_event("evt_rev")
+                self.assertEqual(store.list_reviews(event_id="evt_rev", limit=4), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
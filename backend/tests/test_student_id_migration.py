@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import unittest
+from contextlib import closing
+from datetime import date, datetime
+from pathlib import Path
+
+from app.database import initialize_database
+from app.repositories import SqliteStore
+
+from .factories import make_event, make_student
+
+
+class StudentIdMigrationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.db_path = Path(tmp_dir.name) / "legacy.db"
+        initialize_database(self.db_path)
+        store = SqliteStore(self.db_path, write_batching=False)
+        now = datetime(2026, 1, 1, 12, 0)
+        store.create_event(make_event("evt_legacy", date(2026, 5, 1), now, spots=8))
+        store.create_user(make_student(1, now))
+        store.close()
+
+        # Rows written before ids were normalized: the same student in two spellings.
+        with closing(sqlite3.connect(self.db_path)) as connection:
+            registration_sql = """
+                INSERT INTO event_registrations (
+                    id, event_id, first_name, last_name, student_id, career, semester, status, created_at, updated_at
+                )
+                VALUES (?, 'evt_legacy', 'Alumno', 'Prueba', ?, 'Sistemas', 3, ?, ?, ?)
+            """
+            connection.executemany(
+                registration_sql,
+                [
+                    ("reg_old", "abc001-01", "registered", "2026-01-02 10:00:00", "2026-01-02 10:00:00"),
+                    ("reg_new", "ABC001-01", "registered", "2026-01-03 10:00:00", "2026-01-03 10:00:00"),
+                    ("reg_cancelled", "xyz001-01", "cancelled", "2026-01-04 10:00:00", "2026-01-04 10:00:00"),
+                    ("reg_active", "XYZ001-01", "registered", "2026-01-02 10:00:00", "2026-01-02 10:00:00"),
+                ],
+            )
+            connection.executemany(
+                """
+                INSERT INTO event_reviews (
+                    id, event_id, student_id, first_name, last_name, rating, comment, created_at, updated_at
+                )
+                VALUES (?, 'evt_legacy', ?, 'Alumno', 'Prueba', ?, 'Comentario', ?, ?)
+                """,
+                [
+                    ("rev_old", "abc001-01", 2, "2026-01-05 10:00:00", "2026-01-05 10:00:00"),
+                    ("rev_new", "Abc001-01", 5, "2026-01-05 10:00:00", "2026-01-06 10:00:00"),
+                ],
+            )
+            connection.execute(
+                """
+                INSERT INTO users (
+                    id, username, first_name, last_name, role, password_hash, is_active, student_id, created_at
+                )
+                VALUES ('usr_twin', 'gemelo', 'Alumno', 'Gemelo', 'user', 'x', 1, 'test0001-01', '2026-01-01 12:00:00')
+                """
+            )
+            connection.commit()
+
+    def test_case_duplicates_are_merged_and_colliding_users_reported(self) -> None:
+        with self.assertLogs("app.database", level="WARNING") as logs:
+            initialize_database(self.db_path)
+
+        store = SqliteStore(self.db_path, write_batching=False)
+        self.addCleanup(store.close)
+        registrations = {record.id: record for record in store.list_registrations(event_id="evt_legacy")}
+        self.assertEqual(set(registrations), {"reg_new", "reg_active"})
+        self.assertEqual(registrations["reg_active"].student_id, "XYZ001-01")
+        self.assertEqual(store.find_conflicts("xyz001-01", date(2026, 5, 1), "11:00 a.m."), ["evt_legacy"])
+        # reg_old held a seat of its own; merging it away returns that seat.
+        self.assertEqual(store.get_event_by_id("evt_legacy").spots, 9)
+        stats = {stats.event_id: stats for stats in store.list_registration_stats()}["evt_legacy"]
+        self.assertEqual((stats.registered_count, stats.cancelled_count), (2, 0))
+
+        review = store.get_review_by_event_and_student("evt_legacy", "ABC001-01")
+        self.assertEqual((review.id, review.rating), ("rev_new", 5))
+        self.assertEqual(store.get_review_stats("evt_legacy").review_count, 1)
+
+        self.assertEqual(store.get_user_by_id("usr_twin").student_id, "test0001-01")
+        self.assertTrue(any("usr_twin" in message for message in logs.output))
+        self.assertTrue(any("reg_old" in message and "reg_cancelled" in message for message in logs.output))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from app.database import initialize_database
+from app.repositories import InMemoryStore, SqliteStore
+
+from .factories import make_event, make_registration, make_waitlist_entry
+
+
+class WaitlistPromotionTest(unittest.TestCase):
+    def _stores(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        db_path = Path(tmp_dir.name) / "waitlist.db"
+        initialize_database(db_path)
+        sqlite_store = SqliteStore(db_path, write_batching=False)
+        self.addCleanup(sqlite_store.close)
+        return {"memory": InMemoryStore(users=[], events=[]), "sqlite": sqlite_store}
+
+    def _full_event_with_queue(self, store, event_id: str, event_date) -> None:
+        now = datetime(2026, 1, 1, 12, 0)
+        store.create_event(make_event(event_id, event_date, now, spots=1))
+        store.reserve_seat(event_id, make_registration(f"reg_{event_id}", event_id, "SEAT0001-01", now))
+        store.join_waitlist(event_id, make_waitlist_entry(f"wtl_{event_id}", event_id, "WAIT0001-01", now))
+
+    def test_cancelling_a_past_event_does_not_promote_the_queue(self) -> None:
+        local_now = datetime(2026, 6, 10, 9, 0)
+        for name, store in self._stores().items():
+            with self.subTest(store=name):
+                self._full_event_with_queue(store, "evt_past", local_now.date() - timedelta(days=1))
+
+                store.release_seat("evt_past", "SEAT0001-01", local_now=local_now)
+
+                self.assertIsNone(store.get_registration_by_event_and_student("evt_past", "WAIT0001-01"))
+                self.assertEqual(store.get_event_by_id("evt_past").spots, 1)
+
+    def test_cancelling_an_upcoming_event_promotes_the_head_of_the_queue(self) -> None:
+        local_now = datetime(2026, 6, 10, 9, 0)
+        for name, store in self._stores().items():
+            with self.subTest(store=name):
+                self._full_event_with_queue(store, "evt_next", local_now.date() + timedelta(days=1))
+
+                store.release_seat("evt_next", "SEAT0001-01", local_now=local_now)
+
+                promoted = store.get_registration_by_event_and_student("evt_next", "WAIT0001-01")
+                self.assertEqual(promoted.status, "registered")
+                self.assertIsNone(store.get_waitlist_entry("evt_next", "WAIT0001-01"))
+                self.assertEqual(store.get_event_by_id("evt_next").spots, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+_TMP_DIR = tempfile.TemporaryDirectory()
+# app.dependencies builds its default store on import; keep it away from backend/unimex.db.
+os.environ.setdefault("APP_DB_PATH", str(Path(_TMP_DIR.name) / "default.db"))
+
+import httpx
+from fastapi import FastAPI
+
+from app import executors
+from app.database import initialize_database
+from app.dependencies import get_store
+from app.repositories import SqliteStore
+from app.routers import registrations_router
+from app.security import create_access_token
+
+from .factories import make_event, make_student
+
+STUDENTS = 8
+BATCHING_ENV = {
+    "APP_SQLITE_WRITE_BATCHING": "1",
+    "APP_SQLITE_WRITE_BATCH_SIZE": "8",
+    "APP_SQLITE_WRITE_BATCH_DELAY_MS": "100",
+    "APP_DB_WRITE_WORKERS": "2",
+}
+
+
+class WriteBatchingOverHttpTest(unittest.TestCase):
+    def test_write_pool_fills_batches_beyond_default_worker_count(self) -> None:
+        with mock.patch.dict(os.environ, BATCHING_ENV):
+            db_path = Path(_TMP_DIR.name) / "batching.db"
+            initialize_database(db_path)
+            store = SqliteStore(db_path)
+            write_executor = ThreadPoolExecutor(max_workers=executors._write_worker_count())
+        self.addCleanup(store.close)
+        self.addCleanup(write_executor.shutdown)
+        self.assertGreaterEqual(write_executor._max_workers, STUDENTS)
+
+        now = datetime(2026, 1, 1, 12, 0)
+        students = [store.create_user(make_student(index, now)) for index in range(STUDENTS)]
+        store.create_event(make_event("evt_batch", date.today() + timedelta(days=30), now))
+
+        app = FastAPI()
+        app.include_router(registrations_router)
+        app.dependency_overrides[get_store] = lambda: store
+
+        async def register_all() -> list[int]:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                responses = await asyncio.gather(
+                    *(
+                        client.post(
+                            "/api/registrations",
+                            json={"event_id": "evt_batch"},
+                            headers={"Authorization": f"Bearer {create_access_token(student.id, 'user')}"},
+                        )
+                        for student in students
+                    )
+                )
+            return [response.status_code for response in responses]
+
+        with mock.patch.object(executors, "_write_executor", write_executor):
+            statuses = asyncio.run(register_all())
+
+        self.assertEqual(statuses, [201] * STUDENTS)
+        self.assertGreater(store.stats()["write_batcher"]["largest_batch"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -58,6 +58,7 @@ export default function MyRegistrationsPage() {
     eventId: string,
     eventName: string,
     isPastEvent: boolean,
+    isWaitlisted = false,
   ) => {
     if (!accessToken) return;
     if (isPastEvent) {
@@ -72,6 +73,12 @@ export default function MyRegistrationsPage() {
     void (async () => {
       try {
         await cancelMyRegistration(accessToken, eventId);
+        if (isWaitlisted) {
+          // Leaving the waitlist keeps no record, so the card goes away like it would on reload.
+          setItems((currentItems) => currentItems.filter((item) => item.registration_id !== registrationId));
+          setSuccessMessage(`Saliste de la lista de espera de "${eventName}".`);
+          return;
+        }
         setItems((currentItems) =>
           currentItems.map((item) =>
             item.registration_id === registrationId
@@ -134,14 +141,18 @@ export default function MyRegistrationsPage() {
           {items.map((item) => {
             const isPastEvent = item.event.lifecycle === "past";
             const isRegistered = item.status === "registered";
+            const isWaitlisted = item.status === "waitlisted";
             const statusLabel = item.status === "cancelled"
               ? "Cancelado"
-              : isPastEvent
-                ? "Finalizado"
-                : "Registrado";
+              : isWaitlisted
+                ? `Lista de espera · lugar ${item.waitlist_position ?? "-"}`
+                : isPastEvent
+                  ? "Finalizado"
+                  : "Registrado";
             const statusClassName = [
               "my-events-status",
               item.status === "cancelled" ? "my-events-status-cancelled" : "",
+              isWaitlisted ? "my-events-status-waitlisted" : "",
               item.status === "registered" && isPastEvent ? "my-events-status-finished" : "",
             ].filter(Boolean).join(" ");
 
@@ -167,7 +178,10 @@ export default function MyRegistrationsPage() {
                   </div>
                   <div className="my-events-meta-item my-events-meta-item-full">
                     <Ticket size={16} />
-                    <span>Te registraste el {formatEventDate(item.registered_at)}</span>
+                    <span>
+                      {isWaitlisted ? "Entraste a la lista de espera el" : "Te registraste el"}{" "}
+                      {formatEventDate(item.registered_at)}
+                    </span>
                   </div>
                 </div>
 
@@ -179,7 +193,21 @@ export default function MyRegistrationsPage() {
                     <ArrowRight size={14} />
                   </Link>
 
-                  {isRegistered && !isPastEvent ? (
+                  {isWaitlisted && !isPastEvent ? (
+                    <button
+                      type="button"
+                      className="my-events-cancel-btn"
+                      onClick={() => handleCancelRegistration(item.registration_id, item.event_id, item.event.name, isPastEvent, true)}
+                      disabled={cancellingRegistrationId === item.registration_id}
+                    >
+                      <XCircle size={14} />
+                      {cancellingRegistrationId === item.registration_id ? "Saliendo..." : "Salir de la lista de espera"}
+                    </button>
+                  ) : isWaitlisted ? (
+                    <p className="my-events-cancel-note my-events-cancel-note-finished">
+                      Evento finalizado sin que se liberara un lugar.
+                    </p>
+                  ) : isRegistered && !isPastEvent ? (
                     <button
                       type="button"
                       className="my-events-cancel-btn"
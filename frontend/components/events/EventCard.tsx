@@ -2,7 +2,7 @@ import React from "react";
 import Image from "next/image";
 import Link from "next/link";
 import { motion } from "motion/react";
-import { ArrowRight, Clock3, MapPin } from "lucide-react";
+import { ArrowRight, Clock3, MapPin, Star } from "lucide-react";
 import { resolveEventImageSrc, type EventSummary } from "../../lib/api";
 import { formatEventDate, normalizeEventTimeLabel } from "../../lib/datetime";
 import "./event-card.css";
@@ -20,6 +20,11 @@ export default function EventCard({ event }: EventCardProps) {
         : "Disponible";
 
   const summary = event.summary?.trim() || "Evento académico diseñado para fortalecer competencias profesionales.";
+  const { count: reviewCount, average: averageRating } = event.rating_summary;
+  const ratingLabel =
+    reviewCount > 0 && averageRating !== null
+      ? `${averageRating.toFixed(1)} / 5 (${reviewCount} reseña${reviewCount === 1 ? "" : "s"})`
+      : "Sin reseñas";
 
   return (
     <motion.article className="event-card" whileHover={{ y: -6 }} transition={{ duration: 0.22, ease: "easeOut" }}>
@@ -54,6 +59,10 @@ export default function EventCard({ event }: EventCardProps) {
             <MapPin size={14} />
             <span>{event.place}</span>
           </p>
+          <p className="event-card-rating">
+            <Star size={14} fill={reviewCount > 0 ? "currentColor" : "none"} />
+            <span>{ratingLabel}</span>
+          </p>
         </div>
 
         <div className="event-card-footer">
@@ -1,10 +1,15 @@
 "use client";
 
-import { useState } from "react";
+import { useEffect, useState } from "react";
 import { useRouter } from "next/navigation";
-import { CircleCheck, LogIn, Ticket } from "lucide-react";
+import { CircleCheck, LogIn, Ticket, TriangleAlert } from "lucide-react";
 import { useAuth } from "../../context/AuthContext";
-import { parseApiError, type EventLifecycle } from "../../lib/api";
+import {
+  fetchRegistrationConflicts,
+  parseApiError,
+  type EventLifecycle,
+  type RegistrationPublic,
+} from "../../lib/api";
 
 interface EventRegistrationActionProps {
   eventId: string;
@@ -20,6 +25,28 @@ export default function EventRegistrationAction({ eventId, eventName, eventLifec
   const [submitting, setSubmitting] = useState(false);
   const [errorMessage, setErrorMessage] = useState("");
   const [successMessage, setSuccessMessage] = useState("");
+  const [hasScheduleConflict, setHasScheduleConflict] = useState(false);
+
+  useEffect(() => {
+    if (!accessToken || user?.role !== "user" || eventLifecycle === "past") {
+      setHasScheduleConflict(false);
+      return;
+    }
+    const controller = new AbortController();
+
+    const loadConflicts = async () => {
+      try {
+        const hints = await fetchRegistrationConflicts(accessToken, [eventId], controller.signal);
+        setHasScheduleConflict(hints.some((hint) => hint.conflicting_event_ids.length > 0));
+      } catch {
+        // Only a heads-up: registering still reports the conflict if this check fails.
+        if (!controller.signal.aborted) setHasScheduleConflict(false);
+      }
+    };
+
+    void loadConflicts();
+    return () => controller.abort();
+  }, [accessToken, eventId, eventLifecycle, user?.role]);
 
   const handleRegister = async () => {
     setErrorMessage("");
@@ -62,7 +89,12 @@ export default function EventRegistrationAction({ eventId, eventName, eventLifec
         throw new Error(await parseApiError(response));
       }
 
-      setSuccessMessage(`Tu registro para "${eventName}" quedó confirmado.`);
+      const registration = (await response.json()) as RegistrationPublic;
+      setSuccessMessage(
+        registration.status === "waitlisted"
+          ? `"${eventName}" está lleno: quedaste en la lista de espera y te inscribiremos automáticamente si se libera un lugar.`
+          : `Tu registro para "${eventName}" quedó confirmado.`,
+      );
     } catch (error) {
       setErrorMessage(error instanceof Error ? error.message : "No se pudo completar el registro");
     } finally {
@@ -77,6 +109,12 @@ export default function EventRegistrationAction({ eventId, eventName, eventLifec
         Para registrarte debes tener sesión activa. El sistema usará automáticamente los datos de tu cuenta.
       </p>
 
+      {hasScheduleConflict && !successMessage && (
+        <p className="event-detail-register-note">
+          <TriangleAlert size={14} />
+          Ya tienes otro evento registrado que se empalma en fecha y horario con este.
+        </p>
+      )}
       {errorMessage && <p className="event-detail-register-error">{errorMessage}</p>}
       {successMessage && <p className="event-detail-register-success">{successMessage}</p>}
 
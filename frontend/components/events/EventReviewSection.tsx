@@ -1,12 +1,14 @@
 "use client";
 
-import { useCallback, useEffect, useMemo, useState } from "react";
+import { useCallback, useEffect, useState } from "react";
 import { useRouter } from "next/navigation";
 import { MessageSquareText, Star } from "lucide-react";
 import {
   createOrUpdateEventReview,
+  fetchEventReviewSummary,
   fetchEventReviews,
   type EventLifecycle,
+  type EventRatingSummary,
   type EventReviewPublic,
 } from "../../lib/api";
 import { useAuth } from "../../context/AuthContext";
@@ -43,6 +45,7 @@ export default function EventReviewSection({ eventId, eventLifecycle }: EventRev
   const router = useRouter();
   const { accessToken, isAuthenticated, user } = useAuth();
   const [reviews, setReviews] = useState<EventReviewPublic[]>([]);
+  const [ratingSummary, setRatingSummary] = useState<EventRatingSummary | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState("");
   const [submitting, setSubmitting] = useState(false);
@@ -54,8 +57,12 @@ export default function EventReviewSection({ eventId, eventLifecycle }: EventRev
     setLoading(true);
     setError("");
     try {
-      const response = await fetchEventReviews(eventId);
+      const [response, summary] = await Promise.all([
+        fetchEventReviews(eventId),
+        fetchEventReviewSummary(eventId),
+      ]);
       setReviews(response);
+      setRatingSummary(summary);
     } catch (loadError) {
       setError(loadError instanceof Error ? loadError.message : "No se pudieron cargar las reseñas");
     } finally {
@@ -67,12 +74,6 @@ export default function EventReviewSection({ eventId, eventLifecycle }: EventRev
     void loadReviews();
   }, [loadReviews]);
 
-  const averageRating = useMemo(() => {
-    if (reviews.length === 0) return 0;
-    const total = reviews.reduce((sum, review) => sum + review.rating, 0);
-    return total / reviews.length;
-  }, [reviews]);
-
   const canReview = eventLifecycle === "past";
 
   const handleSubmitReview = async () => {
@@ -128,8 +129,8 @@ export default function EventReviewSection({ eventId, eventLifecycle }: EventRev
             Calificaciones y comentarios
           </h2>
           <p>
-            {reviews.length > 0
-              ? `${averageRating.toFixed(1)} / 5 (${reviews.length} reseña${reviews.length === 1 ? "" : "s"})`
+            {ratingSummary && ratingSummary.count > 0 && ratingSummary.average !== null
+              ? `${ratingSummary.average.toFixed(1)} / 5 (${ratingSummary.count} reseña${ratingSummary.count === 1 ? "" : "s"})`
               : "Aún no hay reseñas para este evento."}
           </p>
         </header>
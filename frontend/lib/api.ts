@@ -3,6 +3,13 @@ export type Role = "admin" | "user";
 export type EventType = "Presencial" | "En línea";
 export type EventLifecycle = "active" | "past";
 export type EventLifecycleFilter = EventLifecycle | "all";
+export type RegistrationStatus = "registered" | "cancelled" | "waitlisted";
+
+export interface EventRatingSummary {
+  count: number;
+  average: number | null;
+  histogram: Record<string, number>;
+}
 
 export interface EventSummary {
   id: string;
@@ -16,6 +23,7 @@ export interface EventSummary {
   type: EventType;
   summary: string;
   lifecycle: EventLifecycle;
+  rating_summary: EventRatingSummary;
 }
 
 export interface EventDetail extends EventSummary {
@@ -26,9 +34,15 @@ export interface EventDetail extends EventSummary {
 export interface UserEventRegistration {
   registration_id: string;
   event_id: string;
-  status: "registered" | "cancelled";
+  status: RegistrationStatus;
   registered_at: string;
   event: EventSummary;
+  waitlist_position: number | null;
+}
+
+export interface EventConflictHint {
+  event_id: string;
+  conflicting_event_ids: string[];
 }
 
 export interface RegistrationPublic {
@@ -39,7 +53,7 @@ export interface RegistrationPublic {
   student_id: string;
   career: string;
   semester: number;
-  status: "registered" | "cancelled";
+  status: RegistrationStatus;
   created_at: string;
 }
 
@@ -157,6 +171,19 @@ export async function fetchEventReviews(eventId: string, signal?: AbortSignal):
   return (await response.json()) as EventReviewPublic[];
 }
 
+export async function fetchEventReviewSummary(eventId: string, signal?: AbortSignal): Promise<EventRatingSummary> {
+  const response = await fetch(toUrl(`/api/events/${eventId}/reviews/summary`), {
+    cache: "no-store",
+    signal,
+  });
+
+  if (!response.ok) {
+    throw new Error(await parseApiError(response));
+  }
+
+  return (await response.json()) as EventRatingSummary;
+}
+
 export async function createOrUpdateEventReview(
   accessToken: string,
   eventId: string,
@@ -194,6 +221,31 @@ export async function fetchMyRegistrations(accessToken: string, signal?: AbortSi
   return (await response.json()) as UserEventRegistration[];
 }
 
+export async function fetchRegistrationConflicts(
+  accessToken: string,
+  eventIds: string[],
+  signal?: AbortSignal,
+): Promise<EventConflictHint[]> {
+  const searchParams = new URLSearchParams();
+  for (const eventId of eventIds) {
+    searchParams.append("event_id", eventId);
+  }
+
+  const response = await fetch(toUrl(`/api/registrations/me/conflicts?${searchParams.toString()}`), {
+    headers: {
+      Authorization: `Bearer ${accessToken}`,
+    },
+    cache: "no-store",
+    signal,
+  });
+
+  if (!response.ok) {
+    throw new Error(await parseApiError(response));
+  }
+
+  return (await response.json()) as EventConflictHint[];
+}
+
 export async function cancelMyRegistration(accessToken: string, eventId: string): Promise<RegistrationPublic> {
   const response = await fetch(toUrl(`/api/registrations/event/${eventId}`), {
     method: "DELETE",